@@ -0,0 +1,80 @@
+from array import array
+from bisect import bisect_left
+
+
+class BinEdges:
+    """
+    class of bins of a numeric column kept as sorted edges and a label for each bin, a value is put in its bin by a
+    binary search on edges. bin i holds values above edge i-1 and below or equal edge i, the first bin has no lower
+    edge and the last bin has no upper edge, example:
+    edges [5.5, 11.0] and labels ["value<=5.5", "5.5<value<=11.0", "value>11.0"]
+    bins can be used where a bins dict was used, keys() returns the labels in order as keys() of a bins dict
+    """
+    def __init__(self, edges=None, labels=None):
+        """"
+        Ctor for BinEdges
+        Attributes:
+            edges(list): the sorted upper edges of all bins but the last
+            labels(list): a label for each bin, one more than edges
+        Raise:
+            ValueError: if edges are not sorted or there is not a label for each bin
+        """
+        edges, labels = edges if edges is not None else [], labels if labels is not None else [""]
+        if len(labels) != len(edges) + 1:
+            raise ValueError("bins must have a label for each bin, one more label than edges")
+        if any(edges[i] > edges[i+1] for i in range(len(edges) - 1)):
+            raise ValueError("edges of bins must be sorted")
+        self.edges = array('d', edges)
+        self.labels = list(labels)
+
+    def createBinsOfSplits(self, splits):
+        """
+        method to create bins below, between and above sorted split values, labels are "value<=X", "X<value<=Y" and
+        "value>Y"
+        Attributes:
+            splits(list): the sorted split values
+        Returns:
+            BinEdges: the bins we created
+        """
+        labels = ["value<=" + str(splits[0])]
+        labels += [str(splits[i-1]) + '<value<=' + str(splits[i]) for i in range(1, len(splits))]
+        labels += ["value>" + str(splits[-1])]
+        self.__init__(splits, labels)
+        return self
+
+    def keys(self):
+        """
+        method to get the labels of bins in order, a label of more than one bin (equal edges) is returned once
+        Returns:
+            list: labels of bins
+        """
+        return list(dict.fromkeys(self.labels))
+
+    def getBin(self, number):
+        """
+        method to get the label of the bin of a number
+        Attributes:
+            number(float): the number
+        Returns:
+            string: the label of the bin of number
+        """
+        return self.labels[bisect_left(self.edges, number)]
+
+    def getBinPositions(self, numbers):
+        """
+        method to get the positions of bins of all numbers of a column in one pass
+        Attributes:
+            numbers(list): the numbers
+        Returns:
+            list: position of the bin of each number in labels, as getBin a nan is put in the first bin
+        """
+        edges = self.edges
+        return [bisect_left(edges, number) for number in numbers]
+
+    def getDict(self):
+        """
+        method to get the bins as a dict that can be written to a json file
+        Returns:
+            dict: {'edges': edges, 'labels': labels}
+        """
+        return {'edges': list(self.edges), 'labels': self.labels}
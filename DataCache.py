@@ -0,0 +1,232 @@
+from DataSet import DataSet
+from array import array
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+
+class DataCache:
+    """
+    class to save parsed data sets as binary files in a cache folder and map them back into memory. each cache file is
+    named by the path of the source csv file and the key of how it was parsed, so the same file parsed in other ways has
+    other cache files, and is checked by the size, modification time and content hash of the file. the profile of a
+    data set is saved as a json file named by the path and the key of the profile
+    """
+    MAGIC = b'SMLCACHE'
+    VERSION = 3
+    HASH_BLOCK_SIZE = 1 << 20
+    HASH_BLOCK_SPACING = 64 << 20
+
+    def __init__(self, cacheFolderPath, maxCacheSize=4 << 30):
+        """"
+        Ctor for DataCache
+        Attributes:
+            cacheFolderPath(string): the folder to save cache files in
+            maxCacheSize(int): max total size in bytes of cache files, least recently used files are removed above it
+        """
+        self.cacheFolderPath = cacheFolderPath
+        self.maxCacheSize = maxCacheSize
+
+    def getCacheFilePath(self, pathOfFile, key=None):
+        """
+        method to get the path of the cache file of a source file parsed by a key
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            key(string): extra key of how the file was parsed, for example a schema
+        Returns:
+            string: path of cache file
+        """
+        name = hashlib.sha1(json.dumps([os.path.abspath(pathOfFile), key]).encode('utf-8')).hexdigest()
+        return os.path.join(self.cacheFolderPath, name + ".cache")
+
+    def getFingerprint(self, pathOfFile, key=None):
+        """
+        method to get the fingerprint of a source file. the content hash is computed on evenly spaced blocks of the file,
+        at least three (the first, middle and last blocks) and one more for each hash block spacing of file size, so
+        checking the cache does not read the whole file. an edit between the blocks that keeps the size of file is
+        caught only by the modification time
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            key(string): extra key of how the file was parsed, for example a schema
+        Returns:
+            dict: {'path': path, 'size': size, 'mtime': mtime, 'hash': hash, 'key': key}
+        """
+        stat = os.stat(pathOfFile)
+        contentHash = hashlib.blake2b(digest_size=16)
+        numOfBlocks = max(3, stat.st_size // self.HASH_BLOCK_SPACING + 1)
+        lastOffset = max(0, stat.st_size - self.HASH_BLOCK_SIZE)
+        with open(pathOfFile, 'rb') as sourceFile:
+            for offset in sorted({lastOffset * index // (numOfBlocks - 1) for index in range(numOfBlocks)}):
+                sourceFile.seek(offset)
+                contentHash.update(sourceFile.read(self.HASH_BLOCK_SIZE))
+        return {'path': os.path.abspath(pathOfFile), 'size': stat.st_size, 'mtime': stat.st_mtime_ns,
+                'hash': contentHash.hexdigest(), 'key': key}
+
+    def load(self, pathOfFile, key=None):
+        """
+        method to map the cached data set of a source file, the mapping is copy on write so columns can be changed
+        without changing the cache file
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            key(string): extra key of how the file was parsed, for example a schema
+        Returns:
+            DataSet: the cached data set, None if there is no valid cache file
+        """
+        cacheFilePath = self.getCacheFilePath(pathOfFile, key)
+        if not os.path.isfile(cacheFilePath):
+            return None
+        with open(cacheFilePath, 'rb') as cacheFile:
+            try:
+                header = self.readHeader(cacheFile)
+            except (ValueError, UnicodeDecodeError):
+                return None
+            if header['fingerprint'] != self.getFingerprint(pathOfFile, key):
+                return None
+            buffer = mmap.mmap(cacheFile.fileno(), 0, access=mmap.ACCESS_COPY)
+        os.utime(cacheFilePath)
+        dataSet = DataSet(header['names'])
+        dataSet.numeric, dataSet.values, dataSet.fixed = header['numeric'], header['values'], header['fixed']
+        dataSet.codes = [{value: code for code, value in enumerate(values)} for values in dataSet.values]
+        dataSet.texts = [None if texts is None else dict(texts) for texts in header['texts']]
+        dataSet.rowTexts = [None if rowTexts is None else dict(rowTexts) for rowTexts in header['rowTexts']]
+        dataStart = header['dataStart']
+        columns = [memoryview(buffer)[dataStart + column[1]:dataStart + column[1] + column[2]].cast(column[0]) if column is not None
+                   else None for column in header['columns'] + header['textCodes']]
+        dataSet.columns, dataSet.textCodes = columns[:len(dataSet.names)], columns[len(dataSet.names):]
+        dataSet.buffer = buffer
+        return dataSet
+
+    def save(self, pathOfFile, dataSet, key=None):
+        """
+        method to save a data set as the cache file of a source file and remove least recently used cache files
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            dataSet(DataSet): the data set parsed from the file
+            key(string): extra key of how the file was parsed, for example a schema
+        """
+        os.makedirs(self.cacheFolderPath, exist_ok=True)
+        columns, offset = [], 0
+        for column in dataSet.columns + dataSet.textCodes:
+            size = len(column) * column.itemsize if column is not None else 0
+            columns += [[column.typecode if isinstance(column, array) else column.format, offset, size] if column is not None else None]
+            offset += size + (-size % 8)
+        header = json.dumps({'version': self.VERSION, 'fingerprint': self.getFingerprint(pathOfFile, key), 'names': dataSet.names,
+                             'numeric': dataSet.numeric, 'values': dataSet.values, 'fixed': dataSet.fixed,
+                             'columns': columns[:len(dataSet.names)],
+                             'textCodes': columns[len(dataSet.names):],
+                             'texts': [None if texts is None else list(texts.items()) for texts in dataSet.texts],
+                             'rowTexts': [None if rowTexts is None else list(rowTexts.items())
+                                          for rowTexts in dataSet.rowTexts]}).encode('utf-8')
+        cacheFilePath = self.getCacheFilePath(pathOfFile, key)
+        with open(cacheFilePath + ".tmp", 'wb') as cacheFile:
+            cacheFile.write(self.MAGIC + struct.pack('<Q', len(header)) + header)
+            dataStart = self.getDataStart(len(header))
+            for column, block in zip(dataSet.columns + dataSet.textCodes, columns):
+                if column is not None:
+                    cacheFile.write(b'\0' * (dataStart + block[1] - cacheFile.tell()))
+                    cacheFile.write(memoryview(column).cast('B'))
+        os.replace(cacheFilePath + ".tmp", cacheFilePath)
+        self.evict(cacheFilePath)
+
+    def getProfileFilePath(self, pathOfFile, key=None):
+        """
+        method to get the path of the profile file of a source file parsed and profiled by a key
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            key(string): extra key of how the file was parsed and profiled
+        Returns:
+            string: path of profile file
+        """
+        return self.getCacheFilePath(pathOfFile, key)[:-len(".cache")] + ".profile.json"
+
+    def loadProfile(self, pathOfFile, key=None):
+        """
+        method to read the cached profile of a source file
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            key(string): extra key of how the file was parsed and profiled
+        Returns:
+            dict: the cached profile as returned by Profile.getDict, None if there is no valid profile file
+        """
+        profileFilePath = self.getProfileFilePath(pathOfFile, key)
+        if not os.path.isfile(profileFilePath):
+            return None
+        try:
+            with open(profileFilePath) as profileFile:
+                cached = json.load(profileFile)
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(cached, dict) or cached.get('version') != self.VERSION or \
+                cached.get('fingerprint') != self.getFingerprint(pathOfFile, key):
+            return None
+        os.utime(profileFilePath)
+        return cached.get('profile')
+
+    def saveProfile(self, pathOfFile, profile, key=None):
+        """
+        method to save the profile of a source file as its profile file and remove least recently used cache files
+        Attributes:
+            pathOfFile(string): the path to the source csv file
+            profile(dict): the profile as returned by Profile.getDict
+            key(string): extra key of how the file was parsed and profiled
+        """
+        os.makedirs(self.cacheFolderPath, exist_ok=True)
+        profileFilePath = self.getProfileFilePath(pathOfFile, key)
+        with open(profileFilePath + ".tmp", 'w') as profileFile:
+            json.dump({'version': self.VERSION, 'fingerprint': self.getFingerprint(pathOfFile, key), 'profile': profile}, profileFile)
+        os.replace(profileFilePath + ".tmp", profileFilePath)
+        self.evict(profileFilePath)
+
+    def readHeader(self, cacheFile):
+        """
+        method to read the header of a cache file
+        Attributes:
+            cacheFile(file): binary file object of cache file
+        Returns:
+            dict: the header of cache file
+        Raise:
+            ValueError: if file is not a cache file of this version
+        """
+        start = cacheFile.read(len(self.MAGIC) + 8)
+        if len(start) != len(self.MAGIC) + 8 or not start.startswith(self.MAGIC):
+            raise ValueError
+        headerSize = struct.unpack('<Q', start[len(self.MAGIC):])[0]
+        header = json.loads(cacheFile.read(headerSize).decode('utf-8'))
+        if header.get('version') != self.VERSION:
+            raise ValueError
+        header['dataStart'] = self.getDataStart(headerSize)
+        return header
+
+    def getDataStart(self, headerSize):
+        """
+        method to get the offset of columns data in a cache file, columns data starts on an 8 bytes boundary
+        Attributes:
+            headerSize(int): size of json header in bytes
+        Returns:
+            int: offset of columns data
+        """
+        dataStart = len(self.MAGIC) + 8 + headerSize
+        return dataStart + (-dataStart % 8)
+
+    def evict(self, keepFilePath=None):
+        """
+        method to remove least recently used cache files and profile files until total size of cache is not above max
+        cache size
+        Attributes:
+            keepFilePath(string): a cache file or profile file that should not be removed
+        """
+        cacheFiles = []
+        for name in os.listdir(self.cacheFolderPath):
+            if name.endswith(".cache") or name.endswith(".profile.json"):
+                filePath = os.path.join(self.cacheFolderPath, name)
+                stat = os.stat(filePath)
+                cacheFiles += [(stat.st_mtime_ns, stat.st_size, filePath)]
+        totalSize = sum(size for _, size, _ in cacheFiles)
+        for _, size, filePath in sorted(cacheFiles):
+            if totalSize <= self.maxCacheSize:
+                break
+            if filePath != keepFilePath:
+                os.remove(filePath)
+                totalSize -= size
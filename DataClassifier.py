@@ -1,4 +1,5 @@
 from MiningCalculations import MiningCalculator
+from array import array
 import copy
 
 
@@ -29,6 +30,75 @@ class Classifier:
             rules = self.buildNaiveBayesClassifier(structure, data)
             return rules
 
+    def buildClassifierFromDataSet(self, dataSet, indices, structure, classifierType, splitType=None):
+        """
+        method to build classifier from rows of a columnar data set. ID3 and naive bayes are built from counts of codes
+        so no lines are created
+        Attributes:
+            dataSet(DataSet): the data set with categorical columns (after discretization)
+            indices(list): indices of rows to build classifier from, rows must have a class value
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            classifierType(String): the type of classifier to build
+            splitType(String): the name of split method
+        Returns:
+            list: a list with rules each element is a rule
+        """
+        if classifierType.upper() == "ID3":
+            tree = self.buildId3TreeFromDataSet(dataSet, indices, structure, None, self.calculator.getCountsSplitFunc(splitType))
+            self.postPruneTree(None, structure, tree)
+            return self.ExtractRulesFromId3Tree(tree)
+        elif classifierType.upper() == "NAIVE BAYES":
+            return self.buildNaiveBayesClassifierFromDataSet(dataSet, indices, structure)
+
+    def buildClassifierWithMissingValues(self, data, structure, classifierType, splitType=None, ruleWeights=None):
+        """
+        method to build classifier from rows with missing values without filling them. ID3 splits rows with a missing
+        value in the split column between all sub trees as fractions of rows (as in C4.5), naive bayes skips missing values
+        Attributes:
+            data(list) : list of lines in files each element is a list, rows must have a class value
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            classifierType(String): the type of classifier to build
+            splitType(String): the name of split method
+            ruleWeights(list): list to add the weight of training rows of each rule to, for classifying test rows with
+            missing values, None to not keep weights
+        Returns:
+            list: a list with rules each element is a rule
+        """
+        return self.buildClassifierFromWeightedRows([(row, 1) for row in data], structure, classifierType, splitType, ruleWeights)
+
+    def buildClassifierFromWeightedRows(self, weightedData, structure, classifierType, splitType=None, ruleWeights=None):
+        """
+        method to build classifier from weighted rows, for example identical rows collapsed by Discretization.compactData.
+        rows are counted by their weights so the rules are as of the rows they stand for, rows can have missing values
+        as in buildClassifierWithMissingValues
+        Attributes:
+            weightedData(list): (row, weight) of rows, rows must have a class value
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            classifierType(String): the type of classifier to build
+            splitType(String): the name of split method
+            ruleWeights(list): list to add the weight of training rows of each rule to, for classifying test rows with
+            missing values, None to not keep weights. rules of naive bayes have a weight of one
+        Returns:
+            list: a list with rules each element is a rule
+        """
+        if classifierType.upper() == "ID3":
+            tree = self.buildId3TreeWithMissingValues(weightedData, structure, None, self.calculator.getMissingValuesSplitFunc(splitType))
+            self.postPruneTree(None, structure, tree)
+            if ruleWeights is not None:
+                ruleWeights += self.ExtractRuleWeightsFromId3Tree(tree)
+            return self.ExtractRulesFromId3Tree(tree)
+        elif classifierType.upper() == "NAIVE BAYES":
+            rules = self.buildNaiveBayesClassifierFromWeightedRows(structure, weightedData)
+            if ruleWeights is not None:
+                ruleWeights += [1] * len(rules)
+            return rules
+
     # ID3 Classifier
 
     def buildId3Classifier(self, data, structure, mostCommonClassAttribute, splitFunc):
@@ -78,11 +148,95 @@ class Classifier:
             subsList += [Node]
         return subsList
 
+    def buildId3TreeFromDataSet(self, dataSet, indices, structure, mostCommonClassAttribute, splitFunc):
+        """
+        method to build DecisionTree by ID3 algorithm from counts of codes in a columnar data set, the split column of
+        each node is chosen from counts of (value, class value) of each column and rows are split by their indices.
+        each node keeps its majority class so it can be pruned without lines
+        Attributes:
+            dataSet(DataSet): the data set with categorical columns
+            indices(list): indices of rows at this node
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            mostCommonClassAttribute(String): the most most common class attribute in rows of parent node
+            splitFunc (function): a split method on counts
+        Returns:
+            list: a list of first sub trees of id3 algorithm example [tree1, tree2, tree3]
+        """
+        if len(indices) == 0:
+            return [DecisionTree("class", mostCommonClassAttribute)]
+        classCodes = [dataSet.codes[dataSet.classIndex][value] for value in structure['class']['values']]
+        classCounts = dataSet.countClassValues(indices)
+        classCounts = [classCounts[classCode] for classCode in classCodes]
+        mostCommonClassAttribute = self.calculator.mostCommonClassAttributeOfCounts(classCounts, structure)
+        if len(structure) - 1 == 0 or len(indices) in classCounts:
+            return [DecisionTree("class", mostCommonClassAttribute)]
+
+        countsByColumn = {}
+        for colName in list(structure.keys())[:-1]:
+            colIndex = structure[colName]['index']
+            counts, codes = dataSet.countColumnValuesByClass(colIndex, indices), dataSet.codes[colIndex]
+            countsByColumn[colName] = [[counts[codes[val]][classCode] for classCode in classCodes] if val in codes else [0] * len(classCodes)
+                                       for val in structure[colName]['values']]
+        root = splitFunc(countsByColumn, classCounts, len(indices))
+        rootIndex, subsList = structure[root]['index'], []
+        partitions = dataSet.partitionByColumn(rootIndex, indices)
+        for val, valueCounts in zip(structure[root]['values'], countsByColumn[root]):
+            newIndices = partitions[dataSet.codes[rootIndex][val]] if val in dataSet.codes[rootIndex] else array('l')
+            Node = DecisionTree(root, val, len(newIndices), max(valueCounts, default=0),
+                                self.calculator.mostCommonClassAttributeOfCounts(valueCounts, structure))
+            Node.addSubDecisionTree(self.buildId3TreeFromDataSet(dataSet, newIndices, self.createNewStructureWithoutItem(structure, root),
+                                                                 mostCommonClassAttribute, splitFunc))
+            subsList += [Node]
+        return subsList
+
+    def buildId3TreeWithMissingValues(self, weightedData, structure, mostCommonClassAttribute, splitFunc):
+        """
+        method to build DecisionTree by ID3 algorithm from rows with missing values. each row has a weight, the split
+        column is chosen from weighted counts of rows with a value in column and a row with a missing value goes to
+        each sub tree with its weight times the part of rows with the value of sub tree. each node keeps its majority
+        class so it can be pruned without lines. a node with weight of less than two rows is a leaf (as in C4.5), so
+        fractions of rows with missing values do not split down to every combination of values
+        Attributes:
+            weightedData(list): (row, weight) of rows at this node
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            mostCommonClassAttribute(String): the most most common class attribute in rows of parent node
+            splitFunc (function): a split method on counts of rows with missing values
+        Returns:
+            list: a list of first sub trees of id3 algorithm example [tree1, tree2, tree3]
+        """
+        if len(weightedData) == 0:
+            return [DecisionTree("class", mostCommonClassAttribute)]
+        classCounts, countsByColumn = self.calculator.calcCountsOfWeightedRows(weightedData, structure)
+        mostCommonClassAttribute = self.calculator.mostCommonClassAttributeOfCounts(classCounts, structure)
+        if len(structure) - 1 == 0 or sum(1 for count in classCounts if count > 0) <= 1 or sum(classCounts) < 2:
+            return [DecisionTree("class", mostCommonClassAttribute)]
+
+        root = splitFunc(countsByColumn, classCounts, sum(classCounts))
+        rootIndex, values, subsList = structure[root]['index'], structure[root]['values'], []
+        knownValues = set(values)
+        knownCounts = [sum(counts) for counts in countsByColumn[root]]
+        missingClassCounts = [count - known for count, known in zip(classCounts, self.calculator.calcKnownClassCounts(countsByColumn[root]))]
+        fractions = [known / sum(knownCounts) if sum(knownCounts) > 0 else 1 / len(values) for known in knownCounts]
+        for val, valueCounts, fraction in zip(values, countsByColumn[root], fractions):
+            newData = [(row, weight) if row[rootIndex] == val else (row, weight * fraction) for row, weight in weightedData
+                       if row[rootIndex] == val or (row[rootIndex] not in knownValues and fraction > 0)]
+            newCounts = [count + missingCount * fraction for count, missingCount in zip(valueCounts, missingClassCounts)]
+            Node = DecisionTree(root, val, sum(newCounts), max(newCounts, default=0),
+                                self.calculator.mostCommonClassAttributeOfCounts(newCounts, structure))
+            Node.addSubDecisionTree(self.buildId3TreeWithMissingValues(newData, self.createNewStructureWithoutItem(structure, root),
+                                                                       mostCommonClassAttribute, splitFunc))
+            subsList += [Node]
+        return subsList
+
     def postPruneTree(self, data, structure, treeList):
         """
         method to post pruning DecisionTree tree
         Attributes:
-            data(list) : list of lines in files each element is a list
+            data(list) : list of lines in files each element is a list, None to use the majority class kept in nodes
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
@@ -103,7 +257,7 @@ class Classifier:
                 return True
             for j in tree.SubDecisionTree:
                 indexCol = structure[tree.name]['index']
-                newData = list(filter(lambda x: x[indexCol] == tree.value, data))
+                newData = list(filter(lambda x: x[indexCol] == tree.value, data)) if data is not None else None
                 flag = prune(newData, structure, j)
                 if flag:
                     return
@@ -112,7 +266,8 @@ class Classifier:
             qV = (tree.N - tree.Nc + 0.5) / tree.N
             qT = QtNumerator/QtDenominator
             if qV <= qT:
-                tree.SubDecisionTree = [DecisionTree("class", self.calculator.mostCommonClassAttribute(newData, structure))]
+                majorityClass = self.calculator.mostCommonClassAttribute(newData, structure) if data is not None else tree.majorityClass
+                tree.SubDecisionTree = [DecisionTree("class", majorityClass)]
         for i in treeList:
             prune(data, structure, i)
 
@@ -148,6 +303,34 @@ class Classifier:
             rules(i, rule, allRules)
         return allRules
 
+    def ExtractRuleWeightsFromId3Tree(self, treeList):
+        """
+        method to get the weight of rows at the last node of each rule of a DecisionTree, in the order of rules of
+        ExtractRulesFromId3Tree. the weight of a node is the sum of weights of rules that start with its branch
+        Attributes:
+            treeList(list): a list of first sub trees of id3 algorithm example [tree1, tree2, tree3]
+        Returns:
+            list: weight of each rule
+        """
+        allWeights = []
+
+        def weights(tree, weight, allWeights):
+            """
+            recursive method to add the weight of each branch in tree to list
+            Attributes:
+                tree (DecisionTree): DecisionTree tree
+                weight (float): the weight of rows at the parent node of tree
+                allWeights (list): weights of all branches in tree
+            """
+            if tree.SubDecisionTree is None:
+                allWeights += [weight]
+                return
+            for subTree in tree.SubDecisionTree:
+                weights(subTree, tree.N, allWeights)
+        for i in treeList:
+            weights(i, i.N, allWeights)
+        return allWeights
+
     # naive Bayes classifier
 
     def buildNaiveBayesClassifier(self, structure, data):
@@ -161,8 +344,80 @@ class Classifier:
         Returns:
             list:  list of rules each element is a s string rule
         """
+        classValues = structure['class']['values']
+        classProbabilities = {classValue: self.calculator.calcProbabilityOfClassValueWithLaplaceCorrection(data, classValue, len(classValues))
+                              for classValue in classValues}
+        return self.createNaiveBayesRules(structure, self.createProbabilityDict(structure, data), classProbabilities)
+
+    def buildNaiveBayesClassifierFromDataSet(self, dataSet, indices, structure):
+        """
+        method to build rules by naive bayes classifier from counts of codes in a columnar data set, probabilities are
+        as in buildNaiveBayesClassifier of the lines of rows
+        Attributes:
+                dataSet(DataSet): the data set with categorical columns (after discretization)
+                indices(list): indices of rows to build classifier from, rows must have a class value
+                structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            list:  list of rules each element is a s string rule
+        """
+        classValues = structure['class']['values']
+        classCodes = [dataSet.codes[dataSet.classIndex][value] for value in classValues]
+        classCounts = dataSet.countClassValues(indices)
+        classProbabilities = {classValue: self.calculator.calcProbabilityOfClassValueOfCounts(classCounts[classCode], len(indices),
+                                                                                              len(classValues))
+                              for classValue, classCode in zip(classValues, classCodes)}
+        probabilityDict = {classValue: {} for classValue in classValues}
+        for column, values in structure.items():
+            if column != 'class':
+                counts, codes = dataSet.countColumnValuesByClass(values['index'], indices), dataSet.codes[values['index']]
+                valueCounts = [[counts[codes[value]][classCode] for classCode in classCodes] if value in codes else [0] * len(classCodes)
+                               for value in values['values']]
+                probabilities = self.calculator.calcProbabilitiesOfCounts(valueCounts, sum(map(sum, counts)), len(indices))
+                for value, valueProbabilities in zip(values['values'], probabilities):
+                    for classValue, probability in zip(classValues, valueProbabilities):
+                        probabilityDict[classValue][column + '=>' + value] = probability
+        return self.createNaiveBayesRules(structure, probabilityDict, classProbabilities)
+
+    def buildNaiveBayesClassifierFromWeightedRows(self, structure, weightedData):
+        """
+        method to build rules by naive bayes classifier from weighted rows, probabilities are as in
+        buildNaiveBayesClassifier of the rows that weighted rows stand for
+        Attributes:
+                structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+                weightedData(list): (row, weight) of rows
+        Returns:
+            list:  list of rules each element is a s string rule
+        """
+        classValues = structure['class']['values']
+        classCounts, numOfRows = self.calculator.calcCountsOfWeightedRows(weightedData, structure)[0], sum(weight for _, weight in weightedData)
+        classProbabilities = {classValue: self.calculator.calcProbabilityOfClassValueOfCounts(classCount, numOfRows, len(classValues))
+                              for classValue, classCount in zip(classValues, classCounts)}
+        probabilityDict = {classValue: {} for classValue in classValues}
+        for column, values in structure.items():
+            if column != 'class':
+                probabilities = self.calculator.calcProbabilitiesOfWeightedRows(weightedData, values['index'], values['values'], classValues)
+                for value in values['values']:
+                    for classValue in classValues:
+                        probabilityDict[classValue][column + '=>' + value] = probabilities[(value, classValue)]
+        return self.createNaiveBayesRules(structure, probabilityDict, classProbabilities)
+
+    def createNaiveBayesRules(self, structure, ProbabilityDict, classProbabilities):
+        """
+        method to create a naive bayes rule for each combination of column values
+        Attributes:
+                structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+                ProbabilityDict(Dict) : dictionary with Probability of value given class example {class value: {column value: probability}...}
+                classProbabilities(dict): class value : p(ci) with laplace correction
+        Returns:
+            list:  list of rules each element is a s string rule
+        """
         rules = []
-        ProbabilityDict = self.createProbabilityDict(structure, data)
         combinations = self.createColumnValuesCombination(structure)
         classValues = structure['class']['values']
         for combination in combinations:
@@ -173,24 +428,27 @@ class Classifier:
                 else:
                     rule += i.replace('=>', ' == ')
                     flag = True
-            rule += " => class" + " == " + self.classOfCombination(data, combination, ProbabilityDict, classValues)
+            rule += " => class" + " == " + self.classOfCombination(None, combination, ProbabilityDict, classValues, classProbabilities)
             rules += [rule]
         return rules
 
-    def classOfCombination(self, data, combination, ProbabilityDict, classValues):
+    def classOfCombination(self, data, combination, ProbabilityDict, classValues, classProbabilities=None):
         """
         method to find the class value of a combination
         Attributes:
+            data(list) : list of lines in files each element is a list, not used if classProbabilities are given
             combination(list): combination of column values
             ProbabilityDict(Dict) : dictionary with Probability of value given class example {class value: {column value: probability}...}
             classValues(list): values of class
+            classProbabilities(dict): class value : p(ci) with laplace correction, None to calculate them from data
         Returns:
             String:  class value of a combination
         """
         maxProbability, classOfCombination = 0, None
         for classValue in classValues:
             Probability = self.calcProbabilityOfCombinationGivenClass(combination, ProbabilityDict, classValue)
-            Probability *= self.calculator.calcProbabilityOfClassValueWithLaplaceCorrection(data, classValue, len(classValues))
+            Probability *= classProbabilities[classValue] if classProbabilities is not None else \
+                self.calculator.calcProbabilityOfClassValueWithLaplaceCorrection(data, classValue, len(classValues))
             if Probability >= maxProbability:
                 maxProbability = Probability
                 classOfCombination = classValue
@@ -279,7 +537,7 @@ class Classifier:
 
     # test classification
 
-    def classifyTest(self, testData, structure, rules):
+    def classifyTest(self, testData, structure, rules, ruleWeights=None):
         """
         method to classify test data by given classifier type
         Parameters:
@@ -288,25 +546,55 @@ class Classifier:
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
                 rules(list): list of rules
-                classifierType(String): classifier type
+                ruleWeights(list): weight of training rows of each rule of a classifier built with missing values, None
+                if rows with missing values that match no rule are not classified
         Returns:
             list: classified Data
         """
-        newTestData = copy.deepcopy(testData)
-        classIndex = structure['class']['index']
+        newTestData, rules = [row[:] for row in testData], self.convertStringRulesToLists(rules, structure)
+        classIndex, prefixWeights = structure['class']['index'], self.calcPrefixWeightsOfRules(rules, ruleWeights)
         for row in newTestData:
-            row[classIndex] = self.testAttribute(row, structure, self.convertStringRulesToLists(rules))
+            row[classIndex] = self.testAttribute(row, structure, rules, prefixWeights)
         return newTestData
 
-    def testAttribute(self, row, structure, rules):
+    def classifyTestInChunks(self, chunks, structure, rules, accuracyCounts, ruleWeights=None):
+        """
+        generator method to classify test data chunk by chunk, only one chunk of test lines is in memory at a time
+        Parameters:
+                chunks(iterable) : chunks of test lines each element is a list of lines
+                structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+                rules(list): list of rules
+                accuracyCounts(list): [number of rows, number of errors] that is updated while rows are classified
+                ruleWeights(list): weight of training rows of each rule of a classifier built with missing values, None
+                if rows with missing values that match no rule are not classified
+        Returns:
+            generator: classified lines
+        """
+        rules, classIndex = self.convertStringRulesToLists(rules, structure), structure['class']['index']
+        prefixWeights = self.calcPrefixWeightsOfRules(rules, ruleWeights)
+        for chunk in chunks:
+            for row in chunk:
+                newRow = row[:]
+                newRow[classIndex] = self.testAttribute(newRow, structure, rules, prefixWeights)
+                accuracyCounts[0] += 1
+                accuracyCounts[1] += newRow != row
+                yield newRow
+
+    def testAttribute(self, row, structure, rules, prefixWeights=None):
         """
-        method to classify a row
+        method to classify a row. with weights of rules, if no rule matches a row with missing values the row goes down
+        every branch of a column it is missing as a fraction of the training rows of the branch (as in C4.5), and the
+        class is the class with the largest sum of fractions of rules the row reaches
         Parameters:
             row(list): the row to classify
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                 columnName : {'index': index , 'values': [values]} or
                 columnName : {'index': index , 'values': ["Numeric"]
             rules(list): list of list rules
+            prefixWeights(dict): weight of training rows of each start of rules as returned by calcPrefixWeightsOfRules,
+            None to not classify rows with missing values that match no rule
         """
         for rule in rules:
             flag = True
@@ -318,18 +606,59 @@ class Classifier:
                     break
             if flag:
                 return rule[len(rule)-1].strip()
+        if prefixWeights is not None and "" in row:
+            classWeights = {}
+            for rule in rules:
+                weight = 1
+                for end in range(0, len(rule) - 2, 2):
+                    value = row[structure[rule[end]]['index']]
+                    if value == "":
+                        parentWeight = prefixWeights[tuple(rule[:end])]
+                        weight *= prefixWeights[tuple(rule[:end + 2])] / parentWeight if parentWeight > 0 else 0
+                    elif value != rule[end + 1]:
+                        weight = 0
+                        break
+                if weight > 0:
+                    classWeights[rule[-1]] = classWeights.get(rule[-1], 0) + weight
+            return max(classWeights, key=classWeights.get) if classWeights else None
+
+    def calcPrefixWeightsOfRules(self, rules, ruleWeights):
+        """
+        method to sum the weights of rules that start with the same conditions, the weight of a start of rules is the
+        weight of training rows at its node of the tree
+        Parameters:
+            rules(list): list of list rules
+            ruleWeights(list): weight of training rows of each rule, None for no weights
+        Returns:
+            dict: tuple of the start of a rule : weight, None if there are no weights
+        """
+        if ruleWeights is None:
+            return None
+        prefixWeights = {}
+        for rule, weight in zip(rules, ruleWeights):
+            for end in range(0, len(rule) - 1, 2):
+                prefixWeights[tuple(rule[:end])] = prefixWeights.get(tuple(rule[:end]), 0) + weight
+        return prefixWeights
 
-    def convertStringRulesToLists(self, rules):
+    def convertStringRulesToLists(self, rules, structure=None):
         """
-        method to convert a list with String rules to a list with list rules
+        method to convert a list with String rules to a list with list rules. with a structure values in rules are
+        replaced by the equal string objects of structure values, rows of a loaded data set share these objects so
+        comparing a row to a rule is mostly an identity check
         Parameters:
             rules(list): list of rules
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                columnName : {'index': index , 'values': [values]} or
+                columnName : {'index': index , 'values': ["Numeric"], None to keep values of rules as they are
         """
         newRules = []
+        pools = {name: {value: value for value in column['values']} for name, column in structure.items()} if structure else {}
         for rule in rules:
             rule = rule.replace(',', '==').replace('=>', '==').split('==')
             for i in range(0, len(rule)):
                 rule[i] = rule[i].strip()
+                if i % 2 == 1 and rule[i - 1] in pools:
+                    rule[i] = pools[rule[i - 1]].get(rule[i], rule[i])
             newRules += [rule]
         return newRules
 
@@ -365,7 +694,7 @@ class Classifier:
 
 
 class DecisionTree:
-    def __init__(self, name, value, N=0, Nc=0):
+    def __init__(self, name, value, N=0, Nc=0, majorityClass=None):
         """"
         Ctor for DataLoader
         Attributes:
@@ -373,12 +702,14 @@ class DecisionTree:
             value(string): the value of node
             N(int): the number of attributes in data at this node
             Nc(int): the number of attributes in data at this node with majority class value
+            majorityClass(string): the majority class value in data at this node, None if it is not kept
         """
         self.name = name
         self.value = value
         self.SubDecisionTree = None
         self.N = N
         self.Nc = Nc
+        self.majorityClass = majorityClass
 
     def addSubDecisionTree(self, node):
         """
@@ -1,8 +1,22 @@
+from DataImputer import Imputer, fillColumn
+from DataSet import MISSING
+from array import array
+from math import isnan
+from multiprocessing import Pool
+
+workerArrays = {}
+
+
 class Cleaner:
     def __init__(self):
-        pass
+        """"
+        Ctor for Cleaner
+        Attributes:
+            removedRows(dict): the rows removed by last removing of rows, reason : number of rows
+        """
+        self.removedRows = {}
 
-    def cleanTrainingSet(self, data, structure):
+    def cleanTrainingSet(self, data, structure, imputer=None):
         """
         method to clean training set as needed in postprocessing
         Attributes:
@@ -10,11 +24,18 @@ class Cleaner:
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
+            imputer(Imputer): imputer created from statistics of training set that were already calculated (for example
+            by a profile), None to fit it on training set
+        Returns:
+            Imputer: the imputer fitted on training set, used to clean test set and new data
         """
         self.removeRows(data, structure)
-        self.fillMissingValues(data, structure)
+        if imputer is None:
+            imputer = self.fitImputer(data, structure)
+        imputer.transform(data, structure)
+        return imputer
 
-    def cleanTestSet(self, data, structure):
+    def cleanTestSet(self, data, structure, imputer=None):
         """
         method to clean test set as needed in postprocessing
         Attributes:
@@ -22,42 +43,408 @@ class Cleaner:
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
+            imputer(Imputer): imputer fitted on training set, None to fill values by statistics of test set
+        """
+        if imputer is not None:
+            imputer.transform(data, structure)
+        else:
+            self.fillMissingValues(data, structure)
+
+    def fitImputer(self, data, structure, columnIndices=None):
+        """
+        method to fit an imputer on rows. a numeric value is filled by the average of column and class value or average
+        of column if there is no class value or no average for class value, a categorical value is filled by the most
+        common value of column and class value or of column if there is no class value
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            columnIndices(list): indices of columns to fit, None for all columns except class column
+        Returns:
+            Imputer: the fitted imputer
+        """
+        return self.createImputer(self.calcGroupedStatistics(data, structure, columnIndices), structure)
+
+    def fitImputerInChunks(self, chunks, structure, removeRows=False, maxValues=None):
+        """
+        method to fit an imputer on chunks of rows without keeping all rows in memory. statistics of each chunk are
+        merged into running statistics, fill values are as in fitImputer. this is for rows that are not loaded into a
+        data set, the build process creates its imputer from the profile of the columnar data set
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            removeRows(boolean): True to skip rows with no class value as in cleanTrainingSet
+            maxValues(int): max number of values counted for a categorical column and class value, None to count all
+            values. with a max only the most frequent values are kept (misra-gries) so modes of high cardinality
+            columns are approximate
+        Returns:
+            Imputer: the fitted imputer
+        """
+        classIndex, statistics, numOfRows = structure['class']['index'], self.calcGroupedStatistics([], structure), 0
+        for chunk in chunks:
+            if removeRows:
+                chunk = [row for row in chunk if row[classIndex] != ""]
+            statistics = self.mergeGroupedStatistics(statistics, self.calcGroupedStatistics(chunk, structure), numOfRows, maxValues)
+            numOfRows += len(chunk)
+        return self.createImputer(statistics, structure)
+
+    def cleanChunks(self, chunks, structure, imputer, removeRows=False):
+        """
+        generator method to clean chunks of rows by an imputer without keeping all rows in memory, this is how new data
+        is cleaned by a saved imputer
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            imputer(Imputer): the imputer to fill missing values by, fitted by fitImputerInChunks or cleanTrainingSet
+            removeRows(boolean): True to remove rows with no class value as in cleanTrainingSet
+        Returns:
+            generator: chunks of cleaned rows
+        """
+        classIndex = structure['class']['index']
+        for chunk in chunks:
+            if removeRows:
+                chunk = [row for row in chunk if row[classIndex] != ""]
+            imputer.transform(chunk, structure)
+            yield chunk
+
+    def mergeGroupedStatistics(self, statistics, other, numOfRows, maxValues=None):
+        """
+        method to merge statistics of two parts of rows, merging is associative so statistics of chunks or of shards
+        parsed by workers can be merged in any grouping as long as the order of parts is kept. statistics is changed in place
+        Attributes:
+            statistics(dict): statistics of first part as returned by calcGroupedStatistics
+            other(dict): statistics of the part of rows after first part
+            numOfRows(int): number of rows in first part, positions of values in other are moved by it
+            maxValues(int): max number of values kept for a categorical column and class value, None to keep all values
+        Returns:
+            dict: the merged statistics
+        """
+        for indexOfCol, groups in other.items():
+            for group, otherGroup in zip(statistics[indexOfCol], groups):
+                if isinstance(group, list):
+                    group[0] += otherGroup[0]
+                    group[1] += otherGroup[1]
+                else:
+                    for value, (count, position) in otherGroup.items():
+                        counts = group.get(value)
+                        group[value] = [counts[0] + count if counts is not None else count, position + numOfRows]
+            if maxValues is not None and not isinstance(statistics[indexOfCol][-1], list):
+                statistics[indexOfCol] = [self.pruneCounts(group, maxValues) for group in statistics[indexOfCol]]
+        return statistics
+
+    def pruneCounts(self, counts, maxValues):
+        """
+        method to keep the most frequent values of value counts (misra-gries summary). if there are more than maxValues
+        values the count of the value after the first maxValues is subtracted from all counts and values with no count
+        left are dropped, so every value with more than (number of rows / (maxValues + 1)) rows is kept
+        Attributes:
+            counts(dict): value : [count, position of last row with value]
+            maxValues(int): max number of values to keep
+        Returns:
+            dict: the pruned counts
+        """
+        if len(counts) <= maxValues:
+            return counts
+        minCount = sorted((count for count, _ in counts.values()), reverse=True)[maxValues]
+        return {value: [count - minCount, position] for value, (count, position) in counts.items() if count > minCount}
+
+    def createImputer(self, statistics, structure):
+        """
+        method to create an imputer from statistics of columns, fill values are as in fitImputer
+        Attributes:
+            statistics(dict): statistics of columns as returned by calcGroupedStatistics
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            Imputer: the imputer
+        """
+        fillValues = {}
+        for name, column in structure.items():
+            if column['index'] in statistics:
+                columnStatistics = statistics[column['index']]
+                if isinstance(columnStatistics[-1], list):
+                    fillValues[name] = self.getFillAverages(self.getAverages(columnStatistics))
+                else:
+                    fillValues[name] = [value if value != "" else None for value in self.getMostCommonValues(columnStatistics)]
+        return Imputer(list(structure['class']['values']), fillValues)
+
+    def getFillAverages(self, averages):
+        """
+        method to get fill values of a numeric column from its averages, a class value with no average is filled by
+        the average of column
+        Attributes:
+            averages(list): average for each class value and last for all rows, None if there are no values
+        Returns:
+            list: fill value for each class value and last for no class value
+        """
+        return [average if average is not None else averages[-1] for average in averages]
+
+    def cleanDataSet(self, dataSet, indices, structure, removeRows=True, imputer=None, processes=None):
+        """
+        method to clean rows of a columnar data set in place. averages and most common values are calculated from the
+        floats and codes of columns so no lines are created and memory used does not depend on number of rows, this is
+        how a data set kept in memory mapped files is cleaned. missing values are filled as in fillMissingValues
+        Attributes:
+            dataSet(DataSet): the data set to clean
+            indices(list): indices of rows to clean (training set or test set)
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            removeRows(boolean): True to remove rows with no class value as in cleanTrainingSet
+            imputer(Imputer): imputer fitted on training set, None to fill values by statistics of rows
+            processes(int): number of worker processes to clean columns with, None or 1 for cleaning in this process
+        Returns:
+            array: indices of cleaned rows
+        """
+        if removeRows:
+            indices = self.removeDataSetRows(dataSet, indices)
+        if imputer is None:
+            imputer = self.fitDataSetImputer(dataSet, indices, structure, processes)
+        if processes is not None and processes > 1:
+            self.fillDataSetInParallel(dataSet, indices, imputer, processes)
+        else:
+            imputer.transformDataSet(dataSet, indices)
+        return indices
+
+    def removeDataSetRows(self, dataSet, indices):
+        """
+        method to remove rows with no class value from indices of a columnar data set
+        Attributes:
+            dataSet(DataSet): the data set of rows
+            indices(list): indices of rows
+        Returns:
+            array: indices of rows with a class value, indices are returned as they are if no row is removed
+        """
+        classColumn = dataSet.columns[dataSet.classIndex]
+        if all(classColumn[index] != MISSING for index in indices):
+            self.removedRows = {"no class value": 0}
+            return indices
+        labeledIndices = array('l', (index for index in indices if classColumn[index] != MISSING))
+        self.removedRows = {"no class value": len(indices) - len(labeledIndices)}
+        return labeledIndices
+
+    def fitDataSetImputer(self, dataSet, indices, structure, processes=None):
+        """
+        method to fit an imputer on rows of a columnar data set, fill values are as in fitImputer. with worker processes
+        each column is fitted by a worker, columns are sent to workers as arrays and class column and indices are sent
+        once to each worker
+        Attributes:
+            dataSet(DataSet): the data set of rows
+            indices(list): indices of rows to fit on
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            processes(int): number of worker processes to fit columns with, None or 1 for fitting in this process
+        Returns:
+            Imputer: the fitted imputer
+        """
+        classColumn, numOfClassValues = dataSet.columns[dataSet.classIndex], len(dataSet.values[dataSet.classIndex])
+        columns = [(name, column['index'], str(column['values'][0]).upper() == "NUMERIC") for name, column in structure.items()
+                   if column != structure["class"]]
+        if processes is not None and processes > 1:
+            with Pool(processes, initializer=initWorker, initargs=(getColumnArray(classColumn), indices)) as pool:
+                statistics = pool.map(fitColumnInWorker, [(numeric, getColumnArray(dataSet.columns[indexOfCol]), numOfClassValues,
+                                                           len(dataSet.values[indexOfCol])) for _, indexOfCol, numeric in columns])
+        else:
+            statistics = [self.calcColumnAverages(dataSet.columns[indexOfCol], classColumn, numOfClassValues, indices) if numeric else
+                          self.calcColumnCommonCodes(dataSet.columns[indexOfCol], classColumn, numOfClassValues,
+                                                     len(dataSet.values[indexOfCol]), indices) for _, indexOfCol, numeric in columns]
+        fillValues = {}
+        for (name, indexOfCol, numeric), columnStatistics in zip(columns, statistics):
+            if numeric:
+                fillValues[name] = self.getFillAverages(columnStatistics)
+            else:
+                fillValues[name] = [dataSet.values[indexOfCol][code] if code is not None else None for code in columnStatistics]
+        return Imputer(list(dataSet.values[dataSet.classIndex]), fillValues)
+
+    def fillDataSetInParallel(self, dataSet, indices, imputer, processes):
+        """
+        method to fill missing values of a columnar data set by an imputer with a pool of worker processes. each column
+        is filled by a worker and the filled columns are put back into data set
+        Attributes:
+            dataSet(DataSet): the data set to fill
+            indices(list): indices of rows to fill
+            imputer(Imputer): the imputer to fill missing values by
+            processes(int): number of worker processes
+        """
+        fillCodes, fillValues = imputer.getDataSetClassCodes(dataSet), imputer.getDataSetFillValues(dataSet)
+        with Pool(processes, initializer=initWorker, initargs=(getColumnArray(dataSet.columns[dataSet.classIndex]), indices)) as pool:
+            filledColumns = pool.imap(fillColumnInWorker, [(getColumnArray(dataSet.columns[colIndex]), values, fillCodes,
+                                                            getColumnArray(dataSet.textCodes[colIndex]))
+                                                           for colIndex, values in fillValues])
+            for (colIndex, _), (filledColumn, textCodes) in zip(fillValues, filledColumns):
+                if isinstance(dataSet.columns[colIndex], array):
+                    dataSet.columns[colIndex] = filledColumn
+                else:
+                    dataSet.columns[colIndex][:] = filledColumn
+                if isinstance(dataSet.textCodes[colIndex], array):
+                    dataSet.textCodes[colIndex] = textCodes
+                elif textCodes is not None:
+                    dataSet.textCodes[colIndex][:] = textCodes
+
+    def calcColumnAverages(self, column, classColumn, numOfClassValues, indices):
+        """
+        method to get averages of a numeric column of a data set for each class value, averages are rounded as in
+        getAverages
+        Attributes:
+            column(array): the floats of column
+            classColumn(array): the codes of class column
+            numOfClassValues(int): the number of class values
+            indices(list): indices of rows
+        Returns:
+            list: average as string for each class value and last for all rows, None if there are no values
         """
-        self.fillMissingValues(data, structure)
+        sums, counts = [0] * (numOfClassValues + 1), [0] * (numOfClassValues + 1)
+        for index in indices:
+            value = column[index]
+            if not isnan(value):
+                classCode = classColumn[index]
+                if classCode != MISSING:
+                    sums[classCode] += value
+                    counts[classCode] += 1
+                sums[-1] += value
+                counts[-1] += 1
+        return self.getAverages(zip(sums, counts))
+
+    def calcColumnCommonCodes(self, column, classColumn, numOfClassValues, numOfValues, indices):
+        """
+        method to get most common values of a categorical column of a data set for each class value. between values
+        with the same count the value seen last wins
+        Attributes:
+            column(array): the codes of column
+            classColumn(array): the codes of class column
+            numOfClassValues(int): the number of class values
+            numOfValues(int): the number of values of column
+            indices(list): indices of rows
+        Returns:
+            list: code of most common value for each class value and last for all rows, None if there are no values
+        """
+        counts = [[0] * (numOfClassValues + 1) for _ in range(numOfValues)]
+        lastSeen = [[0] * (numOfClassValues + 1) for _ in range(numOfValues)]
+        for position, index in enumerate(indices):
+            code = column[index]
+            if code != MISSING:
+                classCode = classColumn[index]
+                if classCode != MISSING:
+                    counts[code][classCode] += 1
+                    lastSeen[code][classCode] = position
+                counts[code][-1] += 1
+                lastSeen[code][-1] = position
+        common = []
+        for classCode in range(numOfClassValues + 1):
+            code = max(range(numOfValues), key=lambda code: (counts[code][classCode], lastSeen[code][classCode]), default=None)
+            common += [code if code is not None and counts[code][classCode] > 0 else None]
+        return common
 
     def removeRows(self, data, structure):
         """
-        method to remove all rows with no class value
+        method to remove all rows with no class value. rows are compacted in place in one pass keeping their order
         Attributes:
             data(list) : list of lines in files each element is a list
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            dict: the removed rows, reason : number of rows
         """
-        classIndex, linesToRemove = structure['class']['index'], []
-        for line in data:
-            if line[classIndex] == "":
-                linesToRemove += [line]
-        for line in linesToRemove:
-            data.remove(line)
+        classIndex, position = structure['class']['index'], 0
+        while position < len(data) and data[position][classIndex] != "":
+            position += 1
+        numOfRows = position
+        for position in range(position + 1, len(data)):
+            if data[position][classIndex] != "":
+                data[numOfRows] = data[position]
+                numOfRows += 1
+        self.removedRows = {"no class value": len(data) - numOfRows}
+        del data[numOfRows:]
+        return self.removedRows
 
     def fillMissingValues(self, data, structure):
         """
-        method to fill all types of missing values in data set rows
+        method to fill all types of missing values in data set rows. statistics of all columns are calculated in one
+        pass over rows and missing values are filled in a second pass
         Attributes:
             data(list) : list of lines in files each element is a list
             structure(dict): the structure of data set returns {} if data set is empty, each element is
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
         """
+        self.fitImputer(data, structure).transform(data, structure)
+
+    def calcGroupedStatistics(self, data, structure, columnIndices=None):
+        """
+        method to calculate statistics of columns grouped by class value in one pass over rows, missing values are skipped
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            columnIndices(list): indices of columns to calculate statistics of, None for all columns except class column
+        Returns:
+            dict: columnIndex : statistics of column for each class value in the order of class values in structure and
+            last for all rows. statistics of a numeric column are [sum, count], statistics of a categorical column are a
+            dict value : [count, position of last row with value]
+        """
+        classIndex = structure['class']['index']
+        classCodes = {value: code for code, value in enumerate(structure['class']['values'])}
+        numericColumns, categoricalColumns, statistics = [], [], {}
         for column in structure.values():
-            if column == structure["class"]:
-                pass
-            else:
+            if column != structure["class"] and (columnIndices is None or column['index'] in columnIndices):
                 if str(column['values'][0]).upper() == "NUMERIC":
-                    self.fillNumericValuesInColumn(data, structure, column['index'])
+                    numericColumns += [column['index']]
+                    statistics[column['index']] = [[0, 0] for _ in range(len(classCodes) + 1)]
                 else:
-                    self.fillCategorialValuesInColumn(data, structure, column['index'])
+                    categoricalColumns += [column['index']]
+                    statistics[column['index']] = [{} for _ in range(len(classCodes) + 1)]
+        for position, row in enumerate(data):
+            classCode = classCodes.get(row[classIndex])
+            for indexOfCol in numericColumns:
+                if row[indexOfCol] != "":
+                    value, groups = float(row[indexOfCol]), statistics[indexOfCol]
+                    if classCode is not None:
+                        groups[classCode][0] += value
+                        groups[classCode][1] += 1
+                    groups[-1][0] += value
+                    groups[-1][1] += 1
+            for indexOfCol in categoricalColumns:
+                value = row[indexOfCol]
+                if value != "":
+                    groups = statistics[indexOfCol]
+                    for group in (groups[classCode], groups[-1]) if classCode is not None else (groups[-1],):
+                        counts = group.get(value)
+                        if counts is None:
+                            group[value] = [1, position]
+                        else:
+                            counts[0] += 1
+                            counts[1] = position
+        return statistics
+
+    def getAverages(self, statistics):
+        """
+        method to get averages from numeric statistics of a column, averages are rounded to 2 digits
+        Attributes:
+            statistics(list): [sum, count] of column for each class value and last for all rows
+        Returns:
+            list: average as string for each class value and last for all rows, None if there are no values
+        """
+        return [str(round(float(total) / count, 2)) if count > 0 else None for total, count in statistics]
+
+    def getMostCommonValues(self, statistics):
+        """
+        method to get most common values from categorical statistics of a column. between values with the same count
+        the value seen last wins
+        Attributes:
+            statistics(list): dict value : [count, position of last row with value] for each class value and last for all rows
+        Returns:
+            list: most common value for each class value and last for all rows, "" if there are no values
+        """
+        return [max(counts, key=counts.get) if counts else "" for counts in statistics]
 
     def fillNumericValuesInColumn(self, data, structure, indexOfCol):
         """
@@ -70,18 +457,7 @@ class Cleaner:
                             columnName : {'index': index , 'values': ["Numeric"]
             indexOfCol(int): the index of column we want to fill data
         """
-        averages = self.AverageListByClass(data, structure, indexOfCol)
-        newData = list(map(lambda x: float(x[indexOfCol]), filter(lambda y: y[indexOfCol] != "", data)))
-        totalAverage = float(sum(newData)) / len(newData)
-        totalAverage = str(round(totalAverage, 2))
-        classIndex = structure['class']['index']
-        for row in data:
-            if row[indexOfCol] == "":
-                if not row[classIndex]:
-                    row[indexOfCol] = totalAverage
-                else:
-                    row[indexOfCol] = averages[(structure['class']['values']).index(row[classIndex])]
-                    row[indexOfCol] = totalAverage if row[indexOfCol] is None else row[indexOfCol]
+        self.fitImputer(data, structure, [indexOfCol]).transform(data, structure)
 
     def AverageListByClass(self, data, structure, indexOfCol):
         """
@@ -98,17 +474,7 @@ class Cleaner:
             values = [no,yes]
             averages = [10,20]
         """
-        averages = []
-        for value in structure['class']['values']:
-            newData = list(filter(lambda x: x[structure['class']['index']] == value, data))
-            columnData = list(map(lambda z: float(z), filter(lambda y: y != "", map(lambda x: x[indexOfCol], newData))))
-            if len(columnData) > 0:
-                average = float(sum(columnData)) / len(columnData)
-                average = str(round(average, 2))
-            else:
-                average = None
-            averages += [average]
-        return averages
+        return self.getAverages(self.calcGroupedStatistics(data, structure, [indexOfCol])[indexOfCol])[:-1]
 
     def fillCategorialValuesInColumn(self, data, structure, indexOfCol):
         """
@@ -120,15 +486,7 @@ class Cleaner:
                             columnName : {'index': index , 'values': ["Numeric"]
             indexOfCol(int): the index of column we want to fill data
         """
-        commonList = self.commonValuesByClass(data, structure, indexOfCol)
-        mostCommon = self.mostFrequentElement(list(map(lambda x: x[indexOfCol], filter(lambda y: y[indexOfCol] != "", data))))
-        classIndex = structure['class']['index']
-        for row in data:
-            if row[indexOfCol] == "":
-                if row[classIndex] == "":
-                    row[indexOfCol] = mostCommon
-                else:
-                    row[indexOfCol] = commonList[(structure['class']['values']).index(row[classIndex])]
+        self.fitImputer(data, structure, [indexOfCol]).transform(data, structure)
 
     def commonValuesByClass(self, data, structure, indexOfCol):
         """
@@ -145,27 +503,71 @@ class Cleaner:
             values = [no,yes]
             averages = [rich,poor]
         """
-        common = []
-        for value in structure['class']['values']:
-            newData = list(filter(lambda x: x[structure['class']['index']] == value, data))
-            columnData = list(filter(lambda y: y != "", map(lambda x: x[indexOfCol], newData)))
-            common += [self.mostFrequentElement(columnData)]
-        return common
+        return self.getMostCommonValues(self.calcGroupedStatistics(data, structure, [indexOfCol])[indexOfCol])[:-1]
 
     def mostFrequentElement(self, data):
         """
-        method to get the most common value in a list
+        method to get the most common value in a list, between values with the same count the value seen last wins
         Attributes:
-            data(list) : list of lines in files each element is a list
+            data(list) : list of values
         Returns:
             String: the most common value in a list
         """
-        newData, mostFrequent, maxCount = [], "", 0
-        for row in data:
-            if newData.count(row) == 0:
-                newData += row
-                count = data.count(row)
-                if count >= maxCount:
-                    mostFrequent = row
-                    maxCount = count
-        return mostFrequent
+        counts = {}
+        for position, value in enumerate(data):
+            counts[value] = [counts[value][0] + 1 if value in counts else 1, position]
+        return max(counts, key=counts.get) if counts else ""
+
+
+def getColumnArray(column):
+    """
+    function to get a column of a data set as an array that can be sent to a worker process, a column mapped from a
+    file is copied into an array
+    Attributes:
+        column(array or memoryview): the column, None for no column
+    Returns:
+        array: the column as array, None for no column
+    """
+    if column is None or isinstance(column, array):
+        return column
+    columnArray = array(column.format)
+    columnArray.frombytes(column.cast('B'))
+    return columnArray
+
+
+def initWorker(classColumn, indices):
+    """
+    function to keep the class column and indices of rows in a worker process, they are sent once to each worker
+    instead of with each column
+    Attributes:
+        classColumn(array): the codes of class column
+        indices(list): indices of rows
+    """
+    workerArrays['classColumn'], workerArrays['indices'] = classColumn, indices
+
+
+def fitColumnInWorker(arguments):
+    """
+    function to get the averages or most common codes of a column in a worker process
+    Attributes:
+        arguments(tuple): (numeric, column, numOfClassValues, numOfValues)
+    Returns:
+        list: averages or codes of most common values for each class value and last for all rows
+    """
+    numeric, column, numOfClassValues, numOfValues = arguments
+    if numeric:
+        return Cleaner().calcColumnAverages(column, workerArrays['classColumn'], numOfClassValues, workerArrays['indices'])
+    return Cleaner().calcColumnCommonCodes(column, workerArrays['classColumn'], numOfClassValues, numOfValues, workerArrays['indices'])
+
+
+def fillColumnInWorker(arguments):
+    """
+    function to fill missing values of a column in a worker process
+    Attributes:
+        arguments(tuple): (column, fillValues, fillCodes, textCodes)
+    Returns:
+        tuple: (column, textCodes) the filled column and its codes of texts
+    """
+    column, fillValues, fillCodes, textCodes = arguments
+    fillColumn(column, workerArrays['classColumn'], workerArrays['indices'], fillValues, fillCodes, textCodes)
+    return column, textCodes
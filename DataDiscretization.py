@@ -1,4 +1,9 @@
+from DataSet import MISSING
 from MiningCalculations import MiningCalculator
+from array import array
+from DataBins import BinEdges
+from DataDiscretizer import Discretizer
+from math import inf, isnan, nan
 
 
 class Discretization:
@@ -8,9 +13,10 @@ class Discretization:
         """
         self.miningCalculator = MiningCalculator()
 
-    def discretizationData(self, trainData, testData, structure, numOfBins, typeOfDiscretization):
+    def discretizationData(self, trainData, testData, structure, numOfBins, typeOfDiscretization, columnRanges=None):
         """
-        method to apply discretization on each numeric column in data
+        method to apply discretization on each numeric column in data, rows of training set keep their order. bins of a
+        column are created from its values sorted by positions of rows, instead of sorting rows by each column
         Attributes:
             trainData(list) : list of lines in test data set each element is a list
             testData(list) : list of lines in test data set each element is a list
@@ -19,108 +25,231 @@ class Discretization:
                             columnName : {'index': index , 'values': ["Numeric"]
             numOfBins(int): number of bins for discretization
             typeOfDiscretization(string): what method of discretization if input does not fit a method entropy based discretization
-            will be applied
+            will be applied. missing values are not used to create bins and stay missing
+            columnRanges(dict): columnName : (min, max) of training rows already known (for example from a profile), used
+            by equal width discretization instead of going over values, None to find them from rows
+        Returns:
+            Discretizer: the bins of numeric columns, to apply to new data without creating bins again
         """
+        discretizer = Discretizer()
         for columnName, value in structure.items():
             if value["values"] == ['Numeric']:
                 colIndex = value['index']
-                bins = []
-                self.sortDataByAscendingOrderOFValuesInColumn(trainData, colIndex)
-                if typeOfDiscretization.upper() == "EQUAL WIDTH":
-                    bins = self.createBinsByEqualWidth(trainData, colIndex, numOfBins)
-                elif typeOfDiscretization.upper() == "EQUAL DEPTH":
-                    bins = self.createBinsByEqualDepth(trainData, colIndex, numOfBins)
-                elif typeOfDiscretization.upper() == "GINI INDEX":
-                    bins = self.createBinsByGiniIndex(trainData, structure, colIndex, numOfBins)
-                elif typeOfDiscretization.upper() == "ENTROPY":
-                    bins = self.createBinsByEntropy(trainData, structure, columnName, numOfBins)
-                else:
-                    bins = self.createBinsByEntropy(trainData, structure, columnName, numOfBins)
-                self.discretizationOFDataByColumn(trainData, colIndex, bins)
+                order, values = self.argsortDataByValuesInColumn(trainData, colIndex)
+                bins = self.createBins([trainData[position] for position in order], structure, columnName, numOfBins, typeOfDiscretization,
+                                       (columnRanges or {}).get(columnName), array('d', [values[position] for position in order]))
+                self.discretizationOFDataByColumn(trainData, colIndex, bins, values)
                 self.discretizationOFDataByColumn(testData, colIndex, bins)
                 structure[columnName]['values'] = list(bins.keys())
+                discretizer.bins[columnName] = bins
+        return discretizer
 
-    def discretizationOFDataByColumn(self, data, colIndex, bins):
+    def compactData(self, data):
         """
-        method to apply discretization on column in data
+        method to collapse identical rows of discretized data into one row with the number of its copies as weight, so
+        a classifier counts each distinct row once. rows are kept in the order of their first copy
         Attributes:
             data(list) : list of lines in data set each element is a list
-            colIndex(int): the index of column to apply discretization
-            bins(dict): a dict with string representations of the bin and its value is a function to check if value belongs to bin
-            example - {"value<X" : lambda x: x<x...}
+        Returns:
+            list: (row, weight) of each distinct row
         """
+        weights = {}
         for row in data:
-            for bin, checkBinFunc in bins.items():
-                if checkBinFunc(float(row[colIndex])):
-                    row[colIndex] = bin
-                    break
+            key = tuple(row)
+            weights[key] = weights.get(key, 0) + 1
+        return [(list(row), weight) for row, weight in weights.items()]
+
+    def discretizationDataSet(self, dataSet, trainIndices, structure, numOfBins, typeOfDiscretization, columnRanges=None):
+        """
+        method to apply discretization on each numeric column of a columnar data set. bins are created from the training
+        rows of one column at a time, sorted by argsort of their indices against the float array of column, as arrays of
+        values and class codes without lines of rows. the column is replaced by codes of bins (a data set kept in memory
+        mapped files writes the new column to a mapped file), so only one column of training values is in memory at a time
+        Attributes:
+            dataSet(DataSet): the data set, its numeric columns become categorical columns
+            trainIndices(list): indices of rows of training set
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            numOfBins(int): number of bins for discretization
+            typeOfDiscretization(string): what method of discretization if input does not fit a method entropy based discretization
+            will be applied
+            columnRanges(dict): columnName : (min, max) of training rows already known (for example from a profile), with
+            equal width discretization training values of these columns are not collected, None to find them from rows
+        Returns:
+            Discretizer: the bins of numeric columns, to apply to new data without creating bins again
+        """
+        positions = {value: position for position, value in enumerate(structure['class']['values'])}
+        classPositions, discretizer = [positions.get(value, -1) for value in dataSet.values[dataSet.classIndex]] + [-1], Discretizer()
+        for columnName, value in structure.items():
+            if value["values"] == ['Numeric']:
+                if typeOfDiscretization.upper() == "EQUAL WIDTH" and columnName in (columnRanges or {}):
+                    bins = self.createBinsOfRange(*columnRanges[columnName], numOfBins)
+                    self.discretizationOFDataSetColumn(dataSet, value['index'], bins)
+                    structure[columnName]['values'] = list(bins.keys())
+                    discretizer.bins[columnName] = bins
+                    continue
+                column, classColumn = dataSet.columns[value['index']], dataSet.columns[dataSet.classIndex]
+                order = array('l', sorted((index for index in trainIndices if not isnan(column[index])), key=column.__getitem__))
+                values = array('d', map(column.__getitem__, order))
+                classCodes = array('i', (classPositions[classColumn[index]] for index in order))
+                del order
+                columnStructure = {columnName: {'index': 0, 'values': ['Numeric']},
+                                   'class': {'index': 1, 'values': structure['class']['values']}}
+                bins = self.createBins(None, columnStructure, columnName, numOfBins, typeOfDiscretization, values=values,
+                                       classCodes=classCodes)
+                del values, classCodes
+                self.discretizationOFDataSetColumn(dataSet, value['index'], bins)
+                structure[columnName]['values'] = list(bins.keys())
+                discretizer.bins[columnName] = bins
+        return discretizer
+
+    def discretizationOFDataSetColumn(self, dataSet, colIndex, bins):
+        """
+        method to replace a numeric column of a data set by codes of its bins, missing values stay missing
+        Attributes:
+            dataSet(DataSet): the data set
+            colIndex(int): the index of a numeric column
+            bins(BinEdges): the bins of column
+        """
+        values, numbers, textCodes = list(bins.keys()), dataSet.columns[colIndex], dataSet.textCodes[colIndex]
+        codes = [values.index(label) for label in bins.labels]
+        column = dataSet.mapColumn(colIndex, 'i', lambda start, stop: [
+            codes[position] if textCode != MISSING else MISSING
+            for position, textCode in zip(bins.getBinPositions(numbers[start:stop]), textCodes[start:stop])])
+        dataSet.setCategoricalColumn(colIndex, column, values)
+
+    def createBins(self, trainData, structure, columnName, numOfBins, typeOfDiscretization, columnRange=None, values=None, classCodes=None):
+        """
+        method to create bins of a numeric column by a discretization method
+        Attributes:
+            trainData(list) : list of lines in training data set sorted by the column each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            columnName(string): the name of column to create bins from
+            numOfBins(int): number of bins for discretization
+            typeOfDiscretization(string): what method of discretization if input does not fit a method entropy based discretization
+            will be applied
+            columnRange(tuple): (min, max) of column if it is already known, None to find it from rows
+            values(list): floats of column for each row of trainData parsed once, None to parse them from rows
+            classCodes(array): position of class value in structure of each row of trainData, -1 for a missing class value,
+            None to find them from rows. with values and class codes no rows are needed and trainData can be None
+        Returns:
+            BinEdges: the bins of column
+        """
+        colIndex = structure[columnName]['index']
+        if typeOfDiscretization.upper() == "EQUAL WIDTH":
+            if columnRange is not None:
+                return self.createBinsOfRange(*columnRange, numOfBins)
+            return self.createBinsByEqualWidth(trainData, colIndex, numOfBins, values)
+        elif typeOfDiscretization.upper() == "EQUAL DEPTH":
+            return self.createBinsByEqualDepth(trainData, colIndex, numOfBins, values)
+        elif typeOfDiscretization.upper() == "GINI INDEX":
+            return self.createBinsByGiniIndex(trainData, structure, colIndex, numOfBins, values, classCodes)
+        return self.createBinsByEntropy(trainData, structure, columnName, numOfBins, values, classCodes)
+
+    def discretizationOFDataByColumn(self, data, colIndex, bins, values=None):
+        """
+        method to apply discretization on column in data, missing values stay missing. each value is parsed once and
+        not for each bin it is checked against
+        Attributes:
+            data(list) : list of lines in data set each element is a list
+            colIndex(int): the index of column to apply discretization
+            bins(BinEdges): the bins of column
+            values(list): floats of column for the first rows of data parsed once, None to parse them from data
+        """
+        values = values if values is not None else []
+        for position, row in enumerate(data):
+            if row[colIndex] != "":
+                row[colIndex] = bins.getBin(values[position] if position < len(values) else float(row[colIndex]))
 
     def sortDataByAscendingOrderOFValuesInColumn(self, data, colIndex):
         """
-        method to sort data by ascending values in column
+        method to sort data by ascending values in column, rows with a missing value are last. values are parsed once
+        and returned so later stages do not parse them again
         Attributes:
             data(list) : list of lines in data set each element is a list
             colIndex(int): the index of column to apply discretization
+        Returns:
+            array: floats of column for each row of sorted data, inf for a missing value
+        """
+        keys = [float(row[colIndex]) if row[colIndex] != "" else inf for row in data]
+        order = sorted(range(len(data)), key=keys.__getitem__)
+        data[:] = [data[position] for position in order]
+        return array('d', [keys[position] for position in order])
+
+    def argsortDataByValuesInColumn(self, data, colIndex):
         """
-        def sortFunc(x):
-            return float(x[colIndex])
-        data.sort(key=sortFunc)
+        method to find the order of rows by ascending values in column without moving rows, each value is parsed once
+        Attributes:
+            data(list) : list of lines in data set each element is a list
+            colIndex(int): the index of column to sort by
+        Returns:
+            tuple: (positions of rows with a value in ascending order of values, rows with equal values in order of data,
+            array of floats of column for each row of data, nan for a missing value)
+        """
+        values = array('d', [float(row[colIndex]) if row[colIndex] != "" else nan for row in data])
+        return sorted((position for position, row in enumerate(data) if row[colIndex] != ""), key=values.__getitem__), values
 
-    def createBinsByEqualWidth(self, data, colIndex, numOfBins):
+    def createBinsByEqualWidth(self, data, colIndex, numOfBins, values=None):
         """
-        method to create a bins dict by Equal Width technique each key is a string representations of the bin and its value is a function
-        to check if some value belongs to the bin example {"value<X" : lambda x: x<x...}
+        method to create bins by Equal Width technique
         Attributes:
             data(list) : list of lines in data set each element is a list
             colIndex(int): the index of column to create bins from
             numOfBins(int): number of bins to create
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+        Returns:
+            BinEdges: bins by Equal Width technique example ["value<=X", "X<value<=Y", "value>Y"]
+        """
+        colData = values if values is not None else list(map(lambda x: float(x[colIndex]), data))
+        return self.createBinsOfRange(min(colData), max(colData), numOfBins)
+
+    def createBinsOfRange(self, minVal, maxVal, numOfBins):
+        """
+        method to create bins by Equal Width technique from min and max of column
+        Attributes:
+            minVal(float): min value of column
+            maxVal(float): max value of column
+            numOfBins(int): number of bins to create
         Returns:
-            dict: bins dict by Equal Width technique each key is a string representations of the bin and its value is a function to check
-            if some value belongs to the bin example {"value<X" : lambda x: x<x...}
-            Attributes:
+            BinEdges: bins by Equal Width technique, each width doubles the width before it example
+            ["value<=X", "X<value<=2X", "value>2X"]
         """
-        colData = list(map(lambda x: float(x[colIndex]), data))
-        minVal, maxVal = min(colData), max(colData)
         width = round(((maxVal - minVal) / numOfBins), 3)
-        bins = {"value<="+str(width): lambda x: x <= width}
+        edges = [width]
         for i in range(1, numOfBins-1):
-            bins[str(width) + '<value<=' + str(width+width)] = (lambda x:  width < x <= width + width)
             width = width + width
-        bins["value>" + str(width)] = (lambda x: x > width)
-        return bins
+            edges.append(width)
+        return BinEdges().createBinsOfSplits(edges)
 
-    def createBinsByEqualDepth(self, data, colIndex, numOfBins):
+    def createBinsByEqualDepth(self, data, colIndex, numOfBins, values=None):
         """
-        method to create a bins dict by Equal Depth technique each key is a string representations of the bin and its value is a function
-        to check if some value belongs to the bin example {"value<X" : lambda x: x<x...}
+        method to create bins by Equal Depth technique
         Attributes:
             data(list) : list of lines in data set each element is a list
             colIndex(int): the index of column to create bins from
             numOfBins(int): number of bins to create
+            values(list): floats of column for each row of data parsed once, None to parse them from data
         Returns:
-            dict: bins dict by Equal Depth technique each key is a string representations of the bin and its value is a function to check
-            if some value belongs to the bin example {"value<X" : lambda x: x<x...}
-            Attributes:
+            BinEdges: bins by Equal Depth technique example ["value<=X", "X<value<=Y", "value>Y"]
         """
-        colData = list(map(lambda x: float(x[colIndex]), data))
+        colData = list(values) if values is not None else list(map(lambda x: float(x[colIndex]), data))
         Depth, splittedData, index = int(((len(colData) / numOfBins) + 1)), [], 0
         for i in range(0, numOfBins):
             splittedData, index, Depth = splittedData + [colData[index:Depth]], Depth, Depth + Depth
-        bins = {"value<=" + str(max(splittedData[0])): lambda x: x <= max(splittedData[0])}
+        edges = [max(splittedData[0])]
         index = 1
         while index < numOfBins-1:
             if max(splittedData[index-1]) != max(splittedData[index]):
-                val1 = max(splittedData[index-1])
-                val2 = max(splittedData[index])
-                bins[str(val1) + '<value<=' + str(val2)] = (lambda x: val1 < x <= val2)
+                edges.append(max(splittedData[index]))
             index += 1
-        bins["value>" + str(max(splittedData[index-1]))] = (lambda x: x > max(splittedData[index-1]))
-        return bins
+        return BinEdges().createBinsOfSplits(edges)
 
-    def createBinsByEntropy(self, data, structure, colName, numOfBins):
+    def createBinsByEntropy(self, data, structure, colName, numOfBins, values=None, classCodes=None):
         """
-        method to create a bins dict by Entropy technique each key is a string representations of the bin and its value is a function
-        to check if some value belongs to the bin example {"value<X" : lambda x: x<x...}
+        method to create bins by Entropy technique
         Attributes:
             data(list) : list of lines in data set each element is a list
             structure(dict): the structure of data set returns {} if data set is empty, each element is
@@ -128,42 +257,27 @@ class Discretization:
                             columnName : {'index': index , 'values': ["Numeric"]
             colName(int): the name of column to create bins from
             numOfBins(int): number of bins to create
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, None to find them from data
         Returns:
-            dict: bins dict by Entropy technique each key is a string representations of the bin and its value is a function to check
-            if some value belongs to the bin example {"value<X" : lambda x: x<x...}
-            Attributes:
+            BinEdges: bins by Entropy technique example ["value<=X", "X<value<=Y", "value>Y"]
         """
-        splits = self.miningCalculator.getBestSplitsInDataByInfoGain(data, structure, colName, numOfBins-1)
+        splits = self.miningCalculator.getBestSplitsInDataByInfoGain(data, structure, colName, numOfBins-1, values, classCodes)
         splits.sort()
-        bins = {"value<="+str(splits[0]): lambda x: x <= splits[0]}
-        if len(splits) > 1:
-            for i in range(1, numOfBins-1):
-                bins[str(splits[i-1]) + '<value<=' + str(splits[i])] = (lambda x:  splits[i-1] < x <= splits[i])
-        bins["value>" + str(splits[len(splits)-1])] = (lambda x: x > splits[len(splits)-1])
-        return bins
+        return BinEdges().createBinsOfSplits(splits)
 
-    def createBinsByGiniIndex(self, data, structure, colIndex, numOfBins):
+    def createBinsByGiniIndex(self, data, structure, colIndex, numOfBins, values=None, classCodes=None):
         """
-        method to create a bins dict by Gini Index technique each key is a string representations of the bin and its value is a function
-        to check if some value belongs to the bin example {"value<X" : lambda x: x<x...}
+        method to create bins by Gini Index technique
         Attributes:
             data(list) : list of lines in data set each element is a list
             colIndex(int): the index of column to create bins from
             numOfBins(int): number of bins to create
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, None to find them from data
         Returns:
-            dict: bins dict by Gini Index technique each key is a string representations of the bin and its value is a function to check
-            if some value belongs to the bin example {"value<X" : lambda x: x<x...}
-            Attributes:
+            BinEdges: bins by Gini Index technique example ["value<=X", "X<value<=Y", "value>Y"]
         """
-        splits = self.miningCalculator.getListWithBestValueSplitsOfDataByGini(data, structure, colIndex, numOfBins - 1)
+        splits = self.miningCalculator.getListWithBestValueSplitsOfDataByGini(data, structure, colIndex, numOfBins - 1, values, classCodes)
         splits.sort()
-        bins = {"value<=" + str(splits[0]): lambda x: x <= splits[0]}
-        if len(splits) > 1:
-            for i in range(1, numOfBins - 1):
-                bins[str(splits[i - 1]) + '<value<=' + str(splits[i])] = (lambda x: splits[i - 1] < x <= splits[i])
-        bins["value>" + str(splits[len(splits) - 1])] = (lambda x: x > splits[len(splits) - 1])
-        return bins
-
-
-
-
+        return BinEdges().createBinsOfSplits(splits)
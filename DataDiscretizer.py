@@ -0,0 +1,80 @@
+from DataBins import BinEdges
+import json
+
+
+class Discretizer:
+    """
+    class of bins of numeric columns that are created by discretization of a training set and applied to test set or
+    new data without searching for bins again. a discretizer file is a json file, example:
+    {"bins": {"age": {"edges": [20.5, 41.0], "labels": ["value<=20.5", "20.5<value<=41.0", "value>41.0"]}}}
+    a value of a column is put in the bin of its edges, missing values stay missing
+    """
+    def __init__(self, bins=None):
+        """"
+        Ctor for Discretizer
+        Attributes:
+            bins(dict): columnName : BinEdges of column
+        """
+        self.bins = bins if bins is not None else {}
+
+    def readDiscretizerFile(self, pathOfFile):
+        """
+        method to read discretizer from a json file
+        Attributes:
+            pathOfFile(string): the path to the discretizer file
+        Returns:
+            Discretizer: the discretizer we read
+        Raise:
+            EnvironmentError
+            ValueError: if discretizer file is invalid
+        """
+        with open(pathOfFile) as discretizerFile:
+            discretizer = json.load(discretizerFile)
+        if not isinstance(discretizer, dict) or not isinstance(discretizer.get('bins'), dict):
+            raise ValueError("discretizer file must have a bins dict")
+        bins = {}
+        for name, columnBins in discretizer['bins'].items():
+            if not isinstance(columnBins, dict) or not isinstance(columnBins.get('edges'), list) or \
+                    not isinstance(columnBins.get('labels'), list):
+                raise ValueError("bins of column " + name + " must have an edges list and a labels list")
+            bins[name] = BinEdges(columnBins['edges'], columnBins['labels'])
+        self.bins = bins
+        return self
+
+    def getDict(self):
+        """
+        method to get the discretizer as a dict that can be written to a json file
+        Returns:
+            dict: {'bins': {columnName: {'edges': edges, 'labels': labels}}}
+        """
+        return {'bins': {name: columnBins.getDict() for name, columnBins in self.bins.items()}}
+
+    def transform(self, data, structure):
+        """
+        method to put values of numeric columns in their bins in one pass over rows, columns of discretizer that are not
+        in structure are skipped
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Raise:
+            ValueError: if a value of a discretized column is not a number
+        """
+        columns = [(structure[name]['index'], columnBins.getBin) for name, columnBins in self.bins.items() if name in structure]
+        for row in data:
+            for indexOfCol, getBinFunc in columns:
+                if row[indexOfCol] != "":
+                    row[indexOfCol] = getBinFunc(float(row[indexOfCol]))
+
+    def transformStructure(self, structure):
+        """
+        method to set the values of discretized columns in structure to the labels of their bins
+        Attributes:
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        """
+        for name, columnBins in self.bins.items():
+            if name in structure:
+                structure[name]['values'] = columnBins.keys()
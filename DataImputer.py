@@ -0,0 +1,134 @@
+from DataSet import MISSING, NUMBER
+import json
+
+
+class Imputer:
+    """
+    class of fill values for missing values that are fitted on a training set and applied to test set or new data without
+    calculating statistics again. an imputer file is a json file, example:
+    {"classValues": ["yes", "no"], "fillValues": {"age": ["30.5", "41.0", "36.2"], "job": ["admin", null, "admin"]}}
+    each column has a fill value for each class value and last a fill value for rows with no class value or a class
+    value that is not in classValues, null for values that are left missing
+    """
+    def __init__(self, classValues=None, fillValues=None):
+        """"
+        Ctor for Imputer
+        Attributes:
+            classValues(list): the class values in the order of fill values
+            fillValues(dict): columnName : [fill value for each class value and last for no class value]
+        """
+        self.classValues = classValues if classValues is not None else []
+        self.fillValues = fillValues if fillValues is not None else {}
+
+    def readImputerFile(self, pathOfFile):
+        """
+        method to read imputer from a json file
+        Attributes:
+            pathOfFile(string): the path to the imputer file
+        Returns:
+            Imputer: the imputer we read
+        Raise:
+            EnvironmentError
+            ValueError: if imputer file is invalid
+        """
+        with open(pathOfFile) as imputerFile:
+            imputer = json.load(imputerFile)
+        if not isinstance(imputer, dict) or not isinstance(imputer.get('classValues'), list) or \
+                not isinstance(imputer.get('fillValues'), dict):
+            raise ValueError("imputer file must have a classValues list and a fillValues dict")
+        for name, values in imputer['fillValues'].items():
+            if not isinstance(values, list) or len(values) != len(imputer['classValues']) + 1:
+                raise ValueError("fill values of column " + name + " must have a value for each class value and no class value")
+        self.classValues, self.fillValues = imputer['classValues'], imputer['fillValues']
+        return self
+
+    def getDict(self):
+        """
+        method to get the imputer as a dict that can be written to a json file
+        Returns:
+            dict: {'classValues': classValues, 'fillValues': fillValues}
+        """
+        return {'classValues': self.classValues, 'fillValues': self.fillValues}
+
+    def transform(self, data, structure):
+        """
+        method to fill missing values in rows in one pass, columns of imputer that are not in structure are skipped
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        """
+        classIndex = structure['class']['index']
+        classCodes = {value: code for code, value in enumerate(self.classValues)}
+        fillValues = [(structure[name]['index'], values) for name, values in self.fillValues.items() if name in structure]
+        for row in data:
+            classCode = classCodes.get(row[classIndex], -1)
+            for indexOfCol, values in fillValues:
+                if row[indexOfCol] == "" and values[classCode] is not None:
+                    row[indexOfCol] = values[classCode]
+
+    def transformDataSet(self, dataSet, indices):
+        """
+        method to fill missing values in rows of a columnar data set in place, columns of imputer that are not in data
+        set are skipped
+        Attributes:
+            dataSet(DataSet): the data set to fill
+            indices(list): indices of rows to fill
+        """
+        fillCodes, classColumn = self.getDataSetClassCodes(dataSet), dataSet.columns[dataSet.classIndex]
+        for colIndex, values in self.getDataSetFillValues(dataSet):
+            fillColumn(dataSet.columns[colIndex], classColumn, indices, values, fillCodes, dataSet.textCodes[colIndex])
+
+    def getDataSetClassCodes(self, dataSet):
+        """
+        method to get the position of fill values for each class code of a data set
+        Attributes:
+            dataSet(DataSet): the data set to fill
+        Returns:
+            list: position in fill values for each class code, -1 for a class value that is not in classValues
+        """
+        classCodes = {value: code for code, value in enumerate(self.classValues)}
+        return [classCodes.get(value, -1) for value in dataSet.values[dataSet.classIndex]]
+
+    def getDataSetFillValues(self, dataSet):
+        """
+        method to get the fill values of columns of a data set as floats of numeric columns and codes of categorical
+        columns, fill values that are not in a categorical column are added to it
+        Attributes:
+            dataSet(DataSet): the data set to fill
+        Returns:
+            list: (column index, fill values) for each column of imputer in data set
+        """
+        fillValues = []
+        for name, values in self.fillValues.items():
+            if name in dataSet.names and name != 'class':
+                colIndex = dataSet.names.index(name)
+                if dataSet.numeric[colIndex]:
+                    values = [float(value) if value is not None else None for value in values]
+                else:
+                    values = [dataSet.addValue(colIndex, value) if value is not None else None for value in values]
+                fillValues += [(colIndex, values)]
+        return fillValues
+
+
+def fillColumn(column, classColumn, indices, fillValues, fillCodes, textCodes=None):
+    """
+    function to fill missing values of a column of a data set in place, a filled number of a numeric column is written
+    as formatNumber writes it
+    Attributes:
+        column(array): the floats or codes of column
+        classColumn(array): the codes of class column
+        indices(list): indices of rows to fill
+        fillValues(list): float or code for each class value and last for no class value, None to leave value missing
+        fillCodes(list): position in fill values for each class code
+        textCodes(array): the codes of texts of a numeric column, None for a categorical column
+    """
+    for index in indices:
+        if (textCodes[index] if textCodes is not None else column[index]) == MISSING:
+            classCode = classColumn[index]
+            value = fillValues[fillCodes[classCode]] if classCode != MISSING else fillValues[-1]
+            if value is not None:
+                column[index] = value
+                if textCodes is not None:
+                    textCodes[index] = NUMBER
@@ -1,34 +1,279 @@
+from array import array
+from multiprocessing import Pool
+from operator import itemgetter
 import csv
+import io
+import json
+import os
+from DataProfiler import Profile
+from DataSet import DataSet, MISSING
+from DataSplitter import Splitter
+from FileReader import ReadFile
 
 
 class Loader:
     """
     class to load data form csv file, create test and training sets of data for data mining process
     """
-    def __init__(self):
+    def __init__(self, splitter=None):
         """"
         Ctor for DataLoader
+        Attributes:
+            splitter(Splitter): splitter of rows to training set and test set, default is 2/3 of each class value to training set
         """
         self.testSet = []
         self.trainingSet = []
         self.structure = []
+        self.dataSet = None
+        self.trainingIndices = []
+        self.testIndices = []
+        self.createLines = True
+        self.splitter = splitter if splitter is not None else Splitter()
+        self.pathOfFile = None
+        self.cacheKey = None
+
+    def loadData(self, pathOfFile, chunkSize=10000, cache=None, processes=None, schema=None, memoryBudget=None, spillFolderPath=None,
+                 columns=None, sampler=None, createLines=True):
+        """
+        method to read data csv file and build data structure, training data set and test data set. data is saved in class parameters.
+        if a cache is given and it has a valid cache file of the csv file the data set is mapped from it instead of parsing the file,
+        failing to write a cache file does not fail loading. a cache file is valid while the size, modification time and
+        hash of sampled blocks of the csv file are the same, so an edit between sampled blocks is caught only by the
+        modification time (see DataCache.getFingerprint). with a memory budget columns of data set are kept in memory mapped
+        files, the file is parsed in this process and training set and test set are not created as lines (only their indices).
+        columns that are not selected and rows that are not sampled are skipped while parsing
+        Attributes:
+            pathOfFile(string): the path to the data set csv file
+            chunkSize(int): number of rows to read from file in each chunk
+            cache(DataCache): cache of parsed data sets, None for no caching
+            processes(int): number of worker processes to parse file with, None or 1 for parsing in this process. compressed
+            files are always parsed in this process
+            schema(Schema): known column types and values of file, None to infer them while parsing
+            memoryBudget(int): memory budget in bytes for working on data set out of memory, None to load data set into memory
+            spillFolderPath(string): folder for column files with a memory budget, None for the temp folder of system
+            columns(list): names of columns to load, class column is always loaded, None for all columns
+            sampler(Sampler): sample of rows to load, None for all rows. a sampler without seed is not cached and with a
+            sampler the file is parsed in this process
+            createLines(boolean): False to create only the indices of training set and test set, for working on the
+            columns of data set without a copy of rows as lines of strings
+        Raise:
+            EnvironmentError
+            ValueError: if file does not match schema or a selected column is not in file
+        """
+        cacheKey = schema.getKey() if schema is not None else None
+        if columns is not None or sampler is not None:
+            cacheKey = json.dumps({'schema': cacheKey, 'columns': columns, 'sampler': sampler.getKey() if sampler is not None else None})
+            cache = cache if sampler is None or sampler.seed is not None else None
+        self.dataSet = cache.load(pathOfFile, cacheKey) if cache is not None else None
+        if self.dataSet is None:
+            if memoryBudget is None and sampler is None and processes is not None and processes > 1 and \
+                    ReadFile().getCompression(pathOfFile) is None:
+                self.dataSet = self.parseDataInParallel(pathOfFile, chunkSize, processes, schema=schema, columns=columns)
+            else:
+                self.dataSet = self.parseData(pathOfFile, chunkSize, schema, memoryBudget, spillFolderPath, columns, sampler)
+            if cache is not None:
+                try:
+                    cache.save(pathOfFile, self.dataSet, cacheKey)
+                except EnvironmentError:
+                    pass
+        elif memoryBudget is not None:
+            self.dataSet.enableSpilling(spillFolderPath, memoryBudget // 4)
+        self.pathOfFile, self.cacheKey = pathOfFile if sampler is None or sampler.seed is not None else None, cacheKey
+        self.buildFromDataSet(self.dataSet, memoryBudget is None and createLines)
+
+    def profileData(self, indices, cache=None, processes=None):
+        """
+        method to profile rows of loaded data set. if a cache is given and it has a valid profile of the same file,
+        parsing and rows the profile is read from it instead of going over rows, failing to write a profile file does not
+        fail profiling. a data set with appended rows is not profiled from cache
+        Attributes:
+            indices(list): indices of rows to profile, usually training rows with a class value
+            cache(DataCache): cache of parsed data sets, None for no caching
+            processes(int): number of worker processes to profile columns with, None or 1 for profiling in this process
+        Returns:
+            Profile: the profile of rows
+        """
+        if self.pathOfFile is None:
+            cache = None
+        profileKey = json.dumps({'data': self.cacheKey, 'trainRatio': self.splitter.trainRatio, 'seed': self.splitter.seed,
+                                 'numOfRows': len(indices)})
+        profile = cache.loadProfile(self.pathOfFile, profileKey) if cache is not None else None
+        if profile is not None:
+            return Profile(**profile)
+        profile = Profile().profileDataSet(self.dataSet, indices, processes)
+        if cache is not None:
+            try:
+                cache.saveProfile(self.pathOfFile, profile.getDict(), profileKey)
+            except EnvironmentError:
+                pass
+        return profile
+
+    def parseData(self, pathOfFile, chunkSize, schema=None, memoryBudget=None, spillFolderPath=None, columns=None, sampler=None):
+        """
+        method to parse data csv file into a columnar data set. the file is streamed in chunks of rows, column types and
+        column values are inferred in the same pass. gzip, bz2 and xz compressed files are decompressed while reading.
+        with a memory budget columns are written to disk while parsing (values of columns are still kept in memory, a
+        schema avoids keeping values of numeric columns)
+        Attributes:
+            pathOfFile(string): the path to the data set csv file
+            chunkSize(int): number of rows to read from file in each chunk
+            schema(Schema): known column types and values of file, None to infer them while parsing
+            memoryBudget(int): memory budget in bytes, a quarter of it is used for columns, None to keep columns in memory
+            spillFolderPath(string): folder for column files with a memory budget, None for the temp folder of system
+            columns(list): names of columns to parse, class column is always parsed, None for all columns
+            sampler(Sampler): sample of rows to parse, None for all rows
+        Returns:
+            DataSet: the data set of file
+        Raise:
+            EnvironmentError
+            ValueError: if file does not match schema or a selected column is not in file
+        """
+        with ReadFile().openTextFile(pathOfFile) as csv_file:
+            csv_reader = csv.reader(csv_file, delimiter=',')
+            header = next(csv_reader, [])
+            if len(header) <= 1:
+                raise EnvironmentError
+            columnIndices = self.getColumnIndices(header, columns, schema.className if schema is not None else 'class')
+            dataSet = self.createDataSet([header[index] for index in columnIndices], schema, columns is not None)
+            if memoryBudget is not None:
+                dataSet.enableSpilling(spillFolderPath, memoryBudget // 4)
+            chunks = self.readChunks(csv_reader, chunkSize, columnIndices if columns is not None else None)
+            for chunk in (sampler.sample(chunks, dataSet.classIndex) if sampler is not None else chunks):
+                dataSet.appendRows(chunk)
+        dataSet.finishSpilling()
+        return dataSet
 
-    def loadData(self, pathOfFile):
+    def parseDataInParallel(self, pathOfFile, chunkSize, processes, rangeSize=64 << 20, schema=None, columns=None):
         """
-        method to read data csv file and build data structure, training data set and test data set. data is saved in class parameters
+        method to parse data csv file into a columnar data set with a pool of worker processes. the file is split into
+        byte ranges that start and end on line breaks, each worker parses a range into its own data set (with its own
+        column types and values) and the data sets are merged in file order. values inside quotes must not contain line breaks
         Attributes:
             pathOfFile(string): the path to the data set csv file
+            chunkSize(int): number of rows to read in each chunk by a worker
+            processes(int): number of worker processes
+            rangeSize(int): max size in bytes of a range parsed by a worker
+            schema(Schema): known column types and values of file, None to infer them while parsing
+            columns(list): names of columns to parse, class column is always parsed, None for all columns
+        Returns:
+            DataSet: the data set of file
         Raise:
             EnvironmentError
+            ValueError: if file does not match schema or a selected column is not in file
+        """
+        with open(pathOfFile, 'rb') as dataFile:
+            firstLine = dataFile.readline()
+            header = next(csv.reader(io.TextIOWrapper(io.BytesIO(firstLine))), [])
+            if len(header) <= 1:
+                raise EnvironmentError
+            ranges = self.getByteRanges(dataFile, dataFile.tell(), os.fstat(dataFile.fileno()).st_size, processes, rangeSize)
+        columnIndices = self.getColumnIndices(header, columns, schema.className if schema is not None else 'class')
+        header = [header[index] for index in columnIndices]
+        dataSet = self.createDataSet(header, schema, columns is not None)
+        if columns is None:
+            columnIndices = None
+        elif schema is not None:
+            schema = schema.project(header)
+        with Pool(processes) as pool:
+            for rangeDataSet in pool.imap(parseByteRange, [(pathOfFile, start, end, header, chunkSize, schema, columnIndices)
+                                                           for start, end in ranges]):
+                dataSet.extend(rangeDataSet)
+        return dataSet
+
+    def getByteRanges(self, dataFile, start, end, processes, rangeSize):
         """
-        with open(pathOfFile) as csv_file:
-            lines, csv_reader = [], csv.reader(csv_file, delimiter=',')
-            for row in csv_reader:
-                lines += [row]
-        if len(lines) == 0 or len(lines[0]) <= 1:
-            raise EnvironmentError
-        self.buildStructure(lines)
-        self.buildDataSets(lines[1:], self.structure)
+        method to split bytes of a file into ranges that start at the beginning of a line
+        Attributes:
+            dataFile(file): binary file object
+            start(int): offset of first data line
+            end(int): size of file
+            processes(int): number of worker processes, at least 4 ranges are created for each process
+            rangeSize(int): max size in bytes of a range
+        Returns:
+            list: list of (start, end) offsets
+        """
+        numOfRanges = max(processes * 4, (end - start) // rangeSize + 1)
+        ranges, rangeStart = [], start
+        for rangeIndex in range(1, numOfRanges + 1):
+            dataFile.seek(max(rangeStart, start + ((end - start) * rangeIndex) // numOfRanges))
+            if rangeIndex < numOfRanges:
+                dataFile.seek(dataFile.tell() - 1)
+                dataFile.readline()
+            rangeEnd = min(dataFile.tell(), end) if rangeIndex < numOfRanges else end
+            if rangeEnd > rangeStart:
+                ranges += [(rangeStart, rangeEnd)]
+            rangeStart = rangeEnd
+        return ranges
+
+    def buildFromDataSet(self, dataSet, createLines=True):
+        """
+        method to build data structure, training data set and test data set from a columnar data set
+        Attributes:
+            dataSet(DataSet): the data set to build from
+            createLines(boolean): False to create only the indices of training set and test set
+        """
+        self.structure, self.createLines = dataSet.getStructure(), createLines
+        classCodes = list(range(len(self.structure['class']['values']))) + [MISSING]
+        self.trainingIndices, self.testIndices = self.splitter.split(dataSet.columns[dataSet.classIndex], classCodes)
+        if createLines:
+            self.trainingSet = dataSet.getRows(self.trainingIndices)
+            self.testSet = dataSet.getRows(self.testIndices)
+
+    def appendRows(self, rows):
+        """
+        method to append a batch of new rows to the loaded data set. structure is updated with new values of columns
+        (a numeric column with a non numeric value becomes categorical) and only the new rows are split to training set
+        and test set, so the cost depends on the size of the batch and not on the rows already loaded
+        Attributes:
+            rows(list): list of lines each element is a list of strings in the order of columns of loaded data set
+        Raise:
+            ValueError: if rows do not match schema of a data set loaded by schema
+        """
+        batch = self.dataSet.createEmptyCopy()
+        batch.appendRows(rows)
+        self.appendDataSet(batch)
+
+    def appendData(self, pathOfFile, chunkSize=10000):
+        """
+        method to append the rows of a csv file to the loaded data set as one batch, see appendRows
+        Attributes:
+            pathOfFile(string): the path to a csv file with the same columns as the loaded data set
+            chunkSize(int): number of rows to read from file in each chunk
+        Raise:
+            EnvironmentError
+            ValueError: if columns of file are not the columns of loaded data set or rows do not match schema
+        """
+        batch = self.dataSet.createEmptyCopy()
+        with ReadFile().openTextFile(pathOfFile) as csv_file:
+            csv_reader = csv.reader(csv_file, delimiter=',')
+            header = next(csv_reader, [])
+            if len(header) != len(self.dataSet.names) or \
+                    any(name != loadedName for name, loadedName in zip(header, self.dataSet.names) if loadedName != 'class'):
+                raise ValueError("columns of file do not match columns of loaded data set")
+            for chunk in self.readChunks(csv_reader, chunkSize):
+                batch.appendRows(chunk)
+        self.appendDataSet(batch)
+
+    def appendDataSet(self, batch):
+        """
+        method to append a data set of new rows to the loaded data set, update structure and split the new rows to
+        training set and test set. lines of training set and test set are appended if they were created when loading
+        Attributes:
+            batch(DataSet): data set with the same columns as the loaded data set
+        """
+        start = len(self.dataSet)
+        self.dataSet.extend(batch)
+        self.pathOfFile = None
+        self.structure = self.dataSet.getStructure()
+        classCodes = list(range(len(self.structure['class']['values']))) + [MISSING]
+        trainingIndices, testIndices = self.splitter.split(self.dataSet.columns[self.dataSet.classIndex][start:], classCodes)
+        trainingIndices = array('l', [start + index for index in trainingIndices])
+        testIndices = array('l', [start + index for index in testIndices])
+        if self.createLines:
+            self.trainingSet += self.dataSet.getRows(trainingIndices)
+            self.testSet += self.dataSet.getRows(testIndices)
+        self.trainingIndices += trainingIndices
+        self.testIndices += testIndices
 
     def buildStructure(self, lines):
         """"
@@ -38,10 +283,81 @@ class Loader:
             columnName : {'index': index , 'values': [values]} or
             columnName : {'index': index , 'values': ["Numeric"]}
         """
-        self.structure = self.getColumnsName(lines)
-        for column in self.structure.keys():
-            self.structure[column]['values'] = self.getColumnValues(list(self.structure.keys()).index(column), lines,
-                                                                    self.structure['class']['index'])
+        dataSet = DataSet(lines[0])
+        dataSet.appendRows(lines[1:])
+        self.structure = dataSet.getStructure()
+
+    def readChunks(self, csvReader, chunkSize, columnIndices=None):
+        """
+        generator method to read rows from csv reader in chunks, empty rows are skipped
+        Attributes:
+            csvReader(csv.reader): the reader to read rows from
+            chunkSize(int): max number of rows in a chunk
+            columnIndices(list): indices of columns to take from each row (at least two), None for all columns
+        Returns:
+            generator: each element is a list of rows
+        """
+        chunk, project = [], itemgetter(*columnIndices) if columnIndices is not None else None
+        for row in csvReader:
+            if row:
+                chunk.append(project(row) if project is not None else row)
+                if len(chunk) >= chunkSize:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def getColumnIndices(self, header, columns, className='class'):
+        """
+        method to get the indices of selected columns in header, in the order of header
+        Attributes:
+            header(list): the names of columns in file
+            columns(list): names of selected columns, None for all columns
+            className(string): the name of class column that is always selected
+        Returns:
+            list: indices of selected columns
+        Raise:
+            ValueError: if a selected column is not in header or only class column is selected
+        """
+        if columns is None:
+            return list(range(len(header)))
+        for name in columns:
+            if name not in header:
+                raise ValueError("column " + name + " is not in file")
+        columnIndices = [index for index, name in enumerate(header) if name in columns or name == className]
+        if len(columnIndices) <= 1:
+            raise ValueError("at least one column besides class column must be selected")
+        return columnIndices
+
+    def createDataSet(self, header, schema=None, projected=False):
+        """
+        method to create an empty data set for the parsed columns of file
+        Attributes:
+            header(list): the names of parsed columns
+            schema(Schema): known column types and values of file, None to infer them while parsing
+            projected(boolean): True if only part of the columns of file are parsed
+        Returns:
+            DataSet: the empty data set
+        Raise:
+            ValueError: if header does not match schema
+        """
+        if schema is None:
+            return DataSet(header)
+        return schema.project(header).createDataSet(header) if projected else schema.createDataSet(header)
+
+    def isNumericValue(self, value):
+        """"
+        method to check if a value is Numeric
+        Attributes:
+            value(string) : the value to check
+        Returns:
+            (boolean) : True if numeric else False
+        """
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
 
     def getColumnsName(self, lines):
         """"
@@ -67,10 +383,11 @@ class Loader:
         """
         values = ["Numeric"]
         if not self.isNumeric(columnIndex, lines) or columnIndex == classIndex:
-            values = []
+            values = {}
             for line in lines[1:]:
-                if line[columnIndex] != "" and values.count(line[columnIndex]) == 0:
-                    values.append(line[columnIndex])
+                if line[columnIndex] != "":
+                    values[line[columnIndex]] = None
+            values = list(values)
         return values
 
     def isNumeric(self, columnIndex, lines):
@@ -82,15 +399,9 @@ class Loader:
         Returns:
             (boolean) : True if numeric else False
         """
-        for line in lines[1:]:
-            if line[columnIndex] != "":
-                try:
-                    int(line[columnIndex])
-                except ValueError:
-                    try:
-                        float(line[columnIndex])
-                    except ValueError:
-                        return False
+        for value in set(line[columnIndex] for line in lines[1:]):
+            if value != "" and not self.isNumericValue(value):
+                return False
         return True
 
     def buildDataSets(self, lines, structure):
@@ -101,11 +412,26 @@ class Loader:
             structure(dict): the structure of data
         """
         classIndex = structure['class']['index']
-        for classValue in structure['class']['values']:
-            data = list(filter(lambda x: x[classIndex] == classValue, lines))
-            self.trainingSet += data[0:int(((len(data)*2)/3) + 0.5)]
-            self.testSet += data[int(((len(data) * 2) / 3) + 0.5):]
-        data = list(filter(lambda x: x[classIndex] == "", lines))
-        self.trainingSet += data[0:int(((len(data) * 2) / 3) + 0.5)]
-        self.testSet += data[int(((len(data) * 2) / 3) + 0.5):]
+        self.trainingIndices, self.testIndices = self.splitter.split([line[classIndex] for line in lines],
+                                                                     structure['class']['values'] + [""])
+        self.trainingSet += [lines[index] for index in self.trainingIndices]
+        self.testSet += [lines[index] for index in self.testIndices]
+
 
+def parseByteRange(arguments):
+    """
+    function to parse a byte range of a csv file into a data set, used by worker processes of Loader.parseDataInParallel
+    Attributes:
+        arguments(tuple): (pathOfFile, start, end, header, chunkSize, schema, columnIndices)
+    Returns:
+        DataSet: the data set of the range
+    """
+    pathOfFile, start, end, header, chunkSize, schema, columnIndices = arguments
+    with open(pathOfFile, 'rb') as dataFile:
+        dataFile.seek(start)
+        data = dataFile.read(end - start)
+    dataSet = schema.createDataSet(header) if schema is not None else DataSet(header)
+    for chunk in Loader().readChunks(csv.reader(io.TextIOWrapper(io.BytesIO(data)), delimiter=','), chunkSize, columnIndices):
+        dataSet.appendRows(chunk)
+    dataSet.codes = [{} for _ in header]
+    return dataSet
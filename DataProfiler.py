@@ -0,0 +1,188 @@
+from DataCleaner import getColumnArray, initWorker, workerArrays
+from DataSet import MISSING
+from math import isnan
+from multiprocessing import Pool
+
+
+class Profile:
+    """
+    class of statistics of the columns of a data set that are calculated once and used by cleaning and discretization
+    instead of going over rows again in each stage. a profile can be cached with its data set and written as a json
+    report, example:
+    {"numOfRows": 3, "classValues": ["yes", "no"], "classCounts": [2, 1, 0],
+     "columns": {"age": {"numeric": true, "missing": [0, 1, 1], "min": 20.0, "max": 41.0,
+                         "statistics": [[61.0, 2], [0, 0], [61.0, 2]]},
+                 "job": {"numeric": false, "missing": [1, 0, 1],
+                         "statistics": [{"admin": [1, 1]}, {"admin": [1, 2]}, {"admin": [2, 2]}]}}}
+    counts of class values are last for rows with no class value, missing counts and statistics of columns are for each
+    class value and last for all rows. statistics are as in Cleaner.calcGroupedStatistics
+    """
+    def __init__(self, numOfRows=0, classValues=None, classCounts=None, columns=None):
+        """"
+        Ctor for Profile
+        Attributes:
+            numOfRows(int): the number of profiled rows
+            classValues(list): the class values in the order of counts and statistics
+            classCounts(list): number of rows of each class value and last of rows with no class value
+            columns(dict): columnName : statistics of column
+        """
+        self.numOfRows = numOfRows
+        self.classValues = classValues if classValues is not None else []
+        self.classCounts = classCounts if classCounts is not None else [0]
+        self.columns = columns if columns is not None else {}
+
+    def profileDataSet(self, dataSet, indices, processes=None):
+        """
+        method to profile rows of a columnar data set, each column is profiled in one pass over its floats or codes.
+        with worker processes each column is profiled by a worker as in Cleaner.fitDataSetImputer
+        Attributes:
+            dataSet(DataSet): the data set to profile
+            indices(list): indices of rows to profile
+            processes(int): number of worker processes to profile columns with, None or 1 for profiling in this process
+        Returns:
+            Profile: the profile we calculated
+        """
+        classColumn, numOfClassValues = dataSet.columns[dataSet.classIndex], len(dataSet.values[dataSet.classIndex])
+        columns = [(name, colIndex) for colIndex, name in enumerate(dataSet.names) if colIndex != dataSet.classIndex]
+        if processes is not None and processes > 1:
+            with Pool(processes, initializer=initWorker, initargs=(getColumnArray(classColumn), indices)) as pool:
+                profiles = pool.map(profileColumnInWorker, [(getColumnArray(dataSet.columns[colIndex]), numOfClassValues,
+                                                             getColumnArray(dataSet.textCodes[colIndex])) for _, colIndex in columns])
+        else:
+            profiles = [profileColumn(dataSet.columns[colIndex], classColumn, numOfClassValues, indices, dataSet.textCodes[colIndex])
+                        for _, colIndex in columns]
+        self.numOfRows, self.classValues = len(indices), list(dataSet.values[dataSet.classIndex])
+        self.classCounts = [0] * (numOfClassValues + 1)
+        for index in indices:
+            self.classCounts[classColumn[index]] += 1
+        self.columns = {}
+        for (name, colIndex), columnProfile in zip(columns, profiles):
+            if not columnProfile['numeric']:
+                values = dataSet.values[colIndex]
+                columnProfile['statistics'] = [{values[code]: counts for code, counts in group.items()}
+                                               for group in columnProfile['statistics']]
+            self.columns[name] = columnProfile
+        return self
+
+    def getDict(self):
+        """
+        method to get the profile as a dict that can be written to a json file
+        Returns:
+            dict: {'numOfRows': numOfRows, 'classValues': classValues, 'classCounts': classCounts, 'columns': columns}
+        """
+        return {'numOfRows': self.numOfRows, 'classValues': self.classValues, 'classCounts': self.classCounts,
+                'columns': self.columns}
+
+    def getStatistics(self, structure):
+        """
+        method to get the statistics of columns of a structure in the format of Cleaner.calcGroupedStatistics, so an
+        imputer can be created from them by Cleaner.createImputer
+        Attributes:
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            dict: columnIndex : statistics of column
+        """
+        return {column['index']: self.columns[name]['statistics'] for name, column in structure.items() if name in self.columns}
+
+    def getColumnRanges(self, imputer=None):
+        """
+        method to get min and max of numeric columns. with an imputer the fill values of missing values are in the range,
+        so it is the range of columns after they are cleaned by imputer
+        Attributes:
+            imputer(Imputer): imputer that fills missing values of profiled rows, None for the range of known values
+        Returns:
+            dict: columnName : (min, max), columns with no values are skipped
+        """
+        ranges = {}
+        for name, column in self.columns.items():
+            if column['numeric']:
+                values = [column['min'], column['max']] if column['min'] is not None else []
+                if imputer is not None and name in imputer.fillValues:
+                    values += [float(value) for value in self.getUsedFillValues(column['missing'], imputer, name) if value is not None]
+                if values:
+                    ranges[name] = (min(values), max(values))
+        return ranges
+
+    def getUsedFillValues(self, missing, imputer, name):
+        """
+        method to get the fill values of a column that an imputer puts in profiled rows
+        Attributes:
+            missing(list): number of missing values of column for each class value and last for all rows
+            imputer(Imputer): the imputer
+            name(string): the name of column
+        Returns:
+            list: fill values of class values with missing values and of rows with no class value
+        """
+        positions = {value: position for position, value in enumerate(imputer.classValues)}
+        fillValues = imputer.fillValues[name]
+        used = [fillValues[positions.get(classValue, -1)] for classValue, count in zip(self.classValues, missing) if count > 0]
+        if missing[-1] > sum(missing[:-1]):
+            used += [fillValues[-1]]
+        return used
+
+
+def profileColumn(column, classColumn, numOfClassValues, indices, textCodes=None):
+    """
+    function to profile a column of a data set in one pass, statistics of a categorical column are by codes of values
+    and statistics of a numeric column skip nan values that are not missing
+    Attributes:
+        column(array): the floats or codes of column
+        classColumn(array): the codes of class column
+        numOfClassValues(int): the number of class values
+        indices(list): indices of rows
+        textCodes(array): the codes of texts of a numeric column, None for a categorical column
+    Returns:
+        dict: {'numeric': numeric, 'missing': missing, 'statistics': statistics} and 'min', 'max' of a numeric column
+    """
+    missing = [0] * (numOfClassValues + 1)
+    if textCodes is not None:
+        statistics, minVal, maxVal = [[0, 0] for _ in range(numOfClassValues + 1)], None, None
+        for index in indices:
+            value, classCode = column[index], classColumn[index]
+            if textCodes[index] == MISSING:
+                if classCode != MISSING:
+                    missing[classCode] += 1
+                missing[-1] += 1
+                continue
+            if isnan(value):
+                continue
+            if classCode != MISSING:
+                statistics[classCode][0] += value
+                statistics[classCode][1] += 1
+            statistics[-1][0] += value
+            statistics[-1][1] += 1
+            if minVal is None or value < minVal:
+                minVal = value
+            if maxVal is None or value > maxVal:
+                maxVal = value
+        return {'numeric': True, 'missing': missing, 'min': minVal, 'max': maxVal, 'statistics': statistics}
+    statistics = [{} for _ in range(numOfClassValues + 1)]
+    for position, index in enumerate(indices):
+        code, classCode = column[index], classColumn[index]
+        if code == MISSING:
+            if classCode != MISSING:
+                missing[classCode] += 1
+            missing[-1] += 1
+            continue
+        for group in (statistics[classCode], statistics[-1]) if classCode != MISSING else (statistics[-1],):
+            counts = group.get(code)
+            if counts is None:
+                group[code] = [1, position]
+            else:
+                counts[0] += 1
+                counts[1] = position
+    return {'numeric': False, 'missing': missing, 'statistics': statistics}
+
+
+def profileColumnInWorker(arguments):
+    """
+    function to profile a column in a worker process
+    Attributes:
+        arguments(tuple): (column, numOfClassValues, textCodes)
+    Returns:
+        dict: the profile of column as returned by profileColumn
+    """
+    column, numOfClassValues, textCodes = arguments
+    return profileColumn(column, workerArrays['classColumn'], numOfClassValues, workerArrays['indices'], textCodes)
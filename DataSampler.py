@@ -0,0 +1,137 @@
+from operator import itemgetter
+import json
+import random
+
+
+class Sampler:
+    """
+    class to sample rows of a data set while it is parsed, rows that are not sampled are never encoded. a sample is a
+    fraction of rows or a fixed number of rows (reservoir sampling), a stratified sample keeps the part of each class
+    value in the sample as it is in the file
+    """
+    def __init__(self, fraction=None, size=None, stratified=False, seed=None):
+        """"
+        Ctor for Sampler
+        Attributes:
+            fraction(float): part of rows to sample, between 0 and 1
+            size(int): number of rows to sample
+            stratified(boolean): True to sample each class value by its part of rows
+            seed(int): seed of random sampling, None for a different sample each time
+        Raise:
+            ValueError: if not exactly one of fraction and size is given or it is out of range
+        """
+        if (fraction is None) == (size is None):
+            raise ValueError("sampler needs a fraction or a size")
+        if (fraction is not None and not 0 < fraction <= 1) or (size is not None and size < 0):
+            raise ValueError("sampler fraction must be in (0, 1] and size must not be negative")
+        self.fraction = fraction
+        self.size = size
+        self.stratified = stratified
+        self.seed = seed
+
+    def getKey(self):
+        """
+        method to get a string that identifies the sample, used to key cache files of sampled data sets
+        Returns:
+            string: json of sampler
+        """
+        return json.dumps({'fraction': self.fraction, 'size': self.size, 'stratified': self.stratified, 'seed': self.seed})
+
+    def sample(self, chunks, classIndex):
+        """
+        generator method to sample chunks of rows
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+            classIndex(int): the index of class column in rows
+        Returns:
+            generator: chunks of sampled rows in the order of file
+        """
+        if self.size is not None:
+            yield self.sampleBySize(chunks, classIndex)
+        elif self.stratified:
+            yield from self.sampleByStratifiedFraction(chunks, classIndex)
+        else:
+            yield from self.sampleByFraction(chunks)
+
+    def sampleByFraction(self, chunks):
+        """
+        generator method to sample each row with probability of fraction
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+        Returns:
+            generator: chunks of sampled rows
+        """
+        randomNumber, fraction = random.Random(self.seed).random, self.fraction
+        for chunk in chunks:
+            yield [row for row in chunk if randomNumber() < fraction]
+
+    def sampleByStratifiedFraction(self, chunks, classIndex):
+        """
+        generator method to sample a fraction of the rows of each class value. rows of a class value are sampled
+        systematically from a random start, so the number of sampled rows of each class value is its number of rows
+        times fraction rounded up or down
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+            classIndex(int): the index of class column in rows
+        Returns:
+            generator: chunks of sampled rows
+        """
+        randomNumber, fraction, positions = random.Random(self.seed).random, self.fraction, {}
+        for chunk in chunks:
+            sample = []
+            for row in chunk:
+                position = positions.get(row[classIndex])
+                if position is None:
+                    position = randomNumber()
+                nextPosition = positions[row[classIndex]] = position + fraction
+                if int(nextPosition) > int(position):
+                    sample.append(row)
+            yield sample
+
+    def sampleBySize(self, chunks, classIndex):
+        """
+        method to sample a fixed number of rows by reservoir sampling. a stratified sample keeps a reservoir for each
+        class value and the sample size is divided between class values by their number of rows
+        Attributes:
+            chunks(iterable): chunks of rows each element is a list of rows
+            classIndex(int): the index of class column in rows
+        Returns:
+            list: sampled rows in the order of file
+        """
+        shuffler, reservoirs, counts, position = random.Random(self.seed), {}, {}, 0
+        for chunk in chunks:
+            for row in chunk:
+                key = row[classIndex] if self.stratified else None
+                reservoir = reservoirs.setdefault(key, [])
+                count = counts[key] = counts.get(key, 0) + 1
+                if len(reservoir) < self.size:
+                    reservoir.append((position, row))
+                else:
+                    replaceIndex = shuffler.randrange(count)
+                    if replaceIndex < self.size:
+                        reservoir[replaceIndex] = (position, row)
+                position += 1
+        sample = []
+        for key, size in self.getStratumSizes(counts).items():
+            shuffler.shuffle(reservoirs[key])
+            sample += reservoirs[key][:size]
+        sample.sort(key=itemgetter(0))
+        return [row for _, row in sample]
+
+    def getStratumSizes(self, counts):
+        """
+        method to divide sample size between strata by their number of rows, remainders go to the strata with the
+        largest fractions
+        Attributes:
+            counts(dict): stratum : number of rows
+        Returns:
+            dict: stratum : number of rows to sample
+        """
+        total = sum(counts.values())
+        size = min(self.size, total)
+        quotas = {key: count * size / total for key, count in counts.items()}
+        sizes = {key: int(quota) for key, quota in quotas.items()}
+        remainders = sorted(quotas, key=lambda key: quotas[key] - sizes[key], reverse=True)
+        for key in remainders[:size - sum(sizes.values())]:
+            sizes[key] += 1
+        return sizes
@@ -0,0 +1,91 @@
+from array import array
+from DataSet import DataSet
+import json
+
+
+class Schema:
+    """
+    class to describe the columns of a data set in advance so loading does not need to infer column types and values.
+    a schema file is a json file, example:
+    {"class": "y", "columns": {"age": ["Numeric"], "job": ["admin", "student"], "y": ["yes", "no"]}}
+    each column has ["Numeric"] or a list of its allowed values (as in structure), "class" is the name of class column
+    """
+    def __init__(self, columns=None, className='class'):
+        """"
+        Ctor for Schema
+        Attributes:
+            columns(dict): columnName : ["Numeric"] or columnName : [values]
+            className(string): the name of class column in file
+        """
+        self.columns = columns if columns is not None else {}
+        self.className = className
+
+    def readSchemaFile(self, pathOfFile):
+        """
+        method to read schema from a json file
+        Attributes:
+            pathOfFile(string): the path to the schema file
+        Returns:
+            Schema: the schema we read
+        Raise:
+            EnvironmentError
+            ValueError: if schema file is invalid
+        """
+        with open(pathOfFile) as schemaFile:
+            schema = json.load(schemaFile)
+        if not isinstance(schema, dict) or not isinstance(schema.get('columns'), dict):
+            raise ValueError("schema file must have a columns dict")
+        self.columns, self.className = schema['columns'], schema.get('class', 'class')
+        for name, values in self.columns.items():
+            if not isinstance(values, list) or not values:
+                raise ValueError("values of column " + name + " must be a list")
+        if self.className not in self.columns:
+            raise ValueError("class column " + self.className + " is not in schema columns")
+        return self
+
+    def getKey(self):
+        """
+        method to get a string that identifies the schema, used to key cache files of data sets loaded by schema
+        Returns:
+            string: json of schema
+        """
+        return json.dumps({'class': self.className, 'columns': self.columns}, sort_keys=True)
+
+    def project(self, names):
+        """
+        method to get a schema of part of the columns
+        Attributes:
+            names(list): the names of columns to keep
+        Returns:
+            Schema: schema with only the columns in names
+        Raise:
+            ValueError: if a column is not in schema
+        """
+        for name in names:
+            if name not in self.columns:
+                raise ValueError("column " + name + " is not in schema columns")
+        return Schema({name: self.columns[name] for name in names}, self.className)
+
+    def createDataSet(self, header):
+        """
+        method to create an empty data set with column types and values from schema
+        Attributes:
+            header(list): the names of columns in file
+        Returns:
+            DataSet: data set that validates rows by schema instead of inferring types and values
+        Raise:
+            ValueError: if header columns do not match schema columns
+        """
+        if sorted(header) != sorted(self.columns):
+            raise ValueError("file columns do not match schema columns")
+        if self.className != 'class' and 'class' in header:
+            raise ValueError("file has a class column that is not the schema class column")
+        dataSet = DataSet(['class' if name == self.className else name for name in header])
+        dataSet.fixed = True
+        for colIndex, name in enumerate(header):
+            values = self.columns[name]
+            if name != self.className and str(values[0]).upper() == "NUMERIC":
+                dataSet.setNumericColumn(colIndex)
+            else:
+                dataSet.setCategoricalColumn(colIndex, array('i'), list(dict.fromkeys(str(value) for value in values)))
+        return dataSet
@@ -0,0 +1,610 @@
+from array import array
+from itertools import chain
+from math import nan
+import mmap
+import tempfile
+
+MISSING = -1
+NUMBER, NUMBER_TEXT, ROW_TEXT = 0, 1, 2
+
+
+class DataSet:
+    """
+    class to hold a data set by columns. categorical columns are stored as integer codes with a dictionary of values
+    per column, numeric columns are stored as float arrays with a code for each cell of how its text is kept:
+    MISSING for a missing value (its float is nan), NUMBER for a number written as formatNumber writes it, NUMBER_TEXT
+    for a number written as its text in texts of column and ROW_TEXT for a cell with its own text in rowTexts of column
+    (a number read with other texts in other rows), so each cell is written back with the text it was read with.
+    without a schema all columns but class start as numeric columns and a column becomes categorical at its first non
+    numeric value
+    """
+    def __init__(self, names):
+        """"
+        Ctor for DataSet
+        Attributes:
+            names(list): the names of columns in data set
+        """
+        self.names = names
+        self.classIndex = names.index('class') if 'class' in names else None
+        self.numeric = [index != self.classIndex for index in range(len(names))]
+        self.columns = [array('d' if isNumeric else 'i') for isNumeric in self.numeric]
+        self.values = [[] for _ in names]
+        self.codes = [{} for _ in names]
+        self.texts = [{} if isNumeric else None for isNumeric in self.numeric]
+        self.textCodes = [array('b') if isNumeric else None for isNumeric in self.numeric]
+        self.rowTexts = [{} if isNumeric else None for isNumeric in self.numeric]
+        self.fixed = False
+        self.spillFolderPath = None
+        self.maxMemory = None
+        self.spillFiles = None
+        self.spilledRows = 0
+        self.mappedFiles = []
+
+    def __len__(self):
+        return (len(self.columns[0]) if self.columns else 0) + self.spilledRows
+
+    def appendRows(self, rows):
+        """
+        method to encode rows and append them to the columns. values of numeric columns are parsed into float arrays
+        and values of categorical columns are coded. a data set with spilling enabled moves its columns to disk when
+        they are above its max memory, mapped columns (of a spilled or cached data set) are made appendable first, see
+        unmapColumns
+        Attributes:
+            rows(list): list of lines each element is a list of strings
+        """
+        mapped = self.unmapColumns()
+        if self.fixed:
+            self.appendRowsBySchema(rows)
+        else:
+            self.appendRowsByInference(rows)
+        if self.spillFolderPath is not None and self.getMemorySize() > self.maxMemory:
+            self.flushColumns()
+        if mapped:
+            self.finishSpilling()
+
+    def appendRowsByInference(self, rows):
+        """
+        method to encode rows and append them to the columns, values of numeric columns are parsed directly into their
+        float arrays so a numeric column does not keep its distinct values. a numeric column with a non numeric value is
+        converted to codes of the texts of its rows (rows spilled to disk too) and marked as categorical, values of
+        categorical columns are added to column dictionaries
+        Attributes:
+            rows(list): list of lines each element is a list of strings
+        """
+        start = len(self)
+        for colIndex in range(len(self.names)):
+            if self.texts[colIndex] is not None:
+                try:
+                    self.appendNumbers(colIndex, [row[colIndex] for row in rows], start)
+                    continue
+                except ValueError:
+                    self.decodeNumericColumn(colIndex)
+                    self.numeric[colIndex] = False
+            codes, values, append = self.codes[colIndex], self.values[colIndex], self.columns[colIndex].append
+            for row in rows:
+                value = row[colIndex]
+                code = codes.get(value)
+                if code is None:
+                    if value == "":
+                        append(MISSING)
+                        continue
+                    code = codes[value] = len(values)
+                    values.append(value)
+                append(code)
+
+    def appendRowsBySchema(self, rows):
+        """
+        method to append rows to a data set with column types and values set by a schema. numeric values are parsed
+        directly into float arrays and categorical values are only checked to be allowed values
+        Attributes:
+            rows(list): list of lines each element is a list of strings
+        Raise:
+            ValueError: if a value is not numeric in a numeric column or not an allowed value in a categorical column
+        """
+        start = len(self)
+        for colIndex, column in enumerate(self.columns):
+            if self.texts[colIndex] is not None:
+                try:
+                    self.appendNumbers(colIndex, [row[colIndex] for row in rows], start)
+                except ValueError as error:
+                    raise ValueError(str(error) + " in numeric column " + self.names[colIndex])
+                continue
+            codes = dict(self.codes[colIndex], **{"": MISSING})
+            try:
+                column.extend([codes[row[colIndex]] for row in rows])
+            except KeyError as error:
+                raise ValueError("value " + str(error) + " is not allowed in column " + self.names[colIndex])
+
+    def appendNumbers(self, colIndex, values, start):
+        """
+        method to parse values of a numeric column into its float array and keep the code of the text of each cell, the
+        column is not changed if a value is not numeric. each distinct value of the appended rows is parsed once
+        Attributes:
+            colIndex(int): the index of a numeric column
+            values(list): the values of column in appended rows
+            start(int): the index of the first appended row
+        Raise:
+            ValueError: if a value is not numeric
+        """
+        numbers, textCodes, texts, rowTexts = array('d'), array('b'), self.texts[colIndex], {}
+        formatNumber, cells = self.formatNumber, {"": (nan, MISSING)}
+        for rowIndex, value in enumerate(values, start):
+            cell = cells.get(value)
+            if cell is None:
+                number = float(value)
+                if value == formatNumber(number):
+                    cell = cells[value] = (number, NUMBER)
+                elif number == number and texts.setdefault(number, value) == value:
+                    cell = cells[value] = (number, NUMBER_TEXT)
+                else:
+                    cell = cells[value] = (number, ROW_TEXT)
+            numbers.append(cell[0])
+            textCodes.append(cell[1])
+            if cell[1] == ROW_TEXT:
+                rowTexts[rowIndex] = value
+        self.columns[colIndex].extend(numbers)
+        self.textCodes[colIndex].extend(textCodes)
+        self.rowTexts[colIndex].update(rowTexts)
+
+    def setNumericColumn(self, colIndex):
+        """
+        method to make a column an empty numeric column, values appended to it are parsed directly into its float array
+        Attributes:
+            colIndex(int): the index of column
+        """
+        self.columns[colIndex], self.textCodes[colIndex], self.values[colIndex], self.codes[colIndex] = array('d'), array('b'), [], {}
+        self.numeric[colIndex], self.texts[colIndex], self.rowTexts[colIndex] = True, {}, {}
+
+    def setCategoricalColumn(self, colIndex, column, values):
+        """
+        method to replace a column by codes of a list of values, the column is marked as categorical
+        Attributes:
+            colIndex(int): the index of column
+            column(array): the codes of column, MISSING for a missing value
+            values(list): the values of codes
+        """
+        self.columns[colIndex], self.values[colIndex] = column, values
+        self.codes[colIndex] = {value: code for code, value in enumerate(values)}
+        self.numeric[colIndex], self.texts[colIndex], self.textCodes[colIndex], self.rowTexts[colIndex] = False, None, None, None
+
+    def createEmptyCopy(self):
+        """
+        method to create an empty data set with the same columns, a data set with column types and values set by a
+        schema is copied with its types and values so rows appended to the copy are checked by the schema
+        Returns:
+            DataSet: the empty data set
+        """
+        dataSet = DataSet(list(self.names))
+        if self.fixed:
+            dataSet.fixed = True
+            for colIndex in range(len(self.names)):
+                if self.texts[colIndex] is None:
+                    dataSet.setCategoricalColumn(colIndex, array('i'), list(self.values[colIndex]))
+        return dataSet
+
+    def decodeNumericColumn(self, colIndex, blockSize=1 << 16):
+        """
+        method to convert the float array of a numeric column back to codes and a dictionary of values, the value of a
+        cell is the text it was read with so a number read with two texts becomes two values. rows of a data set that
+        is spilling are converted block by block from the column files to a new column file, the other rows are kept in
+        memory as rows are appended to them. the column is still marked as numeric until it is merged with non numeric
+        values
+        Attributes:
+            colIndex(int): the index of column
+            blockSize(int): number of rows converted at once
+        """
+        values, codes, column = [], {"": MISSING}, array('i')
+
+        def getBlocks(numbers, textCodes, start):
+            """
+            generator function to get the codes of texts of rows block by block, new texts are added to values
+            """
+            for blockStart in range(0, len(numbers), blockSize):
+                block, rows = array('i'), range(blockStart, min(blockStart + blockSize, len(numbers)))
+                for value in self.getNumberTexts(colIndex, numbers, textCodes, rows, start):
+                    code = codes.get(value)
+                    if code is None:
+                        code = codes[value] = len(values)
+                        values.append(value)
+                    block.append(code)
+                yield block
+        if self.spillFiles is not None:
+            spillFile, textsFile = self.spillFiles[colIndex]
+            spillFile.flush()
+            textsFile.flush()
+            self.spillFiles[colIndex] = [tempfile.TemporaryFile(dir=self.spillFolderPath), None]
+            with mmap.mmap(spillFile.fileno(), 0, access=mmap.ACCESS_READ) as numbersFile, \
+                    mmap.mmap(textsFile.fileno(), 0, access=mmap.ACCESS_READ) as textCodesFile:
+                numbers, textCodes = memoryview(numbersFile).cast('d'), memoryview(textCodesFile).cast('b')
+                for block in getBlocks(numbers, textCodes, 0):
+                    block.tofile(self.spillFiles[colIndex][0])
+                numbers.release()
+                textCodes.release()
+            spillFile.close()
+            textsFile.close()
+        for block in getBlocks(self.columns[colIndex], self.textCodes[colIndex], self.spilledRows):
+            column += block
+        self.columns[colIndex] = column
+        del codes[""]
+        self.values[colIndex], self.codes[colIndex] = values, codes
+        self.texts[colIndex], self.textCodes[colIndex], self.rowTexts[colIndex] = None, None, None
+
+    def addValue(self, colIndex, value):
+        """
+        method to get the code of a value in a categorical column, the value is added to column dictionary if it is new
+        Attributes:
+            colIndex(int): the index of column
+            value(string): the value
+        Returns:
+            int: the code of value
+        """
+        code = self.codes[colIndex].get(value)
+        if code is None:
+            code = self.codes[colIndex][value] = len(self.values[colIndex])
+            self.values[colIndex].append(value)
+        return code
+
+    def extend(self, other):
+        """
+        method to append rows of another data set with the same columns. numeric float arrays and codes of texts are
+        concatenated (a number with another text in this data set keeps its text as a text of its row), codes of other
+        data set are mapped to codes of this data set and columns that are numeric in only one data set become categorical.
+        mapped columns of this data set are made appendable first (see unmapColumns) and a data set with spilling
+        enabled writes its columns to its column files and maps them again, so rows already in it are not read into memory
+        Attributes:
+            other(DataSet): the data set to append
+        """
+        mapped, start = self.unmapColumns(), len(self)
+        for colIndex in range(len(self.names)):
+            column, textCodes = other.columns[colIndex], other.textCodes[colIndex]
+            if start == 0 and not self.values[colIndex]:
+                self.columns[colIndex] = array(column.typecode if isinstance(column, array) else column.format, column)
+                self.values[colIndex] = list(other.values[colIndex])
+                self.codes[colIndex] = {value: code for code, value in enumerate(self.values[colIndex])}
+                if other.texts[colIndex] is not None:
+                    self.textCodes[colIndex] = array('b', textCodes)
+                    self.texts[colIndex], self.rowTexts[colIndex] = dict(other.texts[colIndex]), dict(other.rowTexts[colIndex])
+                else:
+                    self.texts[colIndex], self.textCodes[colIndex], self.rowTexts[colIndex] = None, None, None
+                self.numeric[colIndex] = self.numeric[colIndex] and other.numeric[colIndex]
+                continue
+            if self.texts[colIndex] is not None and other.texts[colIndex] is not None:
+                texts, otherTexts = self.texts[colIndex], other.texts[colIndex]
+                textCodes, rowTexts = array('b', textCodes), self.rowTexts[colIndex]
+                others = {number for number, value in otherTexts.items() if texts.setdefault(number, value) != value}
+                if others:
+                    for rowIndex, (number, textCode) in enumerate(zip(column, textCodes)):
+                        if textCode == NUMBER_TEXT and number in others:
+                            textCodes[rowIndex], rowTexts[start + rowIndex] = ROW_TEXT, otherTexts[number]
+                rowTexts.update({start + rowIndex: value for rowIndex, value in other.rowTexts[colIndex].items()})
+                self.columns[colIndex] += array('d', column)
+                self.textCodes[colIndex] += textCodes
+                continue
+            for dataSet in (self, other):
+                if dataSet.texts[colIndex] is not None:
+                    dataSet.decodeNumericColumn(colIndex)
+            codesMap = [self.addValue(colIndex, value) for value in other.values[colIndex]] + [MISSING]
+            self.columns[colIndex] += array('i', map(codesMap.__getitem__, other.columns[colIndex]))
+            self.numeric[colIndex] = self.numeric[colIndex] and other.numeric[colIndex]
+        if self.spillFolderPath is not None and self.getMemorySize() > self.maxMemory:
+            self.flushColumns()
+        if mapped or self.spillFiles is not None:
+            self.finishSpilling()
+
+    def enableSpilling(self, folderPath=None, maxMemory=64 << 20):
+        """
+        method to keep columns of data set in memory mapped files. while rows are appended columns are written to disk
+        each time they are above max memory, columns created later (for example by discretization of numeric columns) are
+        written to new mapped files
+        Attributes:
+            folderPath(string): folder for the column files, None for the temp folder of system
+            maxMemory(int): max size in bytes of columns kept in memory while rows are appended
+        """
+        self.spillFolderPath = folderPath if folderPath is not None else tempfile.gettempdir()
+        self.maxMemory = maxMemory
+
+    def getMemorySize(self):
+        """
+        method to get the size of columns and codes of texts that are in memory
+        Returns:
+            int: size in bytes of in memory columns
+        """
+        return sum(len(column) * column.itemsize for column in self.columns + self.textCodes if isinstance(column, array))
+
+    def flushColumns(self):
+        """
+        method to append the in memory columns and codes of texts of numeric columns to their files and empty them
+        """
+        if self.spillFiles is None:
+            self.spillFiles = [[tempfile.TemporaryFile(dir=self.spillFolderPath), None] for _ in self.names]
+        self.spilledRows += len(self.columns[0])
+        for colIndex, (column, textCodes) in enumerate(zip(self.columns, self.textCodes)):
+            column.tofile(self.spillFiles[colIndex][0])
+            self.columns[colIndex] = array(column.typecode)
+            if textCodes is not None:
+                if self.spillFiles[colIndex][1] is None:
+                    self.spillFiles[colIndex][1] = tempfile.TemporaryFile(dir=self.spillFolderPath)
+                textCodes.tofile(self.spillFiles[colIndex][1])
+                self.textCodes[colIndex] = array('b')
+
+    def finishSpilling(self):
+        """
+        method to map the column files after all rows were appended, does nothing if no column was written to disk
+        """
+        if self.spillFiles is None:
+            return
+        self.flushColumns()
+        for colIndex, (spillFile, textsFile) in enumerate(self.spillFiles):
+            self.columns[colIndex] = self.mapFile(spillFile, self.columns[colIndex].typecode)
+            if textsFile is not None:
+                self.textCodes[colIndex] = self.mapFile(textsFile, 'b')
+        self.spillFiles, self.spilledRows = None, 0
+
+    def unmapColumns(self, blockSize=1 << 16):
+        """
+        method to make the mapped columns of a data set appendable before rows are appended to it. with spilling enabled
+        all columns are reopened as column files so appended rows are written after the rows already in the data set
+        without reading them into memory, the file of a column mapped by this data set is reused and any other column
+        (for example a column mapped from a cache file) is copied to a new column file block by block. without spilling
+        mapped columns are copied into memory arrays. call finishSpilling to map the columns again after appending
+        Attributes:
+            blockSize(int): number of rows copied at once
+        Returns:
+            boolean: True if a column was mapped, False if data set was not changed
+        """
+        if not any(isinstance(column, memoryview) for column in self.columns + self.textCodes):
+            return False
+        if self.spillFolderPath is None:
+            self.columns = [array(column.format, column) if isinstance(column, memoryview) else column for column in self.columns]
+            self.textCodes = [array('b', textCodes) if isinstance(textCodes, memoryview) else textCodes for textCodes in self.textCodes]
+            return True
+
+        def getColumnFile(column):
+            """
+            function to get a column file with the items of a column, positioned at its end
+            """
+            for view, mappedFile in self.mappedFiles:
+                if view is column:
+                    mappedFile.seek(0, 2)
+                    return mappedFile
+            columnFile = tempfile.TemporaryFile(dir=self.spillFolderPath)
+            for start in range(0, len(column), blockSize):
+                columnFile.write(memoryview(column)[start:start + blockSize])
+            return columnFile
+        self.spilledRows = len(self.columns[0])
+        self.spillFiles = [[getColumnFile(column), getColumnFile(textCodes) if textCodes is not None else None]
+                           for column, textCodes in zip(self.columns, self.textCodes)]
+        self.mappedFiles = [(view, mappedFile) for view, mappedFile in self.mappedFiles
+                            if all(mappedFile not in files for files in self.spillFiles)]
+        self.columns = [array(column.typecode if isinstance(column, array) else column.format) for column in self.columns]
+        self.textCodes = [array('b') if textCodes is not None else None for textCodes in self.textCodes]
+        return True
+
+    def mapColumn(self, colIndex, typeCode, convert, blockSize=1 << 16):
+        """
+        method to create a new column from a column by converting its rows block by block. when spilling is enabled the
+        new column is written to a mapped file so the old and new columns are not both in memory
+        Attributes:
+            colIndex(int): the index of column
+            typeCode(string): array type code of new column
+            convert(function): function to convert the rows from start to stop of column to a list of new items
+            blockSize(int): number of rows in a block
+        Returns:
+            array: the new column, a memoryview of a mapped file when spilling is enabled
+        """
+        numOfRows = len(self.columns[colIndex])
+        blocks = (array(typeCode, convert(start, min(start + blockSize, numOfRows))) for start in range(0, numOfRows, blockSize))
+        if self.spillFolderPath is None:
+            column = array(typeCode)
+            for block in blocks:
+                column += block
+            return column
+        mappedFile = tempfile.TemporaryFile(dir=self.spillFolderPath)
+        for block in blocks:
+            block.tofile(mappedFile)
+        return self.mapFile(mappedFile, typeCode)
+
+    def mapFile(self, mappedFile, typeCode):
+        """
+        method to map a column file into memory, the mapping is writable and the file is kept open as long as data set exists
+        Attributes:
+            mappedFile(file): temporary binary file with the items of column
+            typeCode(string): array type code of column
+        Returns:
+            memoryview: the column, an empty array if file is empty
+        """
+        mappedFile.flush()
+        if mappedFile.tell() == 0:
+            mappedFile.close()
+            return array(typeCode)
+        column = memoryview(mmap.mmap(mappedFile.fileno(), 0)).cast(typeCode)
+        self.mappedFiles.append((column, mappedFile))
+        return column
+
+    def getRowsPerChunk(self, memoryBudget):
+        """
+        method to get the number of rows that can be converted to lines of strings at once within a memory budget,
+        a quarter of the budget is used for a chunk
+        Attributes:
+            memoryBudget(int): memory budget in bytes
+        Returns:
+            int: number of rows in a chunk
+        """
+        rowSize = 64 + 8 * len(self.names) + 56 * sum(texts is not None for texts in self.texts)
+        return max(1, memoryBudget // 4 // rowSize)
+
+    def formatNumber(self, number):
+        """
+        method to convert a float from a numeric column to its string representation
+        Attributes:
+            number(float): the number to convert
+        Returns:
+            String: the number, integral numbers are written without a fraction
+        """
+        text = repr(number)
+        return text[:-2] if text.endswith('.0') else text
+
+    def getStructure(self):
+        """
+        method to get the structure of data set
+        Returns:
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+            columnName : {'index': index , 'values': [values]} or
+            columnName : {'index': index , 'values': ["Numeric"]}
+        """
+        structure = {}
+        for colIndex, name in enumerate(self.names):
+            structure[name] = {'index': colIndex,
+                               'values': ["Numeric"] if self.numeric[colIndex] else list(self.values[colIndex])}
+        return structure
+
+    def getColumnValue(self, colIndex, rowIndex):
+        """
+        method to get the string value of a cell
+        Attributes:
+            colIndex(int): the index of column
+            rowIndex(int): the index of row
+        Returns:
+            String: the value of the cell, "" for missing value
+        """
+        value = self.columns[colIndex][rowIndex]
+        if self.texts[colIndex] is not None:
+            textCode = self.textCodes[colIndex][rowIndex]
+            if textCode == NUMBER:
+                return self.formatNumber(value)
+            if textCode == NUMBER_TEXT:
+                return self.texts[colIndex][value]
+            return self.rowTexts[colIndex][rowIndex] if textCode == ROW_TEXT else ""
+        return self.values[colIndex][value] if value != MISSING else ""
+
+    def getColumn(self, colIndex, indices=None):
+        """
+        method to get the string values of a column, equal values share one string object (a pool of values for each
+        column), so lines take less memory and comparing equal values is an identity check
+        Attributes:
+            colIndex(int): the index of column
+            indices(list): indices of rows to take, all rows if None
+        Returns:
+            list: string values of column
+        """
+        column = self.columns[colIndex]
+        if self.texts[colIndex] is not None:
+            return self.getNumberTexts(colIndex, column, self.textCodes[colIndex], range(len(column)) if indices is None else indices)
+        if indices is not None:
+            column = [column[index] for index in indices]
+        values = self.values[colIndex] + [""]
+        return [values[code] for code in column]
+
+    def getNumberTexts(self, colIndex, numbers, textCodes, indices, start=0):
+        """
+        method to get the texts of cells of a numeric column, equal numbers written by formatNumber share one string
+        object. zeros are not pooled as 0 and -0 are equal floats with other texts
+        Attributes:
+            colIndex(int): the index of a numeric column
+            numbers(array): the floats of rows of column
+            textCodes(array): the codes of texts of rows of column
+            indices(list): indices of rows in numbers
+            start(int): the index in data set of the first row of numbers
+        Returns:
+            list: texts of rows, "" for missing value
+        """
+        texts, rowTexts, formatNumber, pool, strings = self.texts[colIndex], self.rowTexts[colIndex], self.formatNumber, {}, []
+        for index in indices:
+            value, textCode = numbers[index], textCodes[index]
+            if textCode == NUMBER:
+                text = pool.get(value)
+                if text is None:
+                    text = formatNumber(value)
+                    if value and value == value:
+                        pool[value] = text
+            elif textCode == NUMBER_TEXT:
+                text = texts[value]
+            else:
+                text = rowTexts[start + index] if textCode == ROW_TEXT else ""
+            strings.append(text)
+        return strings
+
+    def getRows(self, indices=None):
+        """
+        method to create lines of strings from columns, equal values in a categorical column share one string object
+        Attributes:
+            indices(list): indices of rows to take, all rows if None
+        Returns:
+            list: list of lines each element is a list
+        """
+        columns = [self.getColumn(colIndex, indices) for colIndex in range(len(self.names))]
+        return [list(row) for row in zip(*columns)]
+
+    def iterChunks(self, indices=None, chunkSize=10000):
+        """
+        generator method to create lines of strings from columns in chunks, only one chunk of lines exists at a time
+        Attributes:
+            indices(list): indices of rows to take, all rows if None
+            chunkSize(int): max number of lines in a chunk
+        Returns:
+            generator: each element is a list of lines
+        """
+        indices = range(len(self)) if indices is None else indices
+        for start in range(0, len(indices), chunkSize):
+            yield self.getRows(indices[start:start + chunkSize])
+
+    def iterRows(self, indices=None, chunkSize=10000):
+        """
+        generator method to create lines of strings from columns, lines are created in chunks
+        Attributes:
+            indices(list): indices of rows to take, all rows if None
+            chunkSize(int): number of lines created at once
+        Returns:
+            generator: each element is a line
+        """
+        return chain.from_iterable(self.iterChunks(indices, chunkSize))
+
+    def countClassValues(self, indices=None):
+        """
+        method to count rows of each class value using class codes
+        Attributes:
+            indices(list): indices of rows to count, all rows if None
+        Returns:
+            list: counts[classCode], rows with missing class are not counted
+        """
+        counts = [0] * len(self.values[self.classIndex])
+        classColumn = self.columns[self.classIndex]
+        for code in (classColumn if indices is None else (classColumn[index] for index in indices)):
+            if code != MISSING:
+                counts[code] += 1
+        return counts
+
+    def countColumnValuesByClass(self, colIndex, indices=None):
+        """
+        method to count rows of each (value, class value) pair of a categorical column using integer codes
+        Attributes:
+            colIndex(int): the index of a categorical column
+            indices(list): indices of rows to count, all rows if None
+        Returns:
+            list: counts[valueCode][classCode], rows with missing value or missing class are not counted
+        """
+        numOfClassValues = len(self.values[self.classIndex])
+        counts = [[0] * numOfClassValues for _ in self.values[colIndex]]
+        column, classColumn = self.columns[colIndex], self.columns[self.classIndex]
+        for index in (range(len(column)) if indices is None else indices):
+            code, classCode = column[index], classColumn[index]
+            if code != MISSING and classCode != MISSING:
+                counts[code][classCode] += 1
+        return counts
+
+    def partitionByColumn(self, colIndex, indices=None):
+        """
+        method to split indices of rows by the value of a categorical column
+        Attributes:
+            colIndex(int): the index of a categorical column
+            indices(list): indices of rows to split, all rows if None
+        Returns:
+            list: partitions[valueCode] an array of row indices, rows with missing value are not in any partition
+        """
+        partitions = [array('l') for _ in self.values[colIndex]]
+        column = self.columns[colIndex]
+        for index in (range(len(column)) if indices is None else indices):
+            code = column[index]
+            if code != MISSING:
+                partitions[code].append(index)
+        return partitions
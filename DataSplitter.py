@@ -0,0 +1,94 @@
+from array import array
+import random
+
+
+class Splitter:
+    """
+    class to split rows of data set into training and test sets by indices. rows are grouped by class value in one pass
+    and each class value is split by the same ratio (stratified split)
+    """
+    def __init__(self, trainRatio=2 / 3, seed=None):
+        """"
+        Ctor for Splitter
+        Attributes:
+            trainRatio(float): part of rows of each class value that goes to training set
+            seed(int): seed for shuffling rows of each class value, None to keep rows in their order
+        """
+        self.trainRatio = trainRatio
+        self.seed = seed
+
+    def groupByClass(self, classColumn, classOrder, seed=None):
+        """
+        method to group indices of rows by class value in one pass
+        Attributes:
+            classColumn(sequence): the class value (or class code) of each row
+            classOrder(list): the class values to group by in the order of groups, rows with other values are skipped
+            seed(int): seed for shuffling indices of each group, None to keep rows order
+        Returns:
+            list: a list of indices list for each class value in class order
+        """
+        groups = {classValue: array('l') for classValue in classOrder}
+        for index, classValue in enumerate(classColumn):
+            group = groups.get(classValue)
+            if group is not None:
+                group.append(index)
+        groups = [groups[classValue] for classValue in classOrder]
+        if seed is not None:
+            shuffler = random.Random(seed)
+            for group in groups:
+                shuffler.shuffle(group)
+        return groups
+
+    def split(self, classColumn, classOrder):
+        """
+        method to split indices of rows to training indices and test indices, the first part of each class value group
+        goes to training set and the rest to test set
+        Attributes:
+            classColumn(sequence): the class value (or class code) of each row
+            classOrder(list): the class values to split by in the order of groups
+        Returns:
+            tuple: (trainingIndices, testIndices) each one is an array of row indices
+        """
+        trainingIndices, testIndices = array('l'), array('l')
+        for group in self.groupByClass(classColumn, classOrder, self.seed):
+            splitIndex = int(len(group) * self.trainRatio + 0.5)
+            trainingIndices += group[:splitIndex]
+            testIndices += group[splitIndex:]
+        return trainingIndices, testIndices
+
+    def kFolds(self, classColumn, classOrder, numOfFolds):
+        """
+        generator method to create stratified k-fold indices, rows of each class value are dealt to folds in turn
+        Attributes:
+            classColumn(sequence): the class value (or class code) of each row
+            classOrder(list): the class values to split by in the order of groups
+            numOfFolds(int): number of folds
+        Returns:
+            generator: each element is (trainingIndices, testIndices) of a fold
+        """
+        folds = [array('l') for _ in range(numOfFolds)]
+        position = 0
+        for group in self.groupByClass(classColumn, classOrder, self.seed):
+            for index in group:
+                folds[position % numOfFolds].append(index)
+                position += 1
+        for foldIndex, fold in enumerate(folds):
+            trainingIndices = array('l')
+            for otherIndex, otherFold in enumerate(folds):
+                if otherIndex != foldIndex:
+                    trainingIndices += otherFold
+            yield trainingIndices, fold
+
+    def repeatedHoldout(self, classColumn, classOrder, numOfRepeats):
+        """
+        generator method to create stratified training and test indices several times, each time with another shuffle
+        Attributes:
+            classColumn(sequence): the class value (or class code) of each row
+            classOrder(list): the class values to split by in the order of groups
+            numOfRepeats(int): number of splits to create
+        Returns:
+            generator: each element is (trainingIndices, testIndices) of a split
+        """
+        seed = self.seed if self.seed is not None else 0
+        for repeat in range(numOfRepeats):
+            yield Splitter(self.trainRatio, seed + repeat).split(classColumn, classOrder)
@@ -109,7 +109,7 @@ class Gui:
         """"
         method to load chosen file path to text field
         """
-        folderPath = filedialog.askopenfilename(initialdir="/", title="Select file", filetypes=(("Csv Files", ".csv"),))
+        folderPath = filedialog.askopenfilename(initialdir="/", title="Select file", filetypes=(("Csv Files", (".csv", ".gz", ".bz2", ".xz")),))
         self.filePathTF.insert(tkinter.END, folderPath)
 
     def loadSavingFolderPath(self):
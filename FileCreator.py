@@ -1,4 +1,5 @@
 import csv
+import json
 
 
 class CreateFile:
@@ -37,3 +38,16 @@ class CreateFile:
         with open(pathToCreateFile + '/' + name + ".txt", "w") as txt_file:
             for row in rows:
                 txt_file.write(row + '\n')
+
+    def createJsonFile(self, data, name, pathToCreateFile):
+        """
+        method to create a json file from data
+        Attributes:
+            pathToCreateFile(string): the path to create inside it a file
+            name(String): the name of the file
+            data(dict) : the data to write
+        Raise:
+            EnvironmentError
+        """
+        with open(pathToCreateFile + '/' + name + ".json", "w") as json_file:
+            json.dump(data, json_file, indent=2)
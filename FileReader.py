@@ -0,0 +1,128 @@
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+
+
+class ReadFile:
+    """ class for opening data files, compressed files are detected by their first bytes and decompressed while reading"""
+    COMPRESSIONS = [(b'\x1f\x8b', gzip.GzipFile), (b'BZh', bz2.BZ2File), (b'\xfd7zXZ\x00', lzma.LZMAFile)]
+
+    def __init__(self):
+        pass
+
+    def getCompression(self, pathOfFile):
+        """
+        method to detect compression of a file by its magic bytes
+        Attributes:
+            pathOfFile(string): the path to the file
+        Returns:
+            class: the file class to decompress file with (gzip.GzipFile, bz2.BZ2File or lzma.LZMAFile), None if file is not compressed
+        Raise:
+            EnvironmentError
+        """
+        with open(pathOfFile, 'rb') as dataFile:
+            start = dataFile.read(6)
+        for magic, fileClass in self.COMPRESSIONS:
+            if start.startswith(magic):
+                return fileClass
+        return None
+
+    def openTextFile(self, pathOfFile):
+        """
+        method to open a file for reading text. a compressed file is decompressed on a reader thread so decompression
+        overlaps with parsing and no uncompressed file is written
+        Attributes:
+            pathOfFile(string): the path to the file
+        Returns:
+            file: text file object
+        Raise:
+            EnvironmentError
+        """
+        fileClass = self.getCompression(pathOfFile)
+        if fileClass is None:
+            return open(pathOfFile)
+        return io.TextIOWrapper(io.BufferedReader(BackgroundReader(fileClass(pathOfFile, 'rb'))))
+
+
+class BackgroundReader(io.RawIOBase):
+    """ class for reading a binary file on a thread, blocks that were read are passed to the reading thread by a queue"""
+    def __init__(self, source, blockSize=1 << 20, maxBlocks=8):
+        """"
+        Ctor for BackgroundReader
+        Attributes:
+            source(file): binary file object to read from
+            blockSize(int): number of bytes to read in each block
+            maxBlocks(int): max number of blocks waiting in queue
+        """
+        super().__init__()
+        self.source = source
+        self.blockSize = blockSize
+        self.blocks = queue.Queue(maxBlocks)
+        self.pending = memoryview(b'')
+        self.finished = False
+        self.error = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.readBlocks, daemon=True)
+        self.thread.start()
+
+    def readBlocks(self):
+        """
+        method of reader thread to read blocks from source until end of file, an error or until reader is closed. an
+        error is passed to the reading thread in the queue
+        """
+        block = True
+        while block and not isinstance(block, Exception) and not self.stopped.is_set():
+            try:
+                block = self.source.read(self.blockSize)
+            except Exception as error:
+                block = error
+            while not self.stopped.is_set():
+                try:
+                    self.blocks.put(block, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        method to read bytes that were read by reader thread into a buffer
+        Attributes:
+            buffer(bytearray): buffer to fill
+        Returns:
+            int: number of bytes read, 0 at end of file
+        Raise:
+            Exception: the error of reader thread, on every read after reader thread failed
+        """
+        if self.error is not None:
+            raise self.error
+        if not self.pending:
+            if self.finished:
+                return 0
+            block = self.blocks.get()
+            if isinstance(block, Exception):
+                self.error = block
+                raise block
+            if not block:
+                self.finished = True
+                return 0
+            self.pending = memoryview(block)
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def close(self):
+        """
+        method to stop reader thread and close source file
+        """
+        if not self.closed:
+            self.stopped.set()
+            self.thread.join()
+            self.source.close()
+        super().close()
@@ -1,3 +1,5 @@
+from array import array
+from bisect import bisect_right
 from math import log2
 
 
@@ -24,7 +26,7 @@ class MiningCalculator:
             entropy += (-1) * (p * log2(p)) if p > 0 else 0
         return round(entropy, 3)
 
-    def calcEntropyBySplitValue(self, data, structure, colName, splitVal):
+    def calcEntropyBySplitValue(self, data, structure, colName, splitVal, values=None):
         """
         method to calculate entropy of class in data set if we split it by a numeric split value
         Attributes:
@@ -34,19 +36,21 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': ["Numeric"]
             colName(String): the name of column to split data
             splitVal(float): the number to split data
+            values(list): floats of column for each row of data parsed once, None to parse them from data
         Returns:
             float: the entropy of splitting data by numeric split value
         """
         colIndex, entropy = structure[colName]['index'], 0
-        newDataBellowSplit = list(filter(lambda y: float(y[colIndex]) <= splitVal, data))
-        newDataAboveSplit = list(filter(lambda y: float(y[colIndex]) > splitVal, data))
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        newDataBellowSplit = [row for row, value in zip(data, values) if value <= splitVal]
+        newDataAboveSplit = [row for row, value in zip(data, values) if value > splitVal]
         entropyOfNewDataBellowSplit = self.calcDataEntropy(newDataBellowSplit, structure)
         entropyOfNewAboveSplit = self.calcDataEntropy(newDataAboveSplit, structure)
         entropy += (len(newDataBellowSplit) / len(data)) * entropyOfNewDataBellowSplit
         entropy += (len(newDataAboveSplit) / len(data)) * entropyOfNewAboveSplit
         return round(entropy, 3)
 
-    def calcInfoGainBySplitValue(self, data, structure, colName, splitVal):
+    def calcInfoGainBySplitValue(self, data, structure, colName, splitVal, values=None):
         """
         method to calculate info-gain of splitting data by a a
         Attributes:
@@ -55,14 +59,16 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
             colName(String): the name of column to split data
+            splitVal(float): the number to split data
+            values(list): floats of column for each row of data parsed once, None to parse them from data
         Returns:
             float: the info-gain of class in data set after splitting data by column
         """
-        result = self.calcDataEntropy(data, structure) - self.calcEntropyBySplitValue(data, structure, colName, splitVal)
+        result = self.calcDataEntropy(data, structure) - self.calcEntropyBySplitValue(data, structure, colName, splitVal, values)
         result = 0 if result < 0 else result
         return round(result, 3)
 
-    def findBestSplitInDataByInfoGain(self, data, structure, colName):
+    def findBestSplitInDataByInfoGain(self, data, structure, colName, values=None, classCodes=None):
         """
         method to find best split in the data by info-gain
         Attributes:
@@ -71,13 +77,18 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
             colName(String): the name of column to find splits of data
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             list: best split in the data by info-gain and its info gain value example - [split, infoGain]
         """
         colIndex, maxInfoGain, bestSplit = structure[colName]['index'], 0, []
-        for i in range(0, len(data)-1):
-            split = (float(data[i][colIndex]) + float(data[i+1][colIndex])) / 2
-            infoGain = self.calcInfoGainBySplitValue(data, structure, colName, split)
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        classCodes = classCodes if classCodes is not None else self.getClassCodesOfRows(data, structure)
+        dataEntropy = self.calcEntropyOfCounts(self.calcClassCountsOfCodes(classCodes, len(structure['class']['values'])), len(values))
+        for split, infoGain in self.sweepSplitsByCounts(data, structure, values,
+                                                        lambda *counts: self.calcInfoGainOfSplitCounts(dataEntropy, *counts), classCodes):
             if infoGain >= maxInfoGain:
                 bestSplit = [split, infoGain]
                 maxInfoGain = infoGain
@@ -137,7 +148,8 @@ class MiningCalculator:
                 bestSplit = colName
         return bestSplit
 
-    def fillBestSplitsInDataByInfoGainIntoDict(self, data, structure, colName, numOfSplits, splitsList, indexToInsert):
+    def fillBestSplitsInDataByInfoGainIntoDict(self, data, structure, colName, numOfSplits, splitsList, indexToInsert, values=None,
+                                               classCodes=None):
         """
         recursive method to fill a list with best splits in the data by info-gain
         Attributes:
@@ -149,14 +161,19 @@ class MiningCalculator:
             numOfSplits(int): number of splits to find
             splitsList(list): list to fill splits in it
             indexToInsert(int): an index to insert the splits in dict to keep splits order in recursive method
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             dict: dict of number of split (when it Happens) and value of list of
             best split in the data by info-gain and its info gain value example - {split number: [[split, infoGain],[split, infoGain]]
         """
-        if len(data) <= 0 or numOfSplits <= 0:
+        if len(data if values is None else values) <= 0 or numOfSplits <= 0:
             return []
         colIndex = structure[colName]['index']
-        split = self.findBestSplitInDataByInfoGain(data, structure, colName)
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        classCodes = classCodes if classCodes is not None else self.getClassCodesOfRows(data, structure)
+        split = self.findBestSplitInDataByInfoGain(data, structure, colName, values, classCodes)
         if str(indexToInsert) in splitsList:
             splitsList[str(indexToInsert)] += [split]
         else:
@@ -164,12 +181,13 @@ class MiningCalculator:
         indexToInsert, numOfSplits = indexToInsert + 1, numOfSplits - 1
 
         if split:
-            newDataBellowSplit = list(filter(lambda y: float(y[colIndex]) <= split[0], data))
-            newDataAboveSplit = list(filter(lambda y: float(y[colIndex]) > split[0], data))
-            self.fillBestSplitsInDataByInfoGainIntoDict(newDataBellowSplit, structure, colName, numOfSplits, splitsList, indexToInsert)
-            self.fillBestSplitsInDataByInfoGainIntoDict(newDataAboveSplit, structure, colName, numOfSplits, splitsList, indexToInsert)
+            (codesBellowSplit, valuesBellowSplit), (codesAboveSplit, valuesAboveSplit) = self.splitByValue(classCodes, values, split[0])
+            self.fillBestSplitsInDataByInfoGainIntoDict(None, structure, colName, numOfSplits, splitsList, indexToInsert,
+                                                        valuesBellowSplit, codesBellowSplit)
+            self.fillBestSplitsInDataByInfoGainIntoDict(None, structure, colName, numOfSplits, splitsList, indexToInsert,
+                                                        valuesAboveSplit, codesAboveSplit)
 
-    def getBestSplitsInDataByInfoGain(self, data, structure, colName, numOfSplits):
+    def getBestSplitsInDataByInfoGain(self, data, structure, colName, numOfSplits, values=None, classCodes=None):
         """
         method to get a list with best splits in the data by info-gain
         Attributes:
@@ -179,11 +197,14 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': ["Numeric"]
             colName(String): the name of column to find splits of data
             numOfSplits(int): number of splits to find
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             list: best splits in the data by info-gain ordered by best split to take, example - [splitOne, splitTwo, SplitThree...]
         """
         splitsList, newSplitsList = {}, []
-        self.fillBestSplitsInDataByInfoGainIntoDict(data, structure, colName, numOfSplits, splitsList, 0)
+        self.fillBestSplitsInDataByInfoGainIntoDict(data, structure, colName, numOfSplits, splitsList, 0, values, classCodes)
         for lists in list(splitsList.values())[1:]:
             while len(lists) > 0:
                 splitOne, splitTwo = [], []
@@ -226,7 +247,7 @@ class MiningCalculator:
             result -= (p*p)
         return round(result, 3)
 
-    def calcGiniSplitBySplitValue(self, data, structure, colIndex, splitValue):
+    def calcGiniSplitBySplitValue(self, data, structure, colIndex, splitValue, values=None):
         """
         method to calculate gini of class in data set if we split it by a numeric split value
         Attributes:
@@ -236,16 +257,18 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': ["Numeric"]
             colIndex(String): the index of column to split data
             splitValue(float): the number to split data
+            values(list): floats of column for each row of data parsed once, None to parse them from data
         Returns:
             float: the gini of splitting data by numeric split value
         """
-        dataBellow = list(filter(lambda x: float(x[colIndex]) <= splitValue, data))
-        dataAbove = list(filter(lambda x: float(x[colIndex]) > splitValue, data))
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        dataBellow = [row for row, value in zip(data, values) if value <= splitValue]
+        dataAbove = [row for row, value in zip(data, values) if value > splitValue]
         giniSplit = (len(dataBellow) / len(data)) * self.calcDataGini(dataBellow, structure) +\
                     (len(dataAbove) / len(data)) * self.calcDataGini(dataAbove, structure)
         return round(giniSplit, 3)
 
-    def findBestValueSplitByGini(self, data, structure, colIndex):
+    def findBestValueSplitByGini(self, data, structure, colIndex, values=None, classCodes=None):
         """
         method to find best split in the data by Gini
         Attributes:
@@ -254,19 +277,22 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': [values]} or
                             columnName : {'index': index , 'values': ["Numeric"]
             colIndex(String): the index of column to find splits of data
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             list: best split in the data by Gini and its Gini value example - [split, Gini]
         """
         minGini, bestSplit = 1, []
-        for i in range(0, len(data)-1):
-            split = (float(data[i][colIndex]) + float(data[i+1][colIndex])) / 2
-            giniSplit = self.calcGiniSplitBySplitValue(data, structure, colIndex, split)
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        for split, giniSplit in self.sweepSplitsByCounts(data, structure, values, self.calcGiniSplitOfSplitCounts, classCodes):
             if giniSplit <= minGini:
                 minGini = giniSplit
                 bestSplit = [split, giniSplit]
         return bestSplit
 
-    def fillDictWithBestValueSplitsOfDataByGini(self, data, structure, colIndex, numOfSplits, splitsList, indexToInsert):
+    def fillDictWithBestValueSplitsOfDataByGini(self, data, structure, colIndex, numOfSplits, splitsList, indexToInsert, values=None,
+                                                classCodes=None):
         """
         recursive method to fill a Dict with best splits in the data by Gini
         Attributes:
@@ -278,13 +304,18 @@ class MiningCalculator:
             numOfSplits(int): number of splits to find
             splitsList(list): list to fill splits in it
             indexToInsert(int): an index to insert the splits in dict to keep splits order in recursive method
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             dict: dict of number of split (when it Happens) and value of list of
             best split in the data by Gini and its Gini value example - {split number: [[split, Gini],[split, Gini]]
         """
-        if len(data) <= 0 or numOfSplits <= 0:
+        if len(data if values is None else values) <= 0 or numOfSplits <= 0:
             return []
-        split = self.findBestValueSplitByGini(data, structure, colIndex)
+        values = values if values is not None else self.parseColumn(data, colIndex)
+        classCodes = classCodes if classCodes is not None else self.getClassCodesOfRows(data, structure)
+        split = self.findBestValueSplitByGini(data, structure, colIndex, values, classCodes)
         if str(indexToInsert) in splitsList:
             splitsList[str(indexToInsert)] += [split]
         else:
@@ -292,12 +323,13 @@ class MiningCalculator:
         indexToInsert, numOfSplits = indexToInsert + 1, numOfSplits - 1
 
         if split:
-            newDataBellowSplit = list(filter(lambda y: float(y[colIndex]) <= split[0], data))
-            newDataAboveSplit = list(filter(lambda y: float(y[colIndex]) > split[0], data))
-            self.fillDictWithBestValueSplitsOfDataByGini(newDataBellowSplit, structure, colIndex, numOfSplits, splitsList, indexToInsert)
-            self.fillDictWithBestValueSplitsOfDataByGini(newDataAboveSplit, structure, colIndex, numOfSplits, splitsList, indexToInsert)
+            (codesBellowSplit, valuesBellowSplit), (codesAboveSplit, valuesAboveSplit) = self.splitByValue(classCodes, values, split[0])
+            self.fillDictWithBestValueSplitsOfDataByGini(None, structure, colIndex, numOfSplits, splitsList, indexToInsert,
+                                                         valuesBellowSplit, codesBellowSplit)
+            self.fillDictWithBestValueSplitsOfDataByGini(None, structure, colIndex, numOfSplits, splitsList, indexToInsert,
+                                                         valuesAboveSplit, codesAboveSplit)
 
-    def getListWithBestValueSplitsOfDataByGini(self, data, structure, colIndex, numOfSplits):
+    def getListWithBestValueSplitsOfDataByGini(self, data, structure, colIndex, numOfSplits, values=None, classCodes=None):
         """
         method to get a list with best splits in the data by Gini
         Attributes:
@@ -307,11 +339,14 @@ class MiningCalculator:
                             columnName : {'index': index , 'values': ["Numeric"]
             colIndex(String): the index of column to find splits of data
             numOfSplits(int): number of splits to find
+            values(list): floats of column for each row of data parsed once, None to parse them from data
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
         Returns:
             list: best splits in the data by Gini ordered by best split to take, example - [splitOne, splitTwo, SplitThree...]
         """
         splitsList, newSplitsList = {}, []
-        self.fillDictWithBestValueSplitsOfDataByGini(data, structure, colIndex, numOfSplits, splitsList, 0)
+        self.fillDictWithBestValueSplitsOfDataByGini(data, structure, colIndex, numOfSplits, splitsList, 0, values, classCodes)
         for lists in list(splitsList.values())[1:]:
             while len(lists) > 0:
                 splitOne, splitTwo = [], []
@@ -413,6 +448,118 @@ class MiningCalculator:
                 bestSplit = colName
         return bestSplit
 
+    # calculations on numeric columns parsed once
+    def parseColumn(self, data, colIndex):
+        """
+        method to parse the values of a numeric column of rows into floats once, so split routines compare floats
+        instead of calling float for each row and each split value
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            colIndex(int): the index of a numeric column
+        Returns:
+            array: float of column for each row
+        """
+        return array('d', [float(row[colIndex]) for row in data])
+
+    def splitByValue(self, data, values, splitVal):
+        """
+        method to split rows and their parsed values of a numeric column by a split value. rows sorted by column are
+        split by slicing them, so both parts keep the sorted order and are not filtered or sorted again
+        Attributes:
+            data(list) : list of lines in files each element is a list, or an item of each row (for example its class code)
+            values(list): float of column for each row of data
+            splitVal(float): the number to split data
+        Returns:
+            tuple: ((rows, values) bellow or equal split value, (rows, values) above split value)
+        """
+        if self.isSortedColumn(values):
+            position = bisect_right(values, splitVal)
+            return (data[:position], values[:position]), (data[position:], values[position:])
+        bellow, above = ([], array('d')), ([], array('d'))
+        for row, value in zip(data, values):
+            part = bellow if value <= splitVal else above
+            part[0].append(row)
+            part[1].append(value)
+        return bellow, above
+
+    def sweepSplitsByCounts(self, data, structure, values, calcSplitOfCountsFunc, classCodes=None):
+        """
+        method to evaluate the splits between each two following rows of data, as a loop over calcInfoGainBySplitValue
+        or calcGiniSplitBySplitValue would, in one sweep over rows sorted by column. counts of class values bellow a split
+        are kept while sweeping and a split is only evaluated at distinct values, splits that divide rows the same way
+        (following rows with equal values) share the result
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+            values(list): float of column for each row of data
+            calcSplitOfCountsFunc(function): function of (bellowCounts, numOfBellowRows, aboveCounts, numOfAboveRows)
+            that evaluates a split by counts of class values in the order of class values in structure
+            classCodes(array): position of class value in structure of each row of data, -1 for a missing class value,
+            None to find them from data
+        Returns:
+            generator: (split, result of calcSplitOfCountsFunc) for each two following rows of data in order of data
+        """
+        numOfClassValues = len(structure['class']['values'])
+        classCodes = classCodes if classCodes is not None else self.getClassCodesOfRows(data, structure)
+        if self.isSortedColumn(values):
+            order = range(len(values))
+        else:
+            order = sorted(range(len(values)), key=values.__getitem__)
+        sortedValues = [values[i] for i in order]
+        classCounts, bellowCounts, results = self.calcClassCountsOfCodes(classCodes, numOfClassValues), [0] * numOfClassValues, {}
+        for numOfBellowRows, i in enumerate(order, 1):
+            if classCodes[i] >= 0:
+                bellowCounts[classCodes[i]] += 1
+            if numOfBellowRows == len(order) or sortedValues[numOfBellowRows] != sortedValues[numOfBellowRows - 1]:
+                aboveCounts = [count - bellowCount for count, bellowCount in zip(classCounts, bellowCounts)]
+                results[numOfBellowRows] = calcSplitOfCountsFunc(list(bellowCounts), numOfBellowRows, aboveCounts,
+                                                                 len(order) - numOfBellowRows)
+        for i in range(0, len(values)-1):
+            split = (values[i] + values[i+1]) / 2
+            yield split, results[bisect_right(sortedValues, split)]
+
+    def isSortedColumn(self, values):
+        """
+        method to check if parsed values of a column are in ascending order
+        Attributes:
+            values(list): float of column for each row
+        Returns:
+            boolean: True if each value is bellow or equal to the value after it
+        """
+        return all(values[i] <= values[i+1] for i in range(len(values) - 1))
+
+    def getClassCodesOfRows(self, data, structure):
+        """
+        method to get the position of class value of each row in class values of structure
+        Attributes:
+            data(list) : list of lines in files each element is a list
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            array: position of class value of each row, -1 for a missing class value or a value that is not in structure
+        """
+        classIndex = structure['class']['index']
+        positions = {value: position for position, value in enumerate(structure['class']['values'])}
+        return array('i', (positions.get(row[classIndex], -1) for row in data))
+
+    def calcClassCountsOfCodes(self, classCodes, numOfClassValues):
+        """
+        method to count rows of each class value from positions of their class values
+        Attributes:
+            classCodes(array): position of class value of each row, -1 for a missing class value
+            numOfClassValues(int): number of class values
+        Returns:
+            list: number of rows of each class value in the order of class values
+        """
+        classCounts = [0] * numOfClassValues
+        for code in classCodes:
+            if code >= 0:
+                classCounts[code] += 1
+        return classCounts
+
     def removeDuplicatesInList(self, data):
         """
         method to remove duplicates from list
@@ -483,6 +630,388 @@ class MiningCalculator:
                 maxCount = len(newData)
         return maxCount
 
+    # calculations by counts, used to build a classifier from counts of a columnar data set instead of lines
+    def calcEntropyOfCounts(self, classCounts, numOfRows):
+        """
+        method to calculate entropy of class from counts of class values as in calcDataEntropy
+        Attributes:
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            float: the entropy of class
+        """
+        entropy = 0
+        for count in classCounts:
+            p = count / numOfRows if numOfRows > 0 else 1
+            entropy += (-1) * (p * log2(p)) if p > 0 else 0
+        return round(entropy, 3)
+
+    def calcInfoGainOfCounts(self, valueCounts, classCounts, numOfRows):
+        """
+        method to calculate info-gain of splitting rows by column from counts as in calcInfoGainByColumnSplit
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            float: the info-gain of class after splitting rows by column
+        """
+        entropy = 0
+        for counts in valueCounts:
+            entropy += (sum(counts) / numOfRows) * self.calcEntropyOfCounts(counts, sum(counts))
+        result = self.calcEntropyOfCounts(classCounts, numOfRows) - round(entropy, 3)
+        result = 0 if result < 0 else result
+        return round(result, 3)
+
+    def calcInfoGainOfSplitCounts(self, dataEntropy, bellowCounts, numOfBellowRows, aboveCounts, numOfAboveRows):
+        """
+        method to calculate info-gain of splitting rows by a numeric split value from counts as in calcInfoGainBySplitValue
+        Attributes:
+            dataEntropy(float): the entropy of class in all rows
+            bellowCounts(list): number of rows bellow or equal split value of each class value
+            numOfBellowRows(int): number of rows bellow or equal split value
+            aboveCounts(list): number of rows above split value of each class value
+            numOfAboveRows(int): number of rows above split value
+        Returns:
+            float: the info-gain of splitting rows by split value
+        """
+        numOfRows, entropy = numOfBellowRows + numOfAboveRows, 0
+        entropy += (numOfBellowRows / numOfRows) * self.calcEntropyOfCounts(bellowCounts, numOfBellowRows)
+        entropy += (numOfAboveRows / numOfRows) * self.calcEntropyOfCounts(aboveCounts, numOfAboveRows)
+        result = dataEntropy - round(entropy, 3)
+        result = 0 if result < 0 else result
+        return round(result, 3)
+
+    def findBestColumnSplitByInfoGainOfCounts(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows by Info Gain from counts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            String: the column best to split rows by Info Gain
+        """
+        maxInfoGain, bestSplit = 0, None
+        for colName, valueCounts in countsByColumn.items():
+            infoGain = self.calcInfoGainOfCounts(valueCounts, classCounts, numOfRows)
+            if infoGain >= maxInfoGain:
+                maxInfoGain = infoGain
+                bestSplit = colName
+        return bestSplit
+
+    def calcGiniOfCounts(self, classCounts, numOfRows):
+        """
+        method to calculate gini of class from counts of class values as in calcDataGini
+        Attributes:
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            float: the gini of class
+        """
+        result = 1
+        for count in classCounts:
+            p = count / numOfRows if numOfRows > 0 else 1
+            result -= (p*p)
+        return round(result, 3)
+
+    def calcGiniSplitOfCounts(self, valueCounts, numOfRows):
+        """
+        method to calculate gini of splitting rows by column from counts as in calcGiniSplitByColumn
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            numOfRows(int): number of rows
+        Returns:
+            float: the gini of splitting rows by column
+        """
+        giniSplit = 0
+        for counts in valueCounts:
+            p = sum(counts) / numOfRows
+            giniSplit += self.calcGiniOfCounts(counts, sum(counts)) * p
+        return round(giniSplit, 3)
+
+    def calcGiniSplitOfSplitCounts(self, bellowCounts, numOfBellowRows, aboveCounts, numOfAboveRows):
+        """
+        method to calculate gini of splitting rows by a numeric split value from counts as in calcGiniSplitBySplitValue
+        Attributes:
+            bellowCounts(list): number of rows bellow or equal split value of each class value
+            numOfBellowRows(int): number of rows bellow or equal split value
+            aboveCounts(list): number of rows above split value of each class value
+            numOfAboveRows(int): number of rows above split value
+        Returns:
+            float: the gini of splitting rows by split value
+        """
+        numOfRows = numOfBellowRows + numOfAboveRows
+        giniSplit = (numOfBellowRows / numOfRows) * self.calcGiniOfCounts(bellowCounts, numOfBellowRows) +\
+                    (numOfAboveRows / numOfRows) * self.calcGiniOfCounts(aboveCounts, numOfAboveRows)
+        return round(giniSplit, 3)
+
+    def findBestColumnSplitByGiniOfCounts(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows by gini from counts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            String: the column best to split rows by gini
+        """
+        minGini, bestSplit = 1, None
+        for colName, valueCounts in countsByColumn.items():
+            giniSplit = self.calcGiniSplitOfCounts(valueCounts, numOfRows)
+            if giniSplit <= minGini:
+                minGini = giniSplit
+                bestSplit = colName
+        return bestSplit
+
+    def calcGainRatioOfCounts(self, valueCounts, classCounts, numOfRows):
+        """
+        method to calculate GainRatio of splitting rows by column from counts as in calcGainRatioSplitByColumn
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            float: the GainRatio of splitting rows by column
+        """
+        splitInfo = 0
+        for counts in valueCounts:
+            p = sum(counts) / numOfRows if sum(counts) != 0 else 1
+            splitInfo += (-1) * p * log2(p)
+        splitInfo = 1 if splitInfo == 0 else splitInfo
+        return round(self.calcInfoGainOfCounts(valueCounts, classCounts, numOfRows) / splitInfo, 3)
+
+    def findBestColumnSplitByGainRatioOfCounts(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows by GainRatio from counts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(int): number of rows
+        Returns:
+            String: the column best to split rows by GainRatio
+        """
+        maxGainRatio, bestSplit = 0, None
+        for colName, valueCounts in countsByColumn.items():
+            GainRatio = self.calcGainRatioOfCounts(valueCounts, classCounts, numOfRows)
+            if GainRatio >= maxGainRatio:
+                maxGainRatio = GainRatio
+                bestSplit = colName
+        return bestSplit
+
+    # calculations by counts of rows with missing values (C4.5), counts of a column are of rows with a value in column
+    def calcKnownClassCounts(self, valueCounts):
+        """
+        method to calculate number of rows of each class value that have a value in column
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+        Returns:
+            list: number of rows with a value in column of each class value
+        """
+        return [sum(counts) for counts in zip(*valueCounts)]
+
+    def calcInfoGainWithMissingValues(self, valueCounts, classCounts, numOfRows):
+        """
+        method to calculate info-gain of splitting rows by column with missing values, the info-gain of rows with a
+        value in column times the part of rows with a value in column
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            float: the info-gain of class after splitting rows by column
+        """
+        knownClassCounts = self.calcKnownClassCounts(valueCounts)
+        numOfKnownRows = sum(knownClassCounts)
+        if numOfKnownRows == 0:
+            return 0
+        return round((numOfKnownRows / numOfRows) * self.calcInfoGainOfCounts(valueCounts, knownClassCounts, numOfKnownRows), 3)
+
+    def findBestColumnSplitByInfoGainWithMissingValues(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows with missing values by Info Gain from counts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            String: the column best to split rows by Info Gain
+        """
+        maxInfoGain, bestSplit = 0, None
+        for colName, valueCounts in countsByColumn.items():
+            infoGain = self.calcInfoGainWithMissingValues(valueCounts, classCounts, numOfRows)
+            if infoGain >= maxInfoGain:
+                maxInfoGain = infoGain
+                bestSplit = colName
+        return bestSplit
+
+    def calcGiniGainWithMissingValues(self, valueCounts, classCounts, numOfRows):
+        """
+        method to calculate the decrease in gini of splitting rows by column with missing values, the decrease of rows
+        with a value in column times the part of rows with a value in column
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            float: the decrease in gini after splitting rows by column
+        """
+        knownClassCounts = self.calcKnownClassCounts(valueCounts)
+        numOfKnownRows = sum(knownClassCounts)
+        if numOfKnownRows == 0:
+            return 0
+        giniGain = self.calcGiniOfCounts(knownClassCounts, numOfKnownRows) - self.calcGiniSplitOfCounts(valueCounts, numOfKnownRows)
+        return round((numOfKnownRows / numOfRows) * max(giniGain, 0), 3)
+
+    def findBestColumnSplitByGiniWithMissingValues(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows with missing values by gini from counts, without missing values it is
+        the column with the lowest gini split as in findBestColumnSplitByGiniOfCounts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            String: the column best to split rows by gini
+        """
+        maxGiniGain, bestSplit = 0, None
+        for colName, valueCounts in countsByColumn.items():
+            giniGain = self.calcGiniGainWithMissingValues(valueCounts, classCounts, numOfRows)
+            if giniGain >= maxGiniGain:
+                maxGiniGain = giniGain
+                bestSplit = colName
+        return bestSplit
+
+    def calcGainRatioWithMissingValues(self, valueCounts, classCounts, numOfRows):
+        """
+        method to calculate GainRatio of splitting rows by column with missing values, the GainRatio of rows with a
+        value in column times the part of rows with a value in column
+        Attributes:
+            valueCounts(list): for each value of column in the order of structure, number of rows of each class value
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            float: the GainRatio of splitting rows by column
+        """
+        knownClassCounts = self.calcKnownClassCounts(valueCounts)
+        numOfKnownRows = sum(knownClassCounts)
+        if numOfKnownRows == 0:
+            return 0
+        return round((numOfKnownRows / numOfRows) * self.calcGainRatioOfCounts(valueCounts, knownClassCounts, numOfKnownRows), 3)
+
+    def findBestColumnSplitByGainRatioWithMissingValues(self, countsByColumn, classCounts, numOfRows):
+        """
+        method to find best column to split rows with missing values by GainRatio from counts
+        Attributes:
+            countsByColumn(dict): columnName : valueCounts in the order of structure columns
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            numOfRows(float): number of rows, rows can be fractions
+        Returns:
+            String: the column best to split rows by GainRatio
+        """
+        maxGainRatio, bestSplit = 0, None
+        for colName, valueCounts in countsByColumn.items():
+            GainRatio = self.calcGainRatioWithMissingValues(valueCounts, classCounts, numOfRows)
+            if GainRatio >= maxGainRatio:
+                maxGainRatio = GainRatio
+                bestSplit = colName
+        return bestSplit
+
+    # calculations by weighted rows, each element of weighted data is (row, weight) for example identical rows collapsed
+    def calcCountsOfWeightedRows(self, weightedData, structure):
+        """
+        method to count weighted rows by class value and by (value, class value) of each column in one pass, rows with
+        a missing value in a column or a value that is not in structure are not counted in that column
+        Attributes:
+            weightedData(list): (row, weight) of rows
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            tuple: (classCounts, countsByColumn) classCounts is weight of each class value in the order of class values in
+            structure, countsByColumn is columnName : for each value of column the weight of each class value
+        """
+        classIndex = structure['class']['index']
+        classCodes = {value: code for code, value in enumerate(structure['class']['values'])}
+        columns = [(colName, structure[colName]['index'], {value: code for code, value in enumerate(structure[colName]['values'])})
+                   for colName in list(structure.keys())[:-1]]
+        classCounts = [0] * len(classCodes)
+        countsByColumn = {colName: [[0] * len(classCodes) for _ in valueCodes] for colName, _, valueCodes in columns}
+        for row, weight in weightedData:
+            classCode = classCodes[row[classIndex]]
+            classCounts[classCode] += weight
+            for colName, colIndex, valueCodes in columns:
+                code = valueCodes.get(row[colIndex])
+                if code is not None:
+                    countsByColumn[colName][code][classCode] += weight
+        return classCounts, countsByColumn
+
+    def calcProbabilitiesOfWeightedRows(self, weightedData, colIndex, values, classValues):
+        """
+        method calculate p(xi|ci) with laplace correction of each value and class value of a column from weighted rows
+        in one pass, as in calcProbabilityOfValGivenClassWithLaplaceCorrection
+        Attributes:
+            weightedData(list): (row, weight) of rows
+            colIndex(int) : the column index
+            values(list): values of column
+            classValues(list): values of class
+        Returns:
+            dict: (xi, ci) : p(xi|ci) with laplace correction
+        """
+        counts, numOfRows = {}, 0
+        for row, weight in weightedData:
+            if row[colIndex] != "":
+                key = (row[colIndex], row[len(row)-1])
+                counts[key] = counts.get(key, 0) + weight
+                numOfRows += weight
+        return {(value, classValue): round((counts.get((value, classValue), 0) + 1) / (numOfRows + len(values)), 3) if weightedData else 0
+                for value in values for classValue in classValues}
+
+    def calcProbabilitiesOfCounts(self, valueCounts, numOfValueRows, numOfRows):
+        """
+        method calculate p(xi|ci) with laplace correction of each value and class value of a column from counts of
+        (value, class value), as in calcProbabilityOfValGivenClassWithLaplaceCorrection
+        Attributes:
+            valueCounts(list): for each value of column the number of rows of each class value
+            numOfValueRows(int): number of rows with a value in column
+            numOfRows(int): number of rows
+        Returns:
+            list: for each value of column p(xi|ci) with laplace correction of each class value
+        """
+        return [[round((count + 1) / (numOfValueRows + len(valueCounts)), 3) if numOfRows > 0 else 0 for count in counts]
+                for counts in valueCounts]
+
+    def calcProbabilityOfClassValueOfCounts(self, classCount, numOfRows, numberOfClassValues):
+        """
+        method calculate p(ci) with laplace correction from counts, as in calcProbabilityOfClassValueWithLaplaceCorrection
+        Attributes:
+            classCount(int): number of rows with class value ci
+            numOfRows(int): number of rows
+            numberOfClassValues(int): number of different class values
+        Returns:
+            float: p(ci) with laplace correction
+        """
+        probability = (classCount + 1) / (numOfRows + numberOfClassValues) if numOfRows > 0 else 0
+        return round(probability, 3)
+
+    def mostCommonClassAttributeOfCounts(self, classCounts, structure):
+        """
+        method to find most common attribute in class column from counts of class values
+        Attributes:
+            classCounts(list): number of rows of each class value in the order of class values in structure
+            structure(dict): the structure of data set returns {} if data set is empty, each element is
+                            columnName : {'index': index , 'values': [values]} or
+                            columnName : {'index': index , 'values': ["Numeric"]
+        Returns:
+            String: most common attribute in class column
+        """
+        maxCount, mostCommonClassAttribute = 0, None
+        for value, count in zip(structure['class']['values'], classCounts):
+            if count >= maxCount:
+                maxCount = count
+                mostCommonClassAttribute = value
+        return mostCommonClassAttribute
+
     def getSplitFunc(self, splitType):
         """
         method to get a column split function by string
@@ -499,9 +1028,42 @@ class MiningCalculator:
             return self.findBestColumnSplitByGini
         return None
 
+    def getCountsSplitFunc(self, splitType):
+        """
+        method to get a column split function that works on counts by string
+        Attributes:
+            splitType(list) : split function name
+        Returns:
+            function: split function by string
+        """
+        if splitType.upper() == "INFO GAIN":
+            return self.findBestColumnSplitByInfoGainOfCounts
+        elif splitType.upper() == "GAIN RATIO":
+            return self.findBestColumnSplitByGainRatioOfCounts
+        elif splitType.upper() == "GINI INDEX":
+            return self.findBestColumnSplitByGiniOfCounts
+        return None
+
+    def getMissingValuesSplitFunc(self, splitType):
+        """
+        method to get a column split function that works on counts of rows with missing values by string
+        Attributes:
+            splitType(list) : split function name
+        Returns:
+            function: split function by string
+        """
+        if splitType.upper() == "INFO GAIN":
+            return self.findBestColumnSplitByInfoGainWithMissingValues
+        elif splitType.upper() == "GAIN RATIO":
+            return self.findBestColumnSplitByGainRatioWithMissingValues
+        elif splitType.upper() == "GINI INDEX":
+            return self.findBestColumnSplitByGiniWithMissingValues
+        return None
+
     def calcProbabilityOfValGivenClassWithLaplaceCorrection(self, data, colIndex, val, classVal, numberOfValInColumn):
         """
-        method calculate p(xi|ci) with laplace correction where xi is a value in column and ci is a class value
+        method calculate p(xi|ci) with laplace correction where xi is a value in column and ci is a class value, rows
+        with a missing value in column are not counted
         Attributes:
             data(list) : list of rows in file
             colIndex(int) : the column index
@@ -512,7 +1074,8 @@ class MiningCalculator:
             float: p(xi|xi) with laplace correction
         """
         newData = list(filter(lambda x: x[colIndex] == val and x[len(x)-1] == classVal, data))
-        probability = (len(newData) + 1) / (len(data) + numberOfValInColumn) if len(data) > 0 else 0
+        numOfRows = sum(1 for row in data if row[colIndex] != "")
+        probability = (len(newData) + 1) / (numOfRows + numberOfValInColumn) if len(data) > 0 else 0
         return round(probability, 3)
 
     def calcProbabilityOfClassValueWithLaplaceCorrection(self, data, classVal, numberOfClassValues):
@@ -1,15 +1,27 @@
+from DataCache import DataCache
 from DataClassifier import Classifier
 from DataCleaner import Cleaner
 from DataDiscretization import Discretization
+from DataDiscretizer import Discretizer
+from DataImputer import Imputer
 from DataLoader import Loader
-from MiningCalculations import MiningCalculator
+from DataSchema import Schema
 from FileCreator import CreateFile
+from FileReader import ReadFile
+import csv
+import os
 
 
 class BuildClassifierProcess:
     """ class for building a clasiifier and doing all needed processes (cleaning, discretization and more)"""
     def __init__(self):
-        pass
+        self.cacheFolderPath = None
+        self.parsingProcesses = None
+        self.schemaFilePath = None
+        self.memoryBudget = None
+        self.cleaningProcesses = None
+        self.keepMissingValues = False
+        self.compactRows = False
 
     def setClassifierType(self, classifierType):
         """
@@ -77,42 +89,105 @@ class BuildClassifierProcess:
         self.savingFolderPath = savingFolderPath
         return self
 
+    def setCacheFolderPath(self, cacheFolderPath):
+        """
+        method to set folder path of parsed data sets cache for process, data sets are not cached unless it is set
+        Attributes:
+            cacheFolderPath(String) : folder path for cache files, None for no caching
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.cacheFolderPath = cacheFolderPath
+        return self
+
+    def setParsingProcesses(self, parsingProcesses):
+        """
+        method to set number of worker processes for parsing csv file in process
+        Attributes:
+            parsingProcesses(int) : number of worker processes, None for parsing in one process
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.parsingProcesses = parsingProcesses
+        return self
+
+    def setSchemaFilePath(self, schemaFilePath):
+        """
+        method to set path of a json schema file of the csv file for process
+        Attributes:
+            schemaFilePath(String) : path of schema file, None for inferring column types and values
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.schemaFilePath = schemaFilePath
+        return self
+
+    def setMemoryBudget(self, memoryBudget):
+        """
+        method to set memory budget for process, with a budget data is kept in memory mapped files and each stage works
+        on it chunk by chunk
+        Attributes:
+            memoryBudget(int) : memory budget in bytes, None for working on data in memory
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.memoryBudget = memoryBudget
+        return self
+
+    def setCleaningProcesses(self, cleaningProcesses):
+        """
+        method to set number of worker processes for profiling columns of data set (the statistics the imputer is created
+        from) and filling missing values of columns in process, with or without a memory budget
+        Attributes:
+            cleaningProcesses(int) : number of worker processes, None for cleaning in one process
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.cleaningProcesses = cleaningProcesses
+        return self
+
+    def setKeepMissingValues(self, keepMissingValues):
+        """
+        method to set if classifier is built from rows with missing values without filling them, only rows with no class
+        value are removed and no imputer is created, used without a memory budget
+        Attributes:
+            keepMissingValues(boolean) : True to skip filling missing values
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.keepMissingValues = keepMissingValues
+        return self
+
+    def setCompactRows(self, compactRows):
+        """
+        method to set if identical rows of discretized training set are collapsed into weighted rows before building
+        classifier, used without a memory budget (with a budget classifier is already built from counts)
+        Attributes:
+            compactRows(boolean) : True to build classifier from weighted rows
+        Returns:
+            BuildClassifierProcess: the object we set
+        """
+        self.compactRows = compactRows
+        return self
+
     def startProcess(self, labelWidget):
         """
         method to start process after all setters have been activated
         Attributes:
             labelWidget(tkinter.Label) : a message box for showing process to user
         """
-        fileCreator, dataCleaner, dataDiscretization, Calculator, dataClassifier, dataLoader = CreateFile(), Cleaner(), Discretization(),\
-                                                                                               MiningCalculator(), Classifier(), Loader()
-        splitFunction = Calculator.getSplitFunc(self.classifierSplitType)
+        dataLoader = Loader()
 
         try:
             labelWidget.configure(text=labelWidget.cget("text") + "Building process starting\n")
 
-            dataLoader.loadData(self.folderPath)
+            schema = Schema().readSchemaFile(self.schemaFilePath) if self.schemaFilePath else None
+            cache = DataCache(self.cacheFolderPath) if self.cacheFolderPath else None
+            dataLoader.loadData(self.folderPath, cache=cache, processes=self.parsingProcesses, schema=schema, memoryBudget=self.memoryBudget,
+                                createLines=False)
             labelWidget.configure(text=labelWidget.cget("text") + "Data loading Finished\n")
 
-            dataCleaner.cleanTrainingSet(dataLoader.trainingSet, dataLoader.structure)
-            dataCleaner.cleanTestSet(dataLoader.testSet, dataLoader.structure)
-            fileCreator.createCsvFile(dataLoader.structure, dataLoader.trainingSet, "Clean Training set", self.savingFolderPath)
-            fileCreator.createCsvFile(dataLoader.structure, dataLoader.testSet, "Clean Test set", self.savingFolderPath)
-            labelWidget.configure(text=labelWidget.cget("text") + "Data cleaning Finished\n")
-
-            dataDiscretization.discretizationData(dataLoader.trainingSet, dataLoader.testSet, dataLoader.structure, self.discretizationBins,
-                                                  self.discretizationType)
-            fileCreator.createCsvFile(dataLoader.structure, dataLoader.trainingSet, "Discretization Training set", self.savingFolderPath)
-            fileCreator.createCsvFile(dataLoader.structure, dataLoader.testSet, "Discretization Test set", self.savingFolderPath)
-            labelWidget.configure(text=labelWidget.cget("text") + "Data Discretization Finished\n")
-
-            classifier = dataClassifier.buildClassifier(dataLoader.trainingSet, dataLoader.structure, self.classifierType, splitFunction)
-            classifiedTestData = dataClassifier.classifyTest(dataLoader.testSet, dataLoader.structure, classifier)
-            fileCreator.createCsvFile(dataLoader.structure,  classifiedTestData, "Classified Test set", self.savingFolderPath)
-            accuracy = dataClassifier.checkAccuracyOfClassifier(classifiedTestData, dataLoader.testSet)
-            classifier += ["accuracy: " + str(accuracy)]
-            fileCreator.createTxtFile(classifier, "Rules", self.savingFolderPath)
-            labelWidget.configure(text=labelWidget.cget("text") + "Building classifier Finished\n")
-
+            accuracy = self.buildClassifierInChunks(dataLoader, labelWidget, cache)
             return labelWidget.configure(text=labelWidget.cget("text") + "Classifier build successfully with accuracy: " + str(round(accuracy, 3)) +
                                               "\n")
 
@@ -123,4 +198,195 @@ class BuildClassifierProcess:
             return labelWidget.configure(text=labelWidget.cget("text") +
                                               "An Error occurred please check file and inputs and start again!")
 
+    def buildClassifierInChunks(self, dataLoader, labelWidget, cache=None):
+        """
+        method to clean, discretize, build classifier and classify test set on the columnar data set of a loader. columns
+        are changed in place, lines are only created in chunks for writing files and classifying test set. without a
+        memory budget lines of training set are created to build a classifier from rows with missing values or from
+        compacted rows
+        Attributes:
+            dataLoader(Loader) : loader with data set, structure and indices of training set and test set
+            labelWidget(tkinter.Label) : a message box for showing process to user
+            cache(DataCache): cache of parsed data sets and their profiles, None for no caching
+        Returns:
+            float: accuracy of classifier
+        """
+        fileCreator, dataCleaner, dataDiscretization, dataClassifier = CreateFile(), Cleaner(), Discretization(), Classifier()
+        dataSet, structure = dataLoader.dataSet, dataLoader.structure
+        chunkSize = dataSet.getRowsPerChunk(self.memoryBudget) if self.memoryBudget is not None else 10000
+        keepMissingValues = self.keepMissingValues and self.memoryBudget is None
+        compactRows = self.compactRows and self.memoryBudget is None
+
+        trainingIndices = dataCleaner.removeDataSetRows(dataSet, dataLoader.trainingIndices)
+        testIndices = dataLoader.testIndices
+        profile = dataLoader.profileData(trainingIndices, cache, self.cleaningProcesses)
+        fileCreator.createJsonFile(profile.getDict(), "Profile", self.savingFolderPath)
+        labelWidget.configure(text=labelWidget.cget("text") + "Data profiling Finished\n")
+        imputer = None
+        if not keepMissingValues:
+            imputer = dataCleaner.createImputer(profile.getStatistics(structure), structure)
+            trainingIndices = dataCleaner.cleanDataSet(dataSet, trainingIndices, structure, False, imputer, self.cleaningProcesses)
+            testIndices = dataCleaner.cleanDataSet(dataSet, testIndices, structure, False, imputer, self.cleaningProcesses)
+        labelWidget.configure(text=labelWidget.cget("text") + self.getRemovedRowsMessage(dataCleaner.removedRows))
+        fileCreator.createCsvFile(structure, dataSet.iterRows(trainingIndices, chunkSize), "Clean Training set", self.savingFolderPath)
+        fileCreator.createCsvFile(structure, dataSet.iterRows(testIndices, chunkSize), "Clean Test set", self.savingFolderPath)
+        labelWidget.configure(text=labelWidget.cget("text") + "Data cleaning Finished\n")
 
+        discretizer = dataDiscretization.discretizationDataSet(dataSet, trainingIndices, structure, self.discretizationBins,
+                                                               self.discretizationType, profile.getColumnRanges(imputer))
+        fileCreator.createCsvFile(structure, dataSet.iterRows(trainingIndices, chunkSize), "Discretization Training set", self.savingFolderPath)
+        fileCreator.createCsvFile(structure, dataSet.iterRows(testIndices, chunkSize), "Discretization Test set", self.savingFolderPath)
+        labelWidget.configure(text=labelWidget.cget("text") + "Data Discretization Finished\n")
+
+        ruleWeights = [] if keepMissingValues else None
+        if compactRows:
+            classifier = dataClassifier.buildClassifierFromWeightedRows(dataDiscretization.compactData(dataSet.iterRows(trainingIndices, chunkSize)),
+                                                                        structure, self.classifierType, self.classifierSplitType, ruleWeights)
+        elif keepMissingValues:
+            classifier = dataClassifier.buildClassifierWithMissingValues(dataSet.getRows(trainingIndices), structure, self.classifierType,
+                                                                         self.classifierSplitType, ruleWeights)
+        else:
+            classifier = dataClassifier.buildClassifierFromDataSet(dataSet, trainingIndices, structure, self.classifierType,
+                                                                   self.classifierSplitType)
+        accuracyCounts = [0, 0]
+        fileCreator.createCsvFile(structure, dataClassifier.classifyTestInChunks(dataSet.iterChunks(testIndices, chunkSize), structure,
+                                                                                 classifier, accuracyCounts, ruleWeights),
+                                  "Classified Test set", self.savingFolderPath)
+        accuracy = ((accuracyCounts[0] - accuracyCounts[1]) / accuracyCounts[0]) * 100 if accuracyCounts[0] > 0 else 100
+        classifier += ["accuracy: " + str(accuracy)]
+        fileCreator.createTxtFile(classifier, "Rules", self.savingFolderPath)
+        if imputer is not None:
+            fileCreator.createJsonFile(imputer.getDict(), "Imputer", self.savingFolderPath)
+        fileCreator.createJsonFile(discretizer.getDict(), "Discretizer", self.savingFolderPath)
+        labelWidget.configure(text=labelWidget.cget("text") + "Building classifier Finished\n")
+        return accuracy
+
+    def getRemovedRowsMessage(self, removedRows):
+        """
+        method to get a message for user about rows removed from training set while cleaning
+        Attributes:
+            removedRows(dict): reason : number of rows
+        Returns:
+            String: a line for each reason with removed rows
+        """
+        return "".join("Removed " + str(count) + " training rows with " + reason + "\n" for reason, count in removedRows.items() if count > 0)
+
+
+class TransformDataProcess:
+    """
+    class for applying the imputer and discretizer that a building process saved (Imputer.json and Discretizer.json)
+    to a new csv file with the columns of training data, without building the classifier again
+    """
+    def __init__(self):
+        self.chunkSize = 10000
+
+    def setFolderPath(self, folderPath):
+        """
+        method to set csv file path with new data for process
+        Attributes:
+            folderPath(String) : csv file path with new data
+        Returns:
+            TransformDataProcess: the object we set
+        """
+        self.folderPath = folderPath
+        return self
+
+    def setModelFolderPath(self, modelFolderPath):
+        """
+        method to set folder path with the files a building process saved
+        Attributes:
+            modelFolderPath(String) : folder path with Discretizer.json and Imputer.json (no imputer file if
+            classifier was built with missing values)
+        Returns:
+            TransformDataProcess: the object we set
+        """
+        self.modelFolderPath = modelFolderPath
+        return self
+
+    def setSavingFolderPath(self, savingFolderPath):
+        """
+        method to set folder path for saving the transformed data set
+        Attributes:
+            savingFolderPath(String) : folder path for saving files
+        Returns:
+            TransformDataProcess: the object we set
+        """
+        self.savingFolderPath = savingFolderPath
+        return self
+
+    def startProcess(self, labelWidget):
+        """
+        method to start process after all setters have been activated, the new csv file is read, filled and
+        discretized chunk by chunk and written to "Transformed Data set.csv"
+        Attributes:
+            labelWidget(tkinter.Label) : a message box for showing process to user
+        """
+        try:
+            labelWidget.configure(text=labelWidget.cget("text") + "Transform process starting\n")
+            imputer, discretizer = self.readModel()
+            labelWidget.configure(text=labelWidget.cget("text") + "Model loading Finished\n")
+
+            with ReadFile().openTextFile(self.folderPath) as csv_file:
+                csv_reader = csv.reader(csv_file, delimiter=',')
+                structure = self.createStructure(next(csv_reader, []))
+                chunks = Loader().readChunks(csv_reader, self.chunkSize)
+                CreateFile().createCsvFile(structure, self.transformChunks(chunks, structure, imputer, discretizer),
+                                           "Transformed Data set", self.savingFolderPath)
+            return labelWidget.configure(text=labelWidget.cget("text") + "Data transformed successfully\n")
+
+        except EnvironmentError:
+            return labelWidget.configure(text=labelWidget.cget("text") +
+                                              "Problem with file\\ file path. please check file is not empty and file path is correct!")
+        except:
+            return labelWidget.configure(text=labelWidget.cget("text") +
+                                              "An Error occurred please check file and inputs and start again!")
+
+    def readModel(self):
+        """
+        method to read the imputer and discretizer files of model folder
+        Returns:
+            tuple: (Imputer, Discretizer), imputer is None if model folder has no imputer file
+        Raise:
+            EnvironmentError
+            ValueError: if a model file is invalid
+        """
+        imputerFilePath = os.path.join(self.modelFolderPath, "Imputer.json")
+        imputer = Imputer().readImputerFile(imputerFilePath) if os.path.isfile(imputerFilePath) else None
+        return imputer, Discretizer().readDiscretizerFile(os.path.join(self.modelFolderPath, "Discretizer.json"))
+
+    def createStructure(self, header):
+        """
+        method to create the structure of columns of a new csv file, values of columns are not read
+        Attributes:
+            header(list): the names of columns in file
+        Returns:
+            dict: columnName : {'index': index , 'values': []}
+        Raise:
+            EnvironmentError: if file is empty
+            ValueError: if file has no class column
+        """
+        if len(header) <= 1:
+            raise EnvironmentError
+        if 'class' not in header:
+            raise ValueError("file must have a class column")
+        return {name: {'index': index, 'values': []} for index, name in enumerate(header)}
+
+    def transformChunks(self, chunks, structure, imputer, discretizer):
+        """
+        generator method to fill missing values and put numeric values in their bins chunk by chunk, only one chunk of
+        lines is in memory at a time
+        Attributes:
+            chunks(iterable) : chunks of lines each element is a list of lines
+            structure(dict): the structure of columns of lines
+            imputer(Imputer): the fitted imputer, None to leave missing values missing
+            discretizer(Discretizer): the fitted discretizer
+        Returns:
+            generator: transformed lines
+        Raise:
+            ValueError: if a value of a discretized column is not a number
+        """
+        if imputer is not None:
+            chunks = Cleaner().cleanChunks(chunks, structure, imputer)
+        for chunk in chunks:
+            discretizer.transform(chunk, structure)
+            yield from chunk
@@ -0,0 +1,36 @@
+import unittest
+from DataBins import BinEdges
+
+
+class TestDataBins(unittest.TestCase):
+    bins = None
+
+    def setUp(self):
+        self.bins = BinEdges().createBinsOfSplits([5.5, 11.0])
+
+    def test_createBinsOfSplits(self):
+        self.assertEqual([5.5, 11.0], list(self.bins.edges))
+        self.assertEqual(["value<=5.5", "5.5<value<=11.0", "value>11.0"], self.bins.labels)
+        self.assertEqual(["value<=5.5", "value>5.5"], BinEdges().createBinsOfSplits([5.5]).labels)
+
+    def test_BinEdges_invalid(self):
+        self.assertRaises(ValueError, BinEdges, [5.5, 11.0], ["value<=5.5", "value>5.5"])
+        self.assertRaises(ValueError, BinEdges, [11.0, 5.5], ["value<=11.0", "11.0<value<=5.5", "value>5.5"])
+
+    def test_keys(self):
+        self.assertEqual(["value<=5.5", "5.5<value<=11.0", "value>11.0"], self.bins.keys())
+        self.assertEqual(["value<=0.0", "0.0<value<=0.0", "value>0.0"], BinEdges().createBinsOfSplits([0.0, 0.0, 0.0]).keys())
+
+    def test_getBin(self):
+        self.assertEqual("value<=5.5", self.bins.getBin(-3))
+        self.assertEqual("value<=5.5", self.bins.getBin(5.5))
+        self.assertEqual("5.5<value<=11.0", self.bins.getBin(5.6))
+        self.assertEqual("5.5<value<=11.0", self.bins.getBin(11.0))
+        self.assertEqual("value>11.0", self.bins.getBin(11.1))
+
+    def test_getBinPositions(self):
+        self.assertEqual([0, 1, 0, 2, 1], self.bins.getBinPositions([4.0, 8.0, float("nan"), 12.0, 11.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
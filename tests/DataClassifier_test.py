@@ -1,5 +1,6 @@
 import unittest
 from DataClassifier import Classifier
+from DataSet import DataSet
 from MiningCalculations import MiningCalculator
 
 
@@ -26,6 +27,15 @@ class TestDataClassifier(unittest.TestCase):
                           'Test == 600-700 , Gender == M => class == Medium', 'Test == 600-700 , Gender == F => class == High',
                           'Test == Over 700 => class == High'], rules)
 
+    def test_buildClassifierFromWeightedRows(self):
+        weightedData = [(self.data[0], 2)] + [(row, 1) for row in self.data[1:]]
+        data = [self.data[0]] + self.data
+
+        self.assertEqual(self.classifier.buildClassifier(data, self.structure, "id3", self.calculator.findBestColumnSplitByInfoGain),
+                         self.classifier.buildClassifierFromWeightedRows(weightedData, self.structure, "id3", "Info Gain"))
+        self.assertEqual(self.classifier.buildClassifier(data, self.structure, "Naive Bayes"),
+                         self.classifier.buildClassifierFromWeightedRows(weightedData, self.structure, "Naive Bayes"))
+
     def test_buildClassifier_NaiveBayes(self):
         rules = self.classifier.buildClassifier(self.data, self.structure, "Naive Bayes")
 
@@ -42,6 +52,82 @@ class TestDataClassifier(unittest.TestCase):
          "Gender == M, Place == Israel, Test == Over 700 => class == High",
          "Gender == F, Place == Israel, Test == Over 700 => class == High"], rules)
 
+    def test_buildClassifierFromDataSet_ID3(self):
+        dataSet = DataSet(["Gender", "Place", "Test", "class"])
+        dataSet.appendRows(self.data)
+        for splitType in ["Info Gain", "Gain Ratio", "Gini Index"]:
+            rules = self.classifier.buildClassifierFromDataSet(dataSet, range(5), self.structure, "id3", splitType)
+
+            self.assertEqual(self.classifier.buildClassifier(self.data, self.structure, "id3", self.calculator.getSplitFunc(splitType)),
+                             rules)
+
+    def test_buildClassifierFromDataSet_NaiveBayes(self):
+        data = self.data + [["", "Israel", "0-600", "Low"], ["M", "", "600-700", "Medium"]]
+        dataSet = DataSet(["Gender", "Place", "Test", "class"])
+        dataSet.appendRows(data)
+
+        self.assertEqual(self.classifier.buildClassifier(data, self.structure, "Naive Bayes"),
+                         self.classifier.buildClassifierFromDataSet(dataSet, range(7), self.structure, "Naive Bayes"))
+
+    def test_buildClassifierWithMissingValues_ID3(self):
+        for splitType, splitFunc in (("Info Gain", self.calculator.findBestColumnSplitByInfoGain),
+                                     ("Gini Index", self.calculator.findBestColumnSplitByGini),
+                                     ("Gain Ratio", self.calculator.findBestColumnSplitByGainRatio)):
+            self.assertEqual(self.classifier.buildClassifier(self.data, self.structure, "id3", splitFunc),
+                             self.classifier.buildClassifierWithMissingValues(self.data, self.structure, "id3", splitType))
+
+        rules = self.classifier.buildClassifierWithMissingValues(self.data + [["", "Israel", "0-600", "Low"], ["M", "", "600-700", "Medium"]],
+                                                                 self.structure, "id3", "Info Gain")
+
+        self.assertEqual(['Test == 0-600 , Place == Diaspora => class == Medium', 'Test == 0-600 , Place == Israel => class == Low',
+                          'Test == 600-700 , Gender == M => class == Medium', 'Test == 600-700 , Gender == F => class == High',
+                          'Test == Over 700 => class == High'], rules)
+
+    def test_buildId3TreeWithMissingValues(self):
+        data = [["M", "", "High"], ["M", "Israel", "High"], ["F", "Diaspora", "Low"], ["F", "Israel", "High"]]
+        structure = {"Gender": {"index": 0, "values": ["M", "F"]}, "Place": {"index": 1, "values": ["Diaspora", "Israel"]},
+                     "class": {"index": 2, "values": ["Low", "High"]}}
+
+        tree = self.classifier.buildId3TreeWithMissingValues([(row, 1) for row in data], structure, None,
+                                                             self.calculator.findBestColumnSplitByInfoGainWithMissingValues)
+
+        self.assertEqual(["Place", "Place"], [node.name for node in tree])
+        self.assertEqual([1.333, 2.667], [round(node.N, 3) for node in tree])
+        self.assertEqual(["Low", "High"], [node.SubDecisionTree[0].value for node in tree])
+
+    def test_testAttribute_missingValues(self):
+        rules = self.classifier.convertStringRulesToLists(['Test == 0-600 , Place == Israel => class == Low',
+                                                           'Test == 600-700 , Gender == M => class == Medium',
+                                                           'Test == 600-700 , Gender == F => class == High',
+                                                           'Test == Over 700 => class == Medium'])
+        prefixWeights = self.classifier.calcPrefixWeightsOfRules(rules, [1, 1, 3, 2])
+
+        self.assertEqual("High", self.classifier.testAttribute(["F", "Israel", "", ""], self.structure, rules, prefixWeights))
+        self.assertEqual("High", self.classifier.testAttribute(["", "Israel", "600-700", ""], self.structure, rules, prefixWeights))
+        self.assertEqual(None, self.classifier.testAttribute(["M", "Diaspora", "0-600", ""], self.structure, rules, prefixWeights))
+        self.assertEqual(None, self.classifier.testAttribute(["F", "Israel", "", ""], self.structure, rules))
+
+    def test_calcPrefixWeightsOfRules(self):
+        rules = self.classifier.convertStringRulesToLists(['Test == 0-600 => class == Low', 'Test == 600-700 , Gender == M => class == Medium',
+                                                           'Test == 600-700 , Gender == F => class == High'])
+
+        self.assertEqual({(): 6, ("Test", "0-600"): 1, ("Test", "600-700"): 5, ("Test", "600-700", "Gender", "M"): 2,
+                          ("Test", "600-700", "Gender", "F"): 3}, self.classifier.calcPrefixWeightsOfRules(rules, [1, 2, 3]))
+        self.assertIsNone(self.classifier.calcPrefixWeightsOfRules(rules, None))
+
+    def test_buildClassifierWithMissingValues_ruleWeights(self):
+        ruleWeights = []
+        data = self.data + [["", "Israel", "0-600", "Low"], ["M", "", "600-700", "Medium"]]
+
+        rules = self.classifier.buildClassifierWithMissingValues(data, self.structure, "id3", "Info Gain", ruleWeights)
+
+        self.assertEqual(len(rules), len(ruleWeights))
+        self.assertAlmostEqual(len(data), sum(ruleWeights))
+        self.assertEqual(["Medium", "High"], [row[3] for row in self.classifier.classifyTest([["", "Israel", "600-700", ""], ["F", "Israel", "", ""]],
+                                                                                              self.structure, rules, ruleWeights)])
+        self.assertEqual([None, None], [row[3] for row in self.classifier.classifyTest([["", "Israel", "600-700", ""], ["F", "Israel", "", ""]],
+                                                                                       self.structure, rules)])
+
     def test_buildId3Classifier(self):
         rules = self.classifier.buildId3Classifier(self.data, self.structure, "Medium", self.calculator.findBestColumnSplitByInfoGain)
 
@@ -49,6 +135,13 @@ class TestDataClassifier(unittest.TestCase):
                           'Test == 600-700 , Gender == M => class == Medium', 'Test == 600-700 , Gender == F => class == High',
                           'Test == Over 700 => class == High'], rules)
 
+    def test_convertStringRulesToLists_sharedValues(self):
+        rules = self.classifier.convertStringRulesToLists(['Test == 0-600 , Place == Israel => class == Low'], self.structure)
+
+        self.assertEqual([['Test', '0-600', 'Place', 'Israel', 'class', 'Low']], rules)
+        self.assertIs(self.structure["Place"]["values"][1], rules[0][3])
+        self.assertIs(self.structure["class"]["values"][0], rules[0][5])
+
     def test_convertStringRulesToLists(self):
         rules = self.classifier.buildId3Classifier(self.data, self.structure, "Medium", self.calculator.findBestColumnSplitByInfoGain)
 
@@ -60,6 +153,15 @@ class TestDataClassifier(unittest.TestCase):
                           ['Test', '600-700', 'Gender', 'F', 'class', 'High'],
                           ['Test', 'Over 700', 'class', 'High']], rules)
 
+    def test_classifyTestInChunks(self):
+        rules = ['Test == 0-600 => class == Low', 'Test == 600-700 => class == Medium', 'Test == Over 700 => class == High']
+        accuracyCounts = [0, 0]
+        classifiedTestData = list(self.classifier.classifyTestInChunks([self.data[:2], self.data[2:]], self.structure, rules, accuracyCounts))
+
+        self.assertEqual(self.classifier.classifyTest(self.data, self.structure, rules), classifiedTestData)
+        self.assertEqual([5, 2], accuracyCounts)
+        self.assertEqual("High", self.data[2][3])
+
     def test_testAttribute(self):
         rules = self.classifier.buildId3Classifier(self.data, self.structure, "Medium", self.calculator.findBestColumnSplitByInfoGain)
         rules = self.classifier.convertStringRulesToLists(rules)
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from DataBins import BinEdges
+from DataDiscretization import Discretization
+from DataDiscretizer import Discretizer
+
+
+class TestDataDiscretizer(unittest.TestCase):
+    discretizer = None
+    structure = {}
+
+    def setUp(self):
+        self.discretizer = Discretizer({"Age": BinEdges().createBinsOfSplits([20.5, 41.0]), "Salary": BinEdges().createBinsOfSplits([9.5])})
+        self.structure = {"Age": {"index": 0, "values": ["Numeric"]}, "Job": {"index": 1, "values": ["teacher", "nurse"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}
+
+    def test_readDiscretizerFile(self):
+        folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folderPath)
+        path = os.path.join(folderPath, "Discretizer.json")
+        with open(path, "w") as discretizerFile:
+            json.dump(self.discretizer.getDict(), discretizerFile)
+
+        discretizer = Discretizer().readDiscretizerFile(path)
+
+        self.assertEqual(self.discretizer.getDict(), discretizer.getDict())
+        self.assertEqual({"Age": {"edges": [20.5, 41.0], "labels": ["value<=20.5", "20.5<value<=41.0", "value>41.0"]},
+                          "Salary": {"edges": [9.5], "labels": ["value<=9.5", "value>9.5"]}}, discretizer.getDict()["bins"])
+
+    def test_readDiscretizerFile_invalidFile(self):
+        folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folderPath)
+        path = os.path.join(folderPath, "Discretizer.json")
+        with open(path, "w") as discretizerFile:
+            json.dump({"bins": {"Age": {"edges": [20.5, 41.0], "labels": ["value<=20.5", "value>20.5"]}}}, discretizerFile)
+
+        self.assertRaises(ValueError, Discretizer().readDiscretizerFile, path)
+
+    def test_transform(self):
+        data = [["20", "nurse", "yes"], ["", "teacher", "no"], ["41", "", ""], ["73.5", "nurse", "no"]]
+
+        self.discretizer.transform(data, self.structure)
+        self.discretizer.transformStructure(self.structure)
+
+        self.assertEqual([["value<=20.5", "nurse", "yes"], ["", "teacher", "no"], ["20.5<value<=41.0", "", ""],
+                          ["value>41.0", "nurse", "no"]], data)
+        self.assertEqual(["value<=20.5", "20.5<value<=41.0", "value>41.0"], self.structure["Age"]["values"])
+
+    def test_transform_discretizationData(self):
+        trainData, testData = [["4", "no"], ["5", "yes"], ["8", "no"], ["12", "yes"], ["15", "yes"]], [["9", "no"], ["", "yes"], ["3", "no"]]
+        structure = {"Hours": {"index": 0, "values": ["Numeric"]}, "class": {"index": 1, "values": ["no", "yes"]}}
+        newData = [row[:] for row in testData]
+
+        discretizer = Discretization().discretizationData(trainData, testData, structure, 3, "Entropy")
+        discretizer.transform(newData, structure)
+
+        self.assertEqual(testData, newData)
+
+
+if __name__ == '__main__':
+    unittest.main()
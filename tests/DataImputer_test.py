@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from DataImputer import Imputer
+from DataSet import DataSet
+
+
+class TestDataImputer(unittest.TestCase):
+    imputer = None
+    structure = {}
+
+    def setUp(self):
+        self.imputer = Imputer(["yes", "no"], {"Age": ["13.0", "15.5", "14.0"], "Job": ["teacher", None, "nurse"]})
+        self.structure = {"Age": {"index": 0, "values": ["Numeric"]}, "Job": {"index": 1, "values": ["teacher", "nurse"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}
+
+    def test_readImputerFile(self):
+        folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folderPath)
+        path = os.path.join(folderPath, "Imputer.json")
+        with open(path, "w") as imputerFile:
+            json.dump(self.imputer.getDict(), imputerFile)
+
+        imputer = Imputer().readImputerFile(path)
+
+        self.assertEqual(self.imputer.classValues, imputer.classValues)
+        self.assertEqual(self.imputer.fillValues, imputer.fillValues)
+
+    def test_readImputerFile_invalidFile(self):
+        folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folderPath)
+        path = os.path.join(folderPath, "Imputer.json")
+        with open(path, "w") as imputerFile:
+            json.dump({"classValues": ["yes", "no"], "fillValues": {"Age": ["13.0"]}}, imputerFile)
+
+        self.assertRaises(ValueError, Imputer().readImputerFile, path)
+
+    def test_transform(self):
+        data = [["", "", "yes"], ["", "", "no"], ["", "", ""], ["", "", "maybe"], ["20", "nurse", "no"]]
+
+        self.imputer.transform(data, self.structure)
+
+        self.assertEqual([["13.0", "teacher", "yes"], ["15.5", "", "no"], ["14.0", "nurse", ""], ["14.0", "nurse", "maybe"],
+                          ["20", "nurse", "no"]], data)
+
+    def test_transformDataSet(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.appendRows([["", "", "no"], ["", "", "yes"], ["", "", ""], ["20", "nurse", "no"]])
+
+        self.imputer.transformDataSet(dataSet, range(4))
+
+        self.assertEqual([["15.5", "", "no"], ["13", "teacher", "yes"], ["14", "nurse", ""], ["20", "nurse", "no"]],
+                         dataSet.getRows())
+
+    def test_transformDataSet_nanIsNotMissing(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.appendRows([["nan", "nurse", "no"], ["", "nurse", "no"], ["NaN", "nurse", "yes"]])
+
+        self.imputer.transformDataSet(dataSet, range(3))
+
+        self.assertEqual(["nan", "15.5", "NaN"], dataSet.getColumn(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
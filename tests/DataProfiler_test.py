@@ -0,0 +1,63 @@
+import json
+import unittest
+from array import array
+from DataCleaner import Cleaner
+from DataImputer import Imputer
+from DataProfiler import Profile
+from DataSet import DataSet
+
+
+class TestDataProfiler(unittest.TestCase):
+    dataSet = None
+    structure = {}
+
+    def setUp(self):
+        self.dataSet = DataSet(["Age", "Job", "class"])
+        self.dataSet.appendRows([["20", "admin", "yes"], ["", "admin", "no"], ["41", "", "yes"], ["30", "nurse", "no"],
+                                 ["12", "nurse", ""], ["", "nurse", "no"]])
+        self.structure = self.dataSet.getStructure()
+
+    def test_profileDataSet(self):
+        profile = Profile().profileDataSet(self.dataSet, array('l', range(len(self.dataSet))))
+
+        self.assertEqual(6, profile.numOfRows)
+        self.assertEqual(["yes", "no"], profile.classValues)
+        self.assertEqual([2, 3, 1], profile.classCounts)
+        self.assertEqual({'numeric': True, 'missing': [0, 2, 2], 'min': 12.0, 'max': 41.0,
+                          'statistics': [[61.0, 2], [30.0, 1], [103.0, 4]]}, profile.columns["Age"])
+        self.assertEqual({'numeric': False, 'missing': [1, 0, 1],
+                          'statistics': [{"admin": [1, 0]}, {"admin": [1, 1], "nurse": [2, 5]}, {"admin": [2, 1], "nurse": [3, 5]}]},
+                         profile.columns["Job"])
+
+    def test_profileDataSet_inParallel(self):
+        indices = array('l', [0, 1, 2, 3, 5])
+
+        profile = Profile().profileDataSet(self.dataSet, indices, 2)
+
+        self.assertEqual(Profile().profileDataSet(self.dataSet, indices).getDict(), profile.getDict())
+
+    def test_getDict(self):
+        profile = Profile().profileDataSet(self.dataSet, array('l', range(len(self.dataSet))))
+
+        readProfile = Profile(**json.loads(json.dumps(profile.getDict())))
+
+        self.assertEqual(profile.getDict(), readProfile.getDict())
+
+    def test_getStatistics(self):
+        indices = array('l', [0, 1, 2, 3, 5])
+        cleaner = Cleaner()
+
+        imputer = cleaner.createImputer(Profile().profileDataSet(self.dataSet, indices).getStatistics(self.structure), self.structure)
+
+        fittedImputer = cleaner.fitDataSetImputer(self.dataSet, indices, self.structure)
+        self.assertEqual(fittedImputer.getDict(), imputer.getDict())
+
+    def test_getColumnRanges(self):
+        profile = Profile().profileDataSet(self.dataSet, array('l', range(len(self.dataSet))))
+
+        self.assertEqual({"Age": (12.0, 41.0)}, profile.getColumnRanges())
+        self.assertEqual({"Age": (5.0, 41.0)}, profile.getColumnRanges(Imputer(["yes", "no"], {"Age": ["1.0", "5.0", "50.0"]})))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from DataSampler import Sampler
+
+
+class TestDataSampler(unittest.TestCase):
+    chunks = []
+
+    def setUp(self):
+        self.chunks = [[[str(index), "yes" if index % 4 else "no"] for index in range(start, start + 10)] for start in range(0, 100, 10)]
+
+    def sample(self, sampler):
+        return [row for chunk in sampler.sample(iter(self.chunks), 1) for row in chunk]
+
+    def test_init_invalidSpec(self):
+        self.assertRaises(ValueError, Sampler)
+        self.assertRaises(ValueError, Sampler, 0.5, 10)
+        self.assertRaises(ValueError, Sampler, 1.5)
+        self.assertRaises(ValueError, Sampler, size=-1)
+
+    def test_sampleByFraction(self):
+        rows = self.sample(Sampler(0.3, seed=2))
+
+        self.assertEqual(rows, self.sample(Sampler(0.3, seed=2)))
+        self.assertEqual(sorted(rows, key=lambda row: int(row[0])), rows)
+        self.assertEqual(100, len(self.sample(Sampler(1))))
+
+    def test_sampleByStratifiedFraction(self):
+        rows = self.sample(Sampler(0.2, stratified=True, seed=3))
+
+        self.assertEqual(5, [row[1] for row in rows].count("no"))
+        self.assertEqual(15, [row[1] for row in rows].count("yes"))
+
+    def test_sampleBySize(self):
+        rows = self.sample(Sampler(size=10, seed=4))
+
+        self.assertEqual(10, len(rows))
+        self.assertEqual(sorted(rows, key=lambda row: int(row[0])), rows)
+        self.assertEqual(100, len(self.sample(Sampler(size=1000))))
+
+    def test_sampleBySize_stratified(self):
+        rows = self.sample(Sampler(size=10, stratified=True, seed=5))
+
+        self.assertEqual(3, [row[1] for row in rows].count("no"))
+        self.assertEqual(7, [row[1] for row in rows].count("yes"))
+
+    def test_getStratumSizes(self):
+        self.assertEqual({"a": 2, "b": 1, "c": 1}, Sampler(size=4).getStratumSizes({"a": 5, "b": 3, "c": 2}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+import unittest
+from array import array
+from DataSet import DataSet, MISSING, NUMBER, NUMBER_TEXT, ROW_TEXT
+
+
+class TestDataSet(unittest.TestCase):
+    dataSet = None
+
+    def setUp(self):
+        self.dataSet = DataSet(["Age", "Job", "class"])
+        self.dataSet.appendRows([["13", "student", "yes"], ["18.5", "", "no"], ["", "student", "no"], ["14", "teacher", ""]])
+
+    def test_getStructure(self):
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Job": {"index": 1, "values": ["student", "teacher"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, self.dataSet.getStructure())
+
+    def test_columnsEncoding(self):
+        self.assertEqual('d', self.dataSet.columns[0].typecode)
+        self.assertEqual([0, MISSING, 0, 1], list(self.dataSet.columns[1]))
+        self.assertEqual([0, 1, 1, MISSING], list(self.dataSet.columns[2]))
+
+    def test_getRows(self):
+        self.assertEqual([["13", "student", "yes"], ["18.5", "", "no"], ["", "student", "no"], ["14", "teacher", ""]],
+                         self.dataSet.getRows())
+        self.assertEqual([["14", "teacher", ""], ["13", "student", "yes"]], self.dataSet.getRows([3, 0]))
+
+    def test_getRows_sharedValues(self):
+        rows = self.dataSet.getRows()
+
+        self.assertIs(rows[0][1], rows[2][1])
+
+    def test_getRows_sharedNumericValues(self):
+        dataSet = DataSet(["Hours", "class"])
+        dataSet.appendRows([["5.5", "yes"], ["5.5", "no"], ["", "no"]])
+
+        rows = dataSet.getRows()
+
+        self.assertIs(rows[0][0], rows[1][0])
+        self.assertEqual("", rows[2][0])
+
+    def test_getRows_keepsNumericText(self):
+        dataSet = DataSet(["Hours", "class"])
+        dataSet.appendRows([["5.0", "yes"], ["1e3", "no"], ["7", "no"]])
+
+        self.assertEqual([["5.0", "yes"], ["1e3", "no"], ["7", "no"]], dataSet.getRows())
+
+    def test_getRows_keepsNumericTextOfEachRow(self):
+        dataSet = DataSet(["Hours", "class"])
+        dataSet.appendRows([["1", "yes"], ["1.0", "no"], ["1.00", "no"], ["nan", "yes"], ["NaN", "no"], ["", "no"]])
+
+        self.assertEqual([NUMBER, NUMBER_TEXT, ROW_TEXT, NUMBER, ROW_TEXT, MISSING], list(dataSet.textCodes[0]))
+        self.assertEqual(["1", "1.0", "1.00", "nan", "NaN", ""], dataSet.getColumn(0))
+        self.assertEqual(["NaN", "1.00"], dataSet.getColumn(0, [4, 2]))
+        self.assertEqual("1.0", dataSet.getColumnValue(0, 1))
+
+    def test_countClassValues(self):
+        self.assertEqual([1, 2], self.dataSet.countClassValues())
+        self.assertEqual([0, 1], self.dataSet.countClassValues([1, 3]))
+
+    def test_countColumnValuesByClass(self):
+        self.assertEqual([[1, 1], [0, 0]], self.dataSet.countColumnValuesByClass(1))
+
+
+    def test_extend(self):
+        other = DataSet(["Age", "Job", "class"])
+        other.appendRows([["old", "teacher", "no"], ["20", "nurse", "yes"]])
+
+        self.dataSet.extend(other)
+
+        self.assertEqual({"Age": {"index": 0, "values": ["13", "18.5", "14", "old", "20"]},
+                          "Job": {"index": 1, "values": ["student", "teacher", "nurse"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, self.dataSet.getStructure())
+        self.assertEqual([["13", "student", "yes"], ["18.5", "", "no"], ["", "student", "no"], ["14", "teacher", ""],
+                          ["old", "teacher", "no"], ["20", "nurse", "yes"]], self.dataSet.getRows())
+
+    def test_extend_numericColumns(self):
+        other = DataSet(["Age", "Job", "class"])
+        other.appendRows([["21", "teacher", "no"]])
+
+        self.dataSet.extend(other)
+
+        self.assertEqual('d', self.dataSet.columns[0].typecode)
+        self.assertEqual(["13", "18.5", "", "14", "21"], self.dataSet.getColumn(0))
+
+    def test_extend_spillingNumericColumn(self):
+        dataSet, other = DataSet(["Hours", "class"]), DataSet(["Hours", "class"])
+        dataSet.enableSpilling()
+        dataSet.appendRows([["1", "yes"], ["2.0", "no"]])
+        other.appendRows([["many", "yes"]])
+        dataSet.finishSpilling()
+
+        dataSet.extend(other)
+
+        self.assertEqual(["1", "2.0", "many"], dataSet.getColumn(0))
+
+    def test_extend_spilledDataSet(self):
+        dataSet, other = DataSet(["Hours", "class"]), DataSet(["Hours", "class"])
+        dataSet.enableSpilling(maxMemory=1)
+        dataSet.appendRows([["1", "yes"], ["2.0", "no"]])
+        dataSet.finishSpilling()
+        other.appendRows([["2.00", "yes"], ["3", "no"]])
+        mappedFiles = [mappedFile for _, mappedFile in dataSet.mappedFiles]
+
+        dataSet.extend(other)
+
+        self.assertIsInstance(dataSet.columns[0], memoryview)
+        self.assertEqual(mappedFiles, [mappedFile for _, mappedFile in dataSet.mappedFiles])
+        self.assertEqual(["1", "2.0", "2.00", "3"], dataSet.getColumn(0))
+
+    def test_extend_numericColumnsWithOtherTexts(self):
+        dataSet, other = DataSet(["Hours", "class"]), DataSet(["Hours", "class"])
+        dataSet.appendRows([["1.0", "yes"], ["2.50", "no"]])
+        other.appendRows([["1.00", "no"], ["2.50", "yes"], ["3.0", "no"]])
+
+        dataSet.extend(other)
+
+        self.assertEqual(["1.0", "2.50", "1.00", "2.50", "3.0"], dataSet.getColumn(0))
+        self.assertEqual({2: "1.00"}, dataSet.rowTexts[0])
+
+    def test_extend_keepsNumericTextOfEachRow(self):
+        other = DataSet(["Age", "Job", "class"])
+        other.appendRows([["13.0", "teacher", "no"], ["old", "nurse", "yes"], ["nan", "nurse", "no"]])
+
+        self.dataSet.extend(other)
+
+        self.assertEqual(["13", "18.5", "14", "13.0", "old", "nan"], self.dataSet.values[0])
+        self.assertEqual([0, 1, MISSING, 2, 3, 4, 5], list(self.dataSet.columns[0]))
+
+    def test_enableSpilling(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.enableSpilling(maxMemory=1)
+        dataSet.appendRows([["13", "student", "yes"], ["18.5", "", "no"]])
+        dataSet.appendRows([["", "student", "no"], ["14", "teacher", ""]])
+        dataSet.finishSpilling()
+
+        self.assertIsInstance(dataSet.columns[0], memoryview)
+        self.assertEqual(4, len(dataSet))
+        self.assertEqual(self.dataSet.getRows(), dataSet.getRows())
+
+    def test_enableSpilling_nonNumericValue(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.enableSpilling(maxMemory=1)
+        dataSet.appendRows([["13", "student", "yes"], ["13.0", "", "no"]])
+        dataSet.appendRows([["", "student", "no"], ["old", "teacher", ""]])
+        dataSet.finishSpilling()
+
+        self.assertEqual(["13", "13.0", "old"], dataSet.values[0])
+        self.assertEqual([0, 1, MISSING, 2], list(dataSet.columns[0]))
+        self.assertFalse(dataSet.numeric[0])
+
+    def test_appendRows_spilledDataSet(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.enableSpilling(maxMemory=1)
+        dataSet.appendRows([["13", "student", "yes"], ["18.5", "", "no"]])
+        dataSet.finishSpilling()
+        mappedFiles = [mappedFile for _, mappedFile in dataSet.mappedFiles]
+
+        dataSet.appendRows([["", "student", "no"], ["14", "teacher", ""]])
+
+        self.assertIsInstance(dataSet.columns[0], memoryview)
+        self.assertEqual(mappedFiles, [mappedFile for _, mappedFile in dataSet.mappedFiles])
+        self.assertEqual(self.dataSet.getRows(), dataSet.getRows())
+
+    def test_appendRows_spilledDataSetNonNumericValue(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.enableSpilling(maxMemory=1)
+        dataSet.appendRows([["13", "student", "yes"], ["13.0", "", "no"]])
+        dataSet.finishSpilling()
+
+        dataSet.appendRows([["", "student", "no"], ["old", "teacher", ""]])
+
+        self.assertEqual(["13", "13.0", "old"], dataSet.values[0])
+        self.assertEqual([0, 1, MISSING, 2], list(dataSet.columns[0]))
+
+    def test_appendRows_numericColumnWithoutValues(self):
+        self.assertEqual([13.0, 18.5, 14.0], [self.dataSet.columns[0][index] for index in (0, 1, 3)])
+        self.assertEqual(([], {}), (self.dataSet.values[0], self.dataSet.codes[0]))
+
+    def test_appendRows_nonNumericValue(self):
+        self.dataSet.appendRows([["1.50", "nurse", "no"], ["old", "nurse", "yes"], ["14", "teacher", "no"]])
+
+        self.assertEqual({"index": 0, "values": ["13", "18.5", "14", "1.50", "old"]}, self.dataSet.getStructure()["Age"])
+        self.assertEqual(["13", "18.5", "", "14", "1.50", "old", "14"], self.dataSet.getColumn(0))
+
+    def test_createEmptyCopy(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.fixed = True
+        dataSet.setCategoricalColumn(1, array('i'), ["student"])
+        copy = dataSet.createEmptyCopy()
+
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Job": {"index": 1, "values": ["student"]},
+                          "class": {"index": 2, "values": []}}, copy.getStructure())
+        self.assertRaises(ValueError, copy.appendRows, [["13", "teacher", "yes"]])
+        self.assertEqual(0, len(self.dataSet.createEmptyCopy()))
+
+    def test_iterChunks(self):
+        self.assertEqual([[["13", "student", "yes"], ["18.5", "", "no"]], [["", "student", "no"], ["14", "teacher", ""]]],
+                         list(self.dataSet.iterChunks(chunkSize=2)))
+        self.assertEqual([["14", "teacher", ""], ["13", "student", "yes"]], list(self.dataSet.iterRows([3, 0], 1)))
+
+    def test_partitionByColumn(self):
+        self.assertEqual([[0, 2], [3]], [list(partition) for partition in self.dataSet.partitionByColumn(1)])
+        self.assertEqual([[2], []], [list(partition) for partition in self.dataSet.partitionByColumn(1, [1, 2])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from DataCache import DataCache
+from DataLoader import Loader
+from DataSchema import Schema
+
+
+class TestDataCache(unittest.TestCase):
+    folderPath = None
+    csvFilePath = None
+
+    def setUp(self):
+        self.folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folderPath)
+        self.csvFilePath = self.writeCsvFile("data.csv", "Age,Job,class\n13,student,yes\n18.5,,no\n,student,no\n14,teacher,\n")
+        self.cache = DataCache(os.path.join(self.folderPath, "cache"))
+
+    def writeCsvFile(self, name, text):
+        path = os.path.join(self.folderPath, name)
+        with open(path, "w") as csvFile:
+            csvFile.write(text)
+        return path
+
+    def test_load_noCacheFile(self):
+        self.assertIsNone(self.cache.load(self.csvFilePath))
+
+    def test_saveAndLoad(self):
+        loader = Loader()
+        dataSet = loader.parseData(self.csvFilePath, 2)
+
+        self.cache.save(self.csvFilePath, dataSet)
+        cachedDataSet = self.cache.load(self.csvFilePath)
+
+        self.assertEqual(dataSet.getStructure(), cachedDataSet.getStructure())
+        self.assertEqual(dataSet.getRows(), cachedDataSet.getRows())
+        self.assertIsInstance(cachedDataSet.columns[0], memoryview)
+
+    def test_saveAndLoad_numericTexts(self):
+        csvFilePath = self.writeCsvFile("texts.csv", "Age,Job,class\n13.0,student,yes\n13.00,,no\nNaN,student,no\n,teacher,\n")
+        dataSet = Loader().parseData(csvFilePath, 2)
+
+        self.cache.save(csvFilePath, dataSet)
+        cachedDataSet = self.cache.load(csvFilePath)
+
+        self.assertEqual(["13.0", "13.00", "NaN", ""], cachedDataSet.getColumn(0))
+        self.assertIsInstance(cachedDataSet.textCodes[0], memoryview)
+        self.assertIsNone(cachedDataSet.textCodes[1])
+
+    def test_load_sourceFileChanged(self):
+        self.cache.save(self.csvFilePath, Loader().parseData(self.csvFilePath, 2))
+        time.sleep(0.01)
+        self.writeCsvFile("data.csv", "Age,Job,class\n13,student,yes\n")
+
+        self.assertIsNone(self.cache.load(self.csvFilePath))
+
+    def test_load_sourceFileEditedInMiddle(self):
+        text = "Age,class\n" + "".join(str(age) + ",yes\n" for age in range(10, 60))
+        csvFilePath = self.writeCsvFile("long.csv", text)
+        self.cache.HASH_BLOCK_SIZE, self.cache.HASH_BLOCK_SPACING = 16, 16
+        self.cache.save(csvFilePath, Loader().parseData(csvFilePath, 10))
+        stat = os.stat(csvFilePath)
+        with open(csvFilePath, "r+b") as csvFile:
+            csvFile.seek(text.index("\n21,"))
+            csvFile.write(b"\n12,")
+        os.utime(csvFilePath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertIsNone(self.cache.load(csvFilePath))
+
+    def test_loadData_withCache(self):
+        firstLoader, secondLoader = Loader(), Loader()
+
+        firstLoader.loadData(self.csvFilePath, cache=self.cache)
+        secondLoader.loadData(self.csvFilePath, cache=self.cache)
+
+        self.assertIsInstance(secondLoader.dataSet.columns[0], memoryview)
+        self.assertEqual(firstLoader.structure, secondLoader.structure)
+        self.assertEqual(firstLoader.trainingSet, secondLoader.trainingSet)
+        self.assertEqual(firstLoader.testSet, secondLoader.testSet)
+
+    def test_loadData_withCacheAndSchema(self):
+        schema = Schema({"Age": ["Numeric"], "Job": ["student", "teacher"], "class": ["yes", "no"]}, "class")
+        Loader().loadData(self.csvFilePath, cache=self.cache, schema=schema)
+        loader = Loader()
+
+        loader.loadData(self.csvFilePath, cache=self.cache, schema=schema)
+
+        self.assertIsInstance(loader.dataSet.columns[0], memoryview)
+        self.assertTrue(loader.dataSet.fixed)
+        self.assertRaises(ValueError, loader.appendRows, [["15", "bogus", "yes"]])
+        self.assertEqual(["student", "teacher"], loader.structure['Job']['values'])
+
+    def test_appendRows_cachedDataSet(self):
+        dataSet = Loader().parseData(self.csvFilePath, 2)
+        self.cache.save(self.csvFilePath, dataSet)
+        cachedDataSet = self.cache.load(self.csvFilePath)
+
+        dataSet.appendRows([["15", "nurse", "yes"], ["old", "", "no"]])
+        cachedDataSet.appendRows([["15", "nurse", "yes"], ["old", "", "no"]])
+
+        self.assertEqual(dataSet.getStructure(), cachedDataSet.getStructure())
+        self.assertEqual(dataSet.getRows(), cachedDataSet.getRows())
+
+    def test_appendRows_cachedDataSetWithSpilling(self):
+        dataSet = Loader().parseData(self.csvFilePath, 2)
+        self.cache.save(self.csvFilePath, dataSet)
+        cachedDataSet = self.cache.load(self.csvFilePath)
+        cachedDataSet.enableSpilling(self.folderPath, 1)
+
+        dataSet.appendRows([["15", "nurse", "yes"], ["16", "", "no"]])
+        cachedDataSet.appendRows([["15", "nurse", "yes"], ["16", "", "no"]])
+
+        self.assertIsInstance(cachedDataSet.columns[0], memoryview)
+        self.assertEqual(dataSet.getRows(), cachedDataSet.getRows())
+
+    def test_saveAndLoad_otherKey(self):
+        loader = Loader()
+        dataSet, otherDataSet = loader.parseData(self.csvFilePath, 2), loader.parseData(self.csvFilePath, 2, columns=["Job", "class"])
+
+        self.cache.save(self.csvFilePath, dataSet, "key")
+        self.cache.save(self.csvFilePath, otherDataSet, "other key")
+
+        self.assertNotEqual(self.cache.getCacheFilePath(self.csvFilePath, "key"), self.cache.getCacheFilePath(self.csvFilePath, "other key"))
+        self.assertEqual(dataSet.getRows(), self.cache.load(self.csvFilePath, "key").getRows())
+        self.assertEqual(otherDataSet.getRows(), self.cache.load(self.csvFilePath, "other key").getRows())
+
+    def test_saveProfileAndLoadProfile(self):
+        profile = {'numOfRows': 1, 'classValues': ["yes"], 'classCounts': [1, 0], 'columns': {}}
+
+        self.cache.saveProfile(self.csvFilePath, profile, "key")
+
+        self.assertEqual(profile, self.cache.loadProfile(self.csvFilePath, "key"))
+        self.assertIsNone(self.cache.loadProfile(self.csvFilePath, "other key"))
+
+    def test_profileData_withCache(self):
+        firstLoader, secondLoader = Loader(), Loader()
+        firstLoader.loadData(self.csvFilePath, cache=self.cache)
+        secondLoader.loadData(self.csvFilePath, cache=self.cache)
+
+        profile = firstLoader.profileData(firstLoader.trainingIndices, self.cache)
+        secondLoader.dataSet = None
+
+        self.assertEqual(profile.getDict(), secondLoader.profileData(secondLoader.trainingIndices, self.cache).getDict())
+        self.assertEqual(1, len([name for name in os.listdir(self.cache.cacheFolderPath) if name.endswith(".profile.json")]))
+
+    def test_evict(self):
+        otherFilePath = self.writeCsvFile("other.csv", "Age,class\n1,yes\n")
+        self.cache.save(self.csvFilePath, Loader().parseData(self.csvFilePath, 2))
+        time.sleep(0.01)
+        self.cache.maxCacheSize = os.path.getsize(self.cache.getCacheFilePath(self.csvFilePath))
+
+        self.cache.save(otherFilePath, Loader().parseData(otherFilePath, 2))
+
+        self.assertFalse(os.path.exists(self.cache.getCacheFilePath(self.csvFilePath)))
+        self.assertTrue(os.path.exists(self.cache.getCacheFilePath(otherFilePath)))
+
+
+if __name__ == '__main__':
+    unittest.main()
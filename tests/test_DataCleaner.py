@@ -1,5 +1,6 @@
 import unittest
 from DataCleaner import Cleaner
+from DataSet import DataSet
 
 
 class TestDataCleaner(unittest.TestCase):
@@ -63,6 +64,95 @@ class TestDataCleaner(unittest.TestCase):
         self.assertEqual([["13", "4000.0", "yes"], ["18", "5000", ""], ["15.5", "3000", "no"]],
                          self.dataWithMissingValuesAndClass)
 
+    def test_cleanTestSet_withImputer(self):
+        imputer = self.dataCleaner.cleanTrainingSet(self.dataWithMissingValues, self.structure)
+
+        self.dataCleaner.cleanTestSet(self.dataWithMissingValuesAndClass, self.structure, imputer)
+
+        self.assertEqual({"Age": ["13.0", "15.0", "14.0"], "Income": ["4000.0", "4000.0", "4000.0"]}, imputer.fillValues)
+        self.assertEqual([["13", "4000.0", "yes"], ["18", "5000", ""], ["15.0", "3000", "no"]], self.dataWithMissingValuesAndClass)
+
+    def test_fitImputerInChunks(self):
+        data = [["13", "", "yes"], ["", "5000", "no"], ["15", "3000", "no"], ["18", "", ""], ["", "800", "yes"]]
+
+        imputer = self.dataCleaner.fitImputerInChunks(iter([data[:2], data[2:4], data[4:]]), self.structure, removeRows=True)
+
+        self.assertEqual(self.dataCleaner.fitImputer(data[:3] + data[4:], self.structure).fillValues, imputer.fillValues)
+
+    def test_cleanChunks(self):
+        imputer = self.dataCleaner.fitImputer(self.dataWithMissingValues, self.structure)
+
+        chunks = list(self.dataCleaner.cleanChunks(iter([self.dataWithMissingValuesAndClass[:2], self.dataWithMissingValuesAndClass[2:]]),
+                                                   self.structure, imputer, removeRows=True))
+
+        self.assertEqual([[["13", "4000.0", "yes"]], [["15.0", "3000", "no"]]], chunks)
+
+    def test_mergeGroupedStatistics(self):
+        self.structure = {"gender": {"index": 0, "values": ["male", "female"]}, "class": {"index": 1, "values": ["no", "yes"]}}
+        parts = [[["male", "no"], ["female", "no"]], [["female", "yes"]], [["male", "no"], ["", "yes"]]]
+        statistics = [self.dataCleaner.calcGroupedStatistics(part, self.structure) for part in parts]
+        copies = [self.dataCleaner.calcGroupedStatistics(part, self.structure) for part in parts]
+
+        left = self.dataCleaner.mergeGroupedStatistics(self.dataCleaner.mergeGroupedStatistics(statistics[0], statistics[1], 2),
+                                                       statistics[2], 3)
+        right = self.dataCleaner.mergeGroupedStatistics(copies[0], self.dataCleaner.mergeGroupedStatistics(copies[1], copies[2], 1), 2)
+
+        self.assertEqual(self.dataCleaner.calcGroupedStatistics(parts[0] + parts[1] + parts[2], self.structure), left)
+        self.assertEqual(left, right)
+
+    def test_pruneCounts(self):
+        counts = {"a": [5, 0], "b": [1, 1], "c": [3, 2], "d": [1, 3]}
+
+        self.assertEqual({"a": [4, 0], "c": [2, 2]}, self.dataCleaner.pruneCounts(counts, 2))
+        self.assertEqual(counts, self.dataCleaner.pruneCounts(counts, 4))
+
+    def test_cleanDataSet_trainingSet(self):
+        dataSet = DataSet(["Age", "Income", "class"])
+        dataSet.appendRows(self.dataWithMissingValuesAndClass)
+
+        indices = self.dataCleaner.cleanDataSet(dataSet, range(3), self.structure)
+
+        self.assertEqual([0, 2], list(indices))
+        self.assertEqual([["13", "3000", "yes"], ["13", "3000", "no"]], dataSet.getRows(indices))
+
+    def test_cleanDataSet_testSet(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.appendRows([["13", "", "yes"], ["18", "", ""], ["", "nurse", "no"], ["12", "teacher", "yes"], ["9", "", "yes"],
+                            ["10", "teacher", "no"], ["11", "nurse", "no"]])
+
+        indices = self.dataCleaner.cleanDataSet(dataSet, range(7), dataSet.getStructure(), removeRows=False)
+
+        self.assertEqual([["13", "teacher", "yes"], ["18", "nurse", ""], ["10.5", "nurse", "no"], ["12", "teacher", "yes"],
+                          ["9", "teacher", "yes"], ["10", "teacher", "no"], ["11", "nurse", "no"]], dataSet.getRows(indices))
+
+    def test_cleanDataSet_inParallel(self):
+        rows = [["13", "", "yes"], ["18", "", ""], ["", "nurse", "no"], ["12", "teacher", "yes"], ["9", "", "yes"], ["", "", "no"]]
+        dataSets = []
+        for spilling in (False, True, False):
+            dataSet = DataSet(["Age", "Job", "class"])
+            if spilling:
+                dataSet.enableSpilling(maxMemory=0)
+            dataSet.appendRows(rows)
+            dataSet.finishSpilling()
+            dataSets += [dataSet]
+
+        indices = self.dataCleaner.cleanDataSet(dataSets[0], range(6), dataSets[0].getStructure(), processes=2)
+        self.dataCleaner.cleanDataSet(dataSets[1], range(6), dataSets[1].getStructure(), processes=2)
+        self.dataCleaner.cleanDataSet(dataSets[2], range(6), dataSets[2].getStructure())
+
+        self.assertIsInstance(dataSets[1].columns[0], memoryview)
+        self.assertEqual(dataSets[2].getRows(indices), dataSets[0].getRows(indices))
+        self.assertEqual(dataSets[2].getRows(indices), dataSets[1].getRows(indices))
+
+    def test_fitDataSetImputer(self):
+        dataSet = DataSet(["Age", "Job", "class"])
+        dataSet.appendRows([["13", "", "yes"], ["18", "", ""], ["", "nurse", "no"], ["12", "teacher", "yes"]])
+
+        imputer = self.dataCleaner.fitDataSetImputer(dataSet, range(4), dataSet.getStructure())
+
+        self.assertEqual(["yes", "no"], imputer.classValues)
+        self.assertEqual({"Age": ["12.5", "14.33", "14.33"], "Job": ["teacher", "nurse", "teacher"]}, imputer.fillValues)
+
     def test_removeRows_dataWithNoCleaningNeeded(self):
         self.dataCleaner.removeRows(self.dataWithNoCleaningNeeded, self.structure)
 
@@ -83,6 +173,22 @@ class TestDataCleaner(unittest.TestCase):
         self.dataCleaner.removeRows(self.dataWithMissingValuesAndClass, self.structure)
         self.assertEqual([["13", "", "yes"], ["", "3000", "no"]], self.dataWithMissingValuesAndClass)
 
+    def test_removeRows_report(self):
+        data = [["13", "", ""], ["18", "5000", "no"], ["13", "", ""], ["", "3000", "no"], ["14", "800", ""]]
+
+        self.assertEqual({"no class value": 3}, self.dataCleaner.removeRows(data, self.structure))
+        self.assertEqual([["18", "5000", "no"], ["", "3000", "no"]], data)
+        self.assertEqual({"no class value": 0}, self.dataCleaner.removeRows(data, self.structure))
+
+    def test_removeDataSetRows(self):
+        dataSet = DataSet(["Age", "Income", "class"])
+        dataSet.appendRows(self.dataWithMissingClass)
+        indices = range(0, 4, 2)
+
+        self.assertEqual([0, 2], list(self.dataCleaner.removeDataSetRows(dataSet, range(4))))
+        self.assertEqual({"no class value": 2}, self.dataCleaner.removedRows)
+        self.assertIs(indices, self.dataCleaner.removeDataSetRows(dataSet, indices))
+
     def test_fillMissingValues_dataWithNoCleaningNeeded(self):
         self.dataCleaner.fillMissingValues(self.dataWithNoCleaningNeeded, self.structure)
 
@@ -221,6 +327,15 @@ class TestDataCleaner(unittest.TestCase):
 
         self.assertEqual(["female", "male"], self.dataCleaner.commonValuesByClass(data, self.structure, 0))
 
+    def test_calcGroupedStatistics(self):
+        self.structure = {"Age": {"index": 0, "values": ["Numeric"]}, "gender": {"index": 1, "values": ["male", "female"]},
+                          "class": {"index": 2, "values": ["no", "yes"]}}
+        data = [["10", "male", "no"], ["", "female", "no"], ["20", "", "yes"], ["30", "male", ""], ["5", "male", "no"]]
+
+        self.assertEqual({0: [[15.0, 2], [20.0, 1], [65.0, 4]],
+                          1: [{"male": [2, 4], "female": [1, 1]}, {}, {"male": [3, 4], "female": [1, 1]}]},
+                         self.dataCleaner.calcGroupedStatistics(data, self.structure))
+
     def test_mostFrequentElement_fullData(self):
         data = ["male", "female", "male", "male", "male", "female"]
 
@@ -231,6 +346,12 @@ class TestDataCleaner(unittest.TestCase):
 
         self.assertEqual("male", self.dataCleaner.mostFrequentElement(data))
 
+    def test_mostFrequentElement_singleCharacterValues(self):
+        data = ["a", "b", "b", "ab", "a", "b"]
+
+        self.assertEqual("b", self.dataCleaner.mostFrequentElement(data))
+        self.assertEqual("", self.dataCleaner.mostFrequentElement([]))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,8 @@
 import unittest
+from math import inf, isnan
+from DataBins import BinEdges
 from DataDiscretization import Discretization
+from DataSet import DataSet
 
 
 class TestDataDiscretization(unittest.TestCase):
@@ -29,9 +32,9 @@ class TestDataDiscretization(unittest.TestCase):
         self.assertEqual([["value<=6.5", "no"], ["value<=6.5", "yes"], ["value>6.5", "no"],
                           ["value>6.5", "yes"], ["value>6.5", "yes"]], self.data)
 
-        self.assertEqual([["F", "Israel", "value<=577.5", "Low"], ["F", "Diaspora", "value>577.5", "Medium"],
-                          ["F", "Israel", "value>577.5", "High"], ["M", "Israel", "value>577.5", "Medium"],
-                          ["M", "Diaspora", "value>577.5", "High"]], self.dataTwo)
+        self.assertEqual([["M", "Diaspora", "value>577.5", "High"], ["M", "Israel", "value>577.5", "Medium"],
+                          ["F", "Israel", "value>577.5", "High"], ["F", "Diaspora", "value>577.5", "Medium"],
+                          ["F", "Israel", "value<=577.5", "Low"]], self.dataTwo)
 
     def test_discretizationData_ByEqualDepth(self):
         self.discretization.discretizationData(self.data, [], self.structure, 2, "Equal Depth")
@@ -40,9 +43,9 @@ class TestDataDiscretization(unittest.TestCase):
         self.assertEqual([["value<=8.0", "no"], ["value<=8.0", "yes"], ["value<=8.0", "no"],
                           ["value>8.0", "yes"], ["value>8.0", "yes"]], self.data)
 
-        self.assertEqual([["F", "Israel", "value<=640.0", "Low"], ["F", "Diaspora", "value<=640.0", "Medium"],
-                          ["F", "Israel", "value<=640.0", "High"], ["M", "Israel", "value>640.0", "Medium"],
-                          ["M", "Diaspora", "value>640.0", "High"]], self.dataTwo)
+        self.assertEqual([["M", "Diaspora", "value>640.0", "High"], ["M", "Israel", "value>640.0", "Medium"],
+                          ["F", "Israel", "value<=640.0", "High"], ["F", "Diaspora", "value<=640.0", "Medium"],
+                          ["F", "Israel", "value<=640.0", "Low"]], self.dataTwo)
 
     def test_discretizationData_ByGini(self):
         self.discretization.discretizationData(self.data, [], self.structure, 2, "Gini index")
@@ -51,9 +54,9 @@ class TestDataDiscretization(unittest.TestCase):
         self.assertEqual([["value<=10.0", "no"], ["value<=10.0", "yes"], ["value<=10.0", "no"],
                           ["value>10.0", "yes"], ["value>10.0", "yes"]], self.data)
 
-        self.assertEqual([["F", "Israel", "value<=577.5", "Low"], ["F", "Diaspora", "value>577.5", "Medium"],
-                          ["F", "Israel", "value>577.5", "High"], ["M", "Israel", "value>577.5", "Medium"],
-                          ["M", "Diaspora", "value>577.5", "High"]], self.dataTwo)
+        self.assertEqual([["M", "Diaspora", "value>577.5", "High"], ["M", "Israel", "value>577.5", "Medium"],
+                          ["F", "Israel", "value>577.5", "High"], ["F", "Diaspora", "value>577.5", "Medium"],
+                          ["F", "Israel", "value<=577.5", "Low"]], self.dataTwo)
 
     def test_discretizationData_ByEqualWidth(self):
         self.discretization.discretizationData(self.data, [], self.structure, 2, "Equal Width")
@@ -62,15 +65,32 @@ class TestDataDiscretization(unittest.TestCase):
         self.assertEqual([["value<=5.5", "no"], ["value<=5.5", "yes"], ["value>5.5", "no"],
                           ["value>5.5", "yes"], ["value>5.5", "yes"]], self.data)
 
-        self.assertEqual([["F", "Israel", "value>80.0", "Low"], ["F", "Diaspora", "value>80.0", "Medium"],
-                          ["F", "Israel", "value>80.0", "High"], ["M", "Israel", "value>80.0", "Medium"],
-                          ["M", "Diaspora", "value>80.0", "High"]], self.dataTwo)
+        self.assertEqual([["M", "Diaspora", "value>80.0", "High"], ["M", "Israel", "value>80.0", "Medium"],
+                          ["F", "Israel", "value>80.0", "High"], ["F", "Diaspora", "value>80.0", "Medium"],
+                          ["F", "Israel", "value>80.0", "Low"]], self.dataTwo)
+
+    def test_discretizationData_middleBins(self):
+        self.discretization.discretizationData(self.data, [["9", "no"]], self.structure, 3, "Equal Width")
+
+        self.assertEqual(["value<=3.667", "3.667<value<=7.334", "value>7.334"], self.structure["Hours"]["values"])
+        self.assertEqual([["3.667<value<=7.334", "no"], ["3.667<value<=7.334", "yes"], ["value>7.334", "no"],
+                          ["value>7.334", "yes"], ["value>7.334", "yes"]], self.data)
+
+    def test_discretizationDataSet(self):
+        dataSet = DataSet(["Gender", "Place", "Test", "class"])
+        dataSet.appendRows(self.dataTwo)
+
+        self.discretization.discretizationDataSet(dataSet, range(5), self.structureTwo, 2, "entropy")
+
+        self.assertEqual(["value<=577.5", "value>577.5"], self.structureTwo["Test"]["values"])
+        self.assertEqual([["M", "Diaspora", "value>577.5", "High"], ["M", "Israel", "value>577.5", "Medium"],
+                          ["F", "Israel", "value>577.5", "High"], ["F", "Diaspora", "value>577.5", "Medium"],
+                          ["F", "Israel", "value<=577.5", "Low"]], dataSet.getRows())
 
     def test_discretizationOFDataByColumn(self):
-        self.discretization.discretizationOFDataByColumn(self.data, 0, {"value<=10.0": lambda x: x <= 10, "value>10.0": lambda x: x > 10})
+        self.discretization.discretizationOFDataByColumn(self.data, 0, BinEdges([10.0], ["value<=10.0", "value>10.0"]))
 
-        self.discretization.discretizationOFDataByColumn(self.dataTwo, 2,
-                                                         {"value<=577.5": lambda x: x <= 577.5, "value>577.5": lambda x: x > 577.5})
+        self.discretization.discretizationOFDataByColumn(self.dataTwo, 2, BinEdges([577.5], ["value<=577.5", "value>577.5"]))
 
         self.assertEqual([["value<=10.0", "no"], ["value<=10.0", "yes"], ["value<=10.0", "no"],
                           ["value>10.0", "yes"], ["value>10.0", "yes"]], self.data)
@@ -79,6 +99,19 @@ class TestDataDiscretization(unittest.TestCase):
                           ["F", "Israel", "value>577.5", "High"], ["F", "Diaspora", "value>577.5", "Medium"],
                           ["F", "Israel", "value<=577.5", "Low"]], self.dataTwo)
 
+    def test_discretizationOFDataByColumn_missingValues(self):
+        data = [["4", "no"], ["", "yes"], ["12", "yes"]]
+
+        self.discretization.discretizationOFDataByColumn(data, 0, BinEdges([10.0], ["value<=10.0", "value>10.0"]))
+
+        self.assertEqual([["value<=10.0", "no"], ["", "yes"], ["value>10.0", "yes"]], data)
+
+    def test_compactData(self):
+        data = [["value<=10.0", "no"], ["value>10.0", "yes"], ["value<=10.0", "no"], ["value<=10.0", "yes"]]
+
+        self.assertEqual([(["value<=10.0", "no"], 2), (["value>10.0", "yes"], 1), (["value<=10.0", "yes"], 1)],
+                         self.discretization.compactData(data))
+
     def test_sortDataByAscendingOrderOFValuesInColumn(self):
         self.data.reverse()
 
@@ -86,6 +119,32 @@ class TestDataDiscretization(unittest.TestCase):
 
         self.assertEqual([["4", "no"], ["5", "yes"], ["8", "no"], ["12", "yes"], ["15", "yes"]], self.data)
 
+    def test_sortDataByAscendingOrderOFValuesInColumn_missingValues(self):
+        data = [["", "no"], ["12", "yes"], ["4", "no"]]
+
+        values = self.discretization.sortDataByAscendingOrderOFValuesInColumn(data, 0)
+
+        self.assertEqual([["4", "no"], ["12", "yes"], ["", "no"]], data)
+        self.assertEqual([4.0, 12.0, inf], list(values))
+
+    def test_argsortDataByValuesInColumn(self):
+        data = [["12", "yes"], ["", "no"], ["4", "no"], ["12", "no"], ["8", "yes"]]
+
+        order, values = self.discretization.argsortDataByValuesInColumn(data, 0)
+
+        self.assertEqual([2, 4, 0, 3], order)
+        self.assertEqual([12.0, 4.0, 12.0, 8.0], [values[position] for position in [0, 2, 3, 4]])
+        self.assertTrue(isnan(values[1]))
+        self.assertEqual([["12", "yes"], ["", "no"], ["4", "no"], ["12", "no"], ["8", "yes"]], data)
+
+    def test_createBins_parsedValues(self):
+        values = self.discretization.sortDataByAscendingOrderOFValuesInColumn(self.data, 0)
+
+        for typeOfDiscretization in ["Equal Width", "Equal Depth", "Entropy", "Gini Index"]:
+            self.assertEqual(list(self.discretization.createBins(self.data, self.structure, 'Hours', 3, typeOfDiscretization).keys()),
+                             list(self.discretization.createBins(self.data, self.structure, 'Hours', 3, typeOfDiscretization,
+                                                                 values=values).keys()))
+
     def test_createBinsByEqualWidth(self):
         bins = self.discretization.createBinsByEqualWidth(self.data, self.structure['Hours']['index'], 2)
         binsTwo = self.discretization.createBinsByEqualWidth(self.data, self.structure['Hours']['index'], 3)
@@ -93,6 +152,12 @@ class TestDataDiscretization(unittest.TestCase):
         self.assertEqual(["value<=5.5", "value>5.5"], list(bins.keys()))
         self.assertEqual(["value<=3.667", "3.667<value<=7.334", "value>7.334"], list(binsTwo.keys()))
 
+    def test_createBinsOfRange(self):
+        bins = self.discretization.createBinsOfRange(4.0, 15.0, 2)
+
+        self.assertEqual(list(self.discretization.createBinsByEqualWidth(self.data, self.structure['Hours']['index'], 2).keys()),
+                         list(bins.keys()))
+
     def test_createBinsByEqualDepth(self):
         bins = self.discretization.createBinsByEqualDepth(self.data, self.structure['Hours']['index'], 2)
         binsTwo = self.discretization.createBinsByEqualDepth(self.data, self.structure['Hours']['index'], 3)
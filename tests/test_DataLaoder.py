@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from DataLoader import Loader
+from DataSampler import Sampler
 
 
 class TestDataLoader(unittest.TestCase):
@@ -17,9 +20,124 @@ class TestDataLoader(unittest.TestCase):
         self.dataWithMissingValues = [["Age", "Income", "class"], ["13", "", "yes"], ["18", "5000", ""],
                                       ["", "3000", "no"]]
 
+    def writeCsvFile(self, lines):
+        csvFile = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        csvFile.write("\n".join(",".join(line) for line in lines) + "\n")
+        csvFile.close()
+        self.addCleanup(os.remove, csvFile.name)
+        return csvFile.name
+
     def test_loadData(self):
-        # need to read from file
-        pass
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances))
+
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Income": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, self.dataLoader.structure)
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"]], self.dataLoader.trainingSet)
+        self.assertEqual([["14", "800", "yes"], ["15", "3000", "no"]], self.dataLoader.testSet)
+
+    def test_loadData_smallChunks(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithMissingValues), 1)
+
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Income": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, self.dataLoader.structure)
+        self.assertEqual([["13", "", "yes"], ["", "3000", "no"], ["18", "5000", ""]], self.dataLoader.trainingSet)
+        self.assertEqual([], self.dataLoader.testSet)
+
+    def test_loadData_inParallel(self):
+        lines = self.dataWithMissingValues + [["x", "7", "yes"], ["12", "9.5", "no"]]
+        csvFilePath = self.writeCsvFile(lines)
+        dataSet = self.dataLoader.parseDataInParallel(csvFilePath, 1, 2, 8)
+
+        self.assertEqual({"Age": {"index": 0, "values": ["13", "18", "x", "12"]}, "Income": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, dataSet.getStructure())
+        self.assertEqual(lines[1:], dataSet.getRows())
+
+    def test_loadData_withMemoryBudget(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances), 1, memoryBudget=4)
+
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Income": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["yes", "no"]}}, self.dataLoader.structure)
+        self.assertEqual([], self.dataLoader.trainingSet)
+        self.assertIsInstance(self.dataLoader.dataSet.columns[0], memoryview)
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"]], self.dataLoader.dataSet.getRows(self.dataLoader.trainingIndices))
+        self.assertEqual([["14", "800", "yes"], ["15", "3000", "no"]], self.dataLoader.dataSet.getRows(self.dataLoader.testIndices))
+
+    def test_loadData_withColumns(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances), columns=["Income"])
+
+        self.assertEqual({"Income": {"index": 0, "values": ["Numeric"]}, "class": {"index": 1, "values": ["yes", "no"]}},
+                         self.dataLoader.structure)
+        self.assertEqual([["1000", "yes"], ["5000", "no"]], self.dataLoader.trainingSet)
+        self.assertRaises(ValueError, self.dataLoader.loadData, self.writeCsvFile(self.dataWithEvenInstances), columns=["Job"])
+        self.assertRaises(ValueError, self.dataLoader.loadData, self.writeCsvFile(self.dataWithEvenInstances), columns=[])
+
+    def test_loadData_withColumnsInParallel(self):
+        dataSet = self.dataLoader.parseDataInParallel(self.writeCsvFile(self.dataWithEvenInstances), 1, 2, 8, columns=["Age"])
+
+        self.assertEqual([["13", "yes"], ["18", "no"], ["15", "no"], ["14", "yes"]], dataSet.getRows())
+
+    def test_loadData_withSampler(self):
+        lines = [["Age", "Income", "class"]] + [[str(age), "1000", "yes" if age % 4 else "no"] for age in range(40)]
+        self.dataLoader.loadData(self.writeCsvFile(lines), 7, sampler=Sampler(size=8, stratified=True, seed=1))
+        rows = self.dataLoader.dataSet.getRows()
+
+        self.assertEqual(8, len(rows))
+        self.assertEqual(2, [row[2] for row in rows].count("no"))
+        self.assertEqual(sorted(rows, key=lambda row: int(row[0])), rows)
+
+    def test_appendRows(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances))
+        self.dataLoader.appendRows([["old", "900", "maybe"], ["16", "", "yes"], ["17", "700", "yes"]])
+
+        self.assertEqual({"Age": {"index": 0, "values": ["13", "18", "15", "14", "old", "16", "17"]},
+                          "Income": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["yes", "no", "maybe"]}}, self.dataLoader.structure)
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"], ["16", "", "yes"], ["old", "900", "maybe"]],
+                         self.dataLoader.trainingSet)
+        self.assertEqual([["14", "800", "yes"], ["15", "3000", "no"], ["17", "700", "yes"]], self.dataLoader.testSet)
+        self.assertEqual([0, 1, 5, 4], list(self.dataLoader.trainingIndices))
+        self.assertEqual([3, 2, 6], list(self.dataLoader.testIndices))
+
+    def test_appendRows_withMemoryBudget(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances), 1, memoryBudget=4)
+        self.dataLoader.appendRows([["old", "900", "no"], ["16", "", "yes"]])
+
+        self.assertIsInstance(self.dataLoader.dataSet.columns[0], memoryview)
+        self.assertIsInstance(self.dataLoader.dataSet.columns[1], memoryview)
+        self.assertEqual(["13", "18", "15", "14", "old", "16"], self.dataLoader.structure["Age"]["values"])
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"], ["16", "", "yes"], ["old", "900", "no"]],
+                         self.dataLoader.dataSet.getRows(self.dataLoader.trainingIndices))
+
+    def test_appendData(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances), memoryBudget=1 << 20)
+        self.dataLoader.appendData(self.writeCsvFile([["Age", "Income", "class"], ["16", "700", "no"]]))
+
+        self.assertEqual([], self.dataLoader.trainingSet)
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"], ["16", "700", "no"]],
+                         self.dataLoader.dataSet.getRows(self.dataLoader.trainingIndices))
+        self.assertRaises(ValueError, self.dataLoader.appendData, self.writeCsvFile([["Income", "Age", "class"], ["16", "700", "no"]]))
+
+    def test_loadData_withoutLines(self):
+        self.dataLoader.loadData(self.writeCsvFile(self.dataWithEvenInstances), createLines=False)
+
+        self.assertEqual([], self.dataLoader.trainingSet)
+        self.assertEqual([], self.dataLoader.testSet)
+        self.assertEqual([["13", "1000", "yes"], ["18", "5000", "no"]], self.dataLoader.dataSet.getRows(self.dataLoader.trainingIndices))
+
+    def test_getByteRanges(self):
+        csvFilePath = self.writeCsvFile(self.dataWithEvenInstances)
+        with open(csvFilePath, 'rb') as dataFile:
+            dataFile.readline()
+            ranges = self.dataLoader.getByteRanges(dataFile, dataFile.tell(), os.path.getsize(csvFilePath), 1, 10)
+            lines = []
+            for start, end in ranges:
+                dataFile.seek(start)
+                lines += dataFile.read(end - start).decode().splitlines()
+
+        self.assertEqual(["13,1000,yes", "18,5000,no", "15,3000,no", "14,800,yes"], lines)
+
+    def test_loadData_emptyFile(self):
+        self.assertRaises(EnvironmentError, self.dataLoader.loadData, self.writeCsvFile([]))
 
     def test_buildStructure_dataWithEvenInstances(self):
         self.dataLoader.buildStructure(self.dataWithEvenInstances)
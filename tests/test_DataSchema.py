@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from DataLoader import Loader
+from DataSchema import Schema
+
+
+class TestDataSchema(unittest.TestCase):
+    folderPath = None
+    schema = None
+
+    def setUp(self):
+        self.folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folderPath)
+        self.schema = Schema({"Age": ["Numeric"], "Job": ["teacher", "student"], "y": ["no", "yes"]}, "y")
+
+    def writeFile(self, name, text):
+        path = os.path.join(self.folderPath, name)
+        with open(path, "w") as dataFile:
+            dataFile.write(text)
+        return path
+
+    def test_readSchemaFile(self):
+        schema = Schema().readSchemaFile(self.writeFile("schema.json", json.dumps({"class": "y", "columns": self.schema.columns})))
+
+        self.assertEqual(self.schema.columns, schema.columns)
+        self.assertEqual("y", schema.className)
+
+    def test_readSchemaFile_noClassColumn(self):
+        schemaFilePath = self.writeFile("schema.json", json.dumps({"columns": self.schema.columns}))
+
+        self.assertRaises(ValueError, Schema().readSchemaFile, schemaFilePath)
+
+    def test_createDataSet(self):
+        dataSet = self.schema.createDataSet(["Job", "Age", "y"])
+
+        self.assertEqual({"Job": {"index": 0, "values": ["teacher", "student"]}, "Age": {"index": 1, "values": ["Numeric"]},
+                          "class": {"index": 2, "values": ["no", "yes"]}}, dataSet.getStructure())
+
+    def test_createDataSet_columnsDoNotMatch(self):
+        self.assertRaises(ValueError, self.schema.createDataSet, ["Job", "Income", "y"])
+
+    def test_loadData_withSchema(self):
+        loader = Loader()
+
+        loader.loadData(self.writeFile("data.csv", "Age,Job,y\n13,student,yes\n18,,no\n,teacher,no\n"), schema=self.schema)
+
+        self.assertEqual({"Age": {"index": 0, "values": ["Numeric"]}, "Job": {"index": 1, "values": ["teacher", "student"]},
+                          "class": {"index": 2, "values": ["no", "yes"]}}, loader.structure)
+        self.assertEqual([["18", "", "no"], ["13", "student", "yes"]], loader.trainingSet)
+        self.assertEqual([["", "teacher", "no"]], loader.testSet)
+
+    def test_loadData_valueNotInSchema(self):
+        csvFilePath = self.writeFile("data.csv", "Age,Job,y\n13,nurse,yes\n")
+
+        self.assertRaises(ValueError, Loader().loadData, csvFilePath, schema=self.schema)
+
+    def test_loadData_notNumericValue(self):
+        csvFilePath = self.writeFile("data.csv", "Age,Job,y\nold,student,yes\n")
+
+        self.assertRaises(ValueError, Loader().loadData, csvFilePath, schema=self.schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from DataSplitter import Splitter
+
+
+class TestDataSplitter(unittest.TestCase):
+    splitter = None
+    classColumn = []
+
+    def setUp(self):
+        self.splitter = Splitter()
+        self.classColumn = ["yes", "no", "no", "yes", "", "no", "yes", "maybe"]
+
+    def test_groupByClass(self):
+        groups = self.splitter.groupByClass(self.classColumn, ["no", "yes", ""])
+
+        self.assertEqual([[1, 2, 5], [0, 3, 6], [4]], [list(group) for group in groups])
+
+    def test_groupByClass_withSeed(self):
+        groups = self.splitter.groupByClass(self.classColumn, ["no", "yes", ""], 3)
+
+        self.assertEqual([[1, 2, 5], [0, 3, 6], [4]], [sorted(group) for group in groups])
+        self.assertEqual([list(group) for group in groups],
+                         [list(group) for group in self.splitter.groupByClass(self.classColumn, ["no", "yes", ""], 3)])
+
+    def test_split(self):
+        trainingIndices, testIndices = self.splitter.split(self.classColumn, ["no", "yes", ""])
+
+        self.assertEqual([1, 2, 0, 3, 4], list(trainingIndices))
+        self.assertEqual([5, 6], list(testIndices))
+
+    def test_split_withRatio(self):
+        trainingIndices, testIndices = Splitter(0.5).split(self.classColumn, ["no", "yes"])
+
+        self.assertEqual([1, 2, 0, 3], list(trainingIndices))
+        self.assertEqual([5, 6], list(testIndices))
+
+    def test_kFolds(self):
+        folds = list(self.splitter.kFolds(self.classColumn, ["no", "yes"], 3))
+
+        self.assertEqual([[1, 0], [2, 3], [5, 6]], [list(testIndices) for _, testIndices in folds])
+        self.assertEqual([[2, 3, 5, 6], [1, 0, 5, 6], [1, 0, 2, 3]], [list(trainingIndices) for trainingIndices, _ in folds])
+
+    def test_repeatedHoldout(self):
+        splits = list(Splitter(seed=1).repeatedHoldout(self.classColumn, ["no", "yes"], 2))
+
+        self.assertEqual(2, len(splits))
+        for trainingIndices, testIndices in splits:
+            self.assertEqual([0, 1, 2, 3, 5, 6], sorted(list(trainingIndices) + list(testIndices)))
+            self.assertEqual(4, len(trainingIndices))
+
+
+if __name__ == '__main__':
+    unittest.main()
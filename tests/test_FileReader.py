@@ -0,0 +1,77 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+from DataLoader import Loader
+from FileReader import ReadFile, BackgroundReader
+
+
+class TestFileReader(unittest.TestCase):
+    fileReader = None
+    folderPath = None
+    text = "Age,Job,class\n13,student,yes\n18,,no\n15,teacher,no\n"
+
+    def setUp(self):
+        self.fileReader = ReadFile()
+        self.folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folderPath)
+
+    def writeFile(self, name, openFunc):
+        path = os.path.join(self.folderPath, name)
+        with openFunc(path, "wt") as dataFile:
+            dataFile.write(self.text)
+        return path
+
+    def test_getCompression(self):
+        self.assertIsNone(self.fileReader.getCompression(self.writeFile("data.csv", open)))
+        self.assertEqual(gzip.GzipFile, self.fileReader.getCompression(self.writeFile("data.gz", gzip.open)))
+        self.assertEqual(bz2.BZ2File, self.fileReader.getCompression(self.writeFile("data.bz2", bz2.open)))
+        self.assertEqual(lzma.LZMAFile, self.fileReader.getCompression(self.writeFile("data.xz", lzma.open)))
+
+    def test_openTextFile(self):
+        for name, openFunc in [("data.csv", open), ("data.csv.gz", gzip.open), ("data.csv.bz2", bz2.open), ("data.csv.xz", lzma.open)]:
+            with self.fileReader.openTextFile(self.writeFile(name, openFunc)) as dataFile:
+                self.assertEqual(self.text, dataFile.read())
+
+    def test_backgroundReader_smallBlocks(self):
+        with open(self.writeFile("data.csv", open), "rb") as source:
+            reader = BackgroundReader(source, 5, 2)
+            self.assertEqual(self.text.encode(), reader.read())
+            reader.close()
+
+    def test_backgroundReader_closeBeforeEnd(self):
+        with open(self.writeFile("data.csv", open), "rb") as source:
+            reader = BackgroundReader(source, 1, 1)
+            reader.read(3)
+            reader.close()
+
+            self.assertFalse(reader.thread.is_alive())
+
+    def test_backgroundReader_errorOnEveryRead(self):
+        path = self.writeFile("data.csv.gz", gzip.open)
+        with open(path, "rb") as dataFile:
+            data = dataFile.read()
+        with open(path, "wb") as dataFile:
+            dataFile.write(data[:-10])
+        reader = BackgroundReader(gzip.GzipFile(path, "rb"), 5, 2)
+
+        self.assertRaises(EOFError, reader.read)
+        self.assertRaises(EOFError, reader.readinto, bytearray(5))
+        reader.close()
+
+    def test_loadData_compressedFile(self):
+        loader, compressedLoader = Loader(), Loader()
+
+        loader.loadData(self.writeFile("data.csv", open))
+        compressedLoader.loadData(self.writeFile("data.csv.gz", gzip.open), processes=2)
+
+        self.assertEqual(loader.structure, compressedLoader.structure)
+        self.assertEqual(loader.trainingSet, compressedLoader.trainingSet)
+        self.assertEqual(loader.testSet, compressedLoader.testSet)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,6 +66,77 @@ class TestMiningCalculations(unittest.TestCase):
         self.assertEqual([10, 6.5, 13.5, 4.5],
                          self.calculator.getBestSplitsInDataByInfoGain(self.dataOne, self.structureOne, "Hours", 5))
 
+    def test_splitsOfParsedValues(self):
+        values = self.calculator.parseColumn(self.dataOne, 0)
+
+        self.assertEqual([4.0, 5.0, 8.0, 12.0, 15.0], list(values))
+        self.assertEqual(self.calculator.getBestSplitsInDataByInfoGain(self.dataOne, self.structureOne, "Hours", 5),
+                         self.calculator.getBestSplitsInDataByInfoGain(self.dataOne, self.structureOne, "Hours", 5, values))
+        self.assertEqual(self.calculator.getListWithBestValueSplitsOfDataByGini(self.dataOne, self.structureOne, 0, 3),
+                         self.calculator.getListWithBestValueSplitsOfDataByGini(self.dataOne, self.structureOne, 0, 3, values))
+
+    def test_splitsOfClassCodes(self):
+        values, classCodes = self.calculator.parseColumn(self.dataOne, 0), self.calculator.getClassCodesOfRows(self.dataOne, self.structureOne)
+
+        self.assertEqual([0, 1, 0, 1, 1], list(classCodes))
+        self.assertEqual(self.calculator.getBestSplitsInDataByInfoGain(self.dataOne, self.structureOne, "Hours", 5),
+                         self.calculator.getBestSplitsInDataByInfoGain(None, self.structureOne, "Hours", 5, values, classCodes))
+        self.assertEqual(self.calculator.getListWithBestValueSplitsOfDataByGini(self.dataOne, self.structureOne, 0, 3),
+                         self.calculator.getListWithBestValueSplitsOfDataByGini(None, self.structureOne, 0, 3, values, classCodes))
+
+    def test_sweepSplitsByCounts(self):
+        data = [["8", "no"], ["4", "no"], ["12", "yes"], ["8", "yes"], ["15", "yes"], ["4", ""]]
+        values = self.calculator.parseColumn(data, 0)
+        dataEntropy = self.calculator.calcDataEntropy(data, self.structureOne)
+
+        splits = list(self.calculator.sweepSplitsByCounts(data, self.structureOne, values,
+                                                          lambda *counts: self.calculator.calcInfoGainOfSplitCounts(dataEntropy, *counts)))
+
+        self.assertEqual([(split, self.calculator.calcInfoGainBySplitValue(data, self.structureOne, "Hours", split))
+                          for split in [6.0, 8.0, 10.0, 11.5, 9.5]], splits)
+
+    def test_findBestSplitInDataByInfoGain_equalValues(self):
+        data = [["4", "no"], ["4", "no"], ["8", "yes"], ["8", "no"], ["8", "yes"], ["12", "yes"]]
+
+        self.assertEqual([6.0, 0.459], self.calculator.findBestSplitInDataByInfoGain(data, self.structureOne, "Hours"))
+
+    def test_splitByValue(self):
+        values = self.calculator.parseColumn(self.dataOne, 0)
+
+        bellow, above = self.calculator.splitByValue(self.dataOne, values, 6.5)
+        unsortedBellow, unsortedAbove = self.calculator.splitByValue(self.dataOne[::-1], values[::-1], 6.5)
+
+        self.assertEqual(([["4", "no"], ["5", "yes"]], [4.0, 5.0]), (bellow[0], list(bellow[1])))
+        self.assertEqual(([["8", "no"], ["12", "yes"], ["15", "yes"]], [8.0, 12.0, 15.0]), (above[0], list(above[1])))
+        self.assertEqual(([["5", "yes"], ["4", "no"]], [5.0, 4.0]), (unsortedBellow[0], list(unsortedBellow[1])))
+        self.assertEqual(([["15", "yes"], ["12", "yes"], ["8", "no"]], [15.0, 12.0, 8.0]), (unsortedAbove[0], list(unsortedAbove[1])))
+
+    def test_calcByCounts(self):
+        valueCounts, classCounts = [[0, 1, 1], [1, 1, 1]], [1, 2, 2]
+
+        self.assertEqual(self.calculator.calcDataEntropy(self.dataTwo, self.structureTwo), self.calculator.calcEntropyOfCounts(classCounts, 5))
+        self.assertEqual(self.calculator.calcInfoGainByColumnSplit(self.dataTwo, self.structureTwo, "Gender"),
+                         self.calculator.calcInfoGainOfCounts(valueCounts, classCounts, 5))
+        self.assertEqual(self.calculator.calcGiniSplitByColumn(self.dataTwo, self.structureTwo, "Gender"),
+                         self.calculator.calcGiniSplitOfCounts(valueCounts, 5))
+        self.assertEqual(self.calculator.calcGainRatioSplitByColumn(self.dataTwo, self.structureTwo, "Gender"),
+                         self.calculator.calcGainRatioOfCounts(valueCounts, classCounts, 5))
+        self.assertEqual("High", self.calculator.mostCommonClassAttributeOfCounts([1, 2, 2], self.structureTwo))
+
+    def test_calcWithMissingValues(self):
+        valueCounts, classCounts = [[0, 1, 1], [1, 1, 1]], [1, 2, 2]
+
+        self.assertEqual(self.calculator.calcInfoGainOfCounts(valueCounts, classCounts, 5),
+                         self.calculator.calcInfoGainWithMissingValues(valueCounts, classCounts, 5))
+        self.assertEqual(round(0.5 * self.calculator.calcInfoGainOfCounts(valueCounts, classCounts, 5), 3),
+                         self.calculator.calcInfoGainWithMissingValues(valueCounts, [2, 4, 4], 10))
+        self.assertEqual(round(0.5 * self.calculator.calcGainRatioOfCounts(valueCounts, classCounts, 5), 3),
+                         self.calculator.calcGainRatioWithMissingValues(valueCounts, [2, 4, 4], 10))
+        self.assertEqual(0.02, self.calculator.calcGiniGainWithMissingValues(valueCounts, [2, 4, 4], 10))
+        self.assertEqual(0, self.calculator.calcInfoGainWithMissingValues([[0, 0, 0], [0, 0, 0]], classCounts, 5))
+        self.assertEqual("Place", self.calculator.findBestColumnSplitByGiniWithMissingValues({"Gender": valueCounts, "Place": [[0, 2, 0], [1, 0, 2]]},
+                                                                                              classCounts, 5))
+
     def test_gini(self):
         self.assertEqual(0.48, self.calculator.calcDataGini(self.dataOne, self.structureOne))
 
@@ -78,6 +149,16 @@ class TestMiningCalculations(unittest.TestCase):
     def test_findBestValueSplitByGini(self):
         self.assertEqual([10, 0.266], self.calculator.findBestValueSplitByGini(self.dataOne, self.structureOne, 0))
 
+    def test_findBestValueSplitByGini_equalValues(self):
+        data = [["8", "no"], ["4", "no"], ["12", "yes"], ["8", "yes"], ["15", "yes"], ["4", ""]]
+        values = self.calculator.parseColumn(data, 0)
+
+        splits = list(self.calculator.sweepSplitsByCounts(data, self.structureOne, values, self.calculator.calcGiniSplitOfSplitCounts))
+
+        self.assertEqual([(split, self.calculator.calcGiniSplitBySplitValue(data, self.structureOne, 0, split))
+                          for split in [6.0, 8.0, 10.0, 11.5, 9.5]], splits)
+        self.assertEqual([9.5, 0.459], self.calculator.findBestValueSplitByGini(data, self.structureOne, 0))
+
     def test_fillListWithDataValueSplitsByGini(self):
         splitsList = {}
         self.calculator.fillDictWithBestValueSplitsOfDataByGini(self.dataOne, self.structureOne, 0, 2, splitsList, 0)
@@ -142,11 +223,43 @@ class TestMiningCalculations(unittest.TestCase):
 
         self.assertEqual(0.286, answer)
 
+    def test_calcProbabilityOfValGivenClassWithLaplaceCorrection_missingValues(self):
+        data = [["M", "High"], ["", "High"], ["F", "Low"], ["", "Low"]]
+
+        self.assertEqual(0.5, self.calculator.calcProbabilityOfValGivenClassWithLaplaceCorrection(data, 0, "M", "High", 2))
+
     def test_calcProbabilityOfClassValueWithLaplaceCorrection(self):
         answer = self.calculator.calcProbabilityOfClassValueWithLaplaceCorrection(self.dataTwo, "High", 3)
 
         self.assertEqual(0.375, answer)
 
+    def test_calcCountsOfWeightedRows(self):
+        classCounts, countsByColumn = self.calculator.calcCountsOfWeightedRows([(row, 2) for row in self.dataTwo], self.structureTwo)
+
+        self.assertEqual([2, 4, 4], classCounts)
+        self.assertEqual([[0, 2, 2], [2, 2, 2]], countsByColumn["Gender"])
+        self.assertEqual([[2, 2, 0], [0, 2, 2], [0, 0, 2]], countsByColumn["Test"])
+
+    def test_calcProbabilitiesOfWeightedRows(self):
+        probabilities = self.calculator.calcProbabilitiesOfWeightedRows([(self.dataTwo[0], 2)] + [(row, 1) for row in self.dataTwo[1:]], 0,
+                                                                       ["M", "F"], ["Low", "Medium", "High"])
+
+        self.assertEqual(self.calculator.calcProbabilityOfValGivenClassWithLaplaceCorrection([self.dataTwo[0]] + self.dataTwo, 0, "M",
+                                                                                             "High", 2), probabilities[("M", "High")])
+        self.assertEqual(0.125, probabilities[("M", "Low")])
+
+    def test_calcProbabilitiesOfCounts(self):
+        probabilities = self.calculator.calcProbabilitiesOfCounts([[0, 2, 1], [1, 0, 1]], 5, 5)
+
+        self.assertEqual(self.calculator.calcProbabilityOfValGivenClassWithLaplaceCorrection(self.dataTwo, 0, "M", "High", 2),
+                         probabilities[0][2])
+        self.assertEqual([0.143, 0.429, 0.286], probabilities[0])
+        self.assertEqual([[0, 0, 0], [0, 0, 0]], self.calculator.calcProbabilitiesOfCounts([[0, 0, 0], [0, 0, 0]], 0, 0))
+
+    def test_calcProbabilityOfClassValueOfCounts(self):
+        self.assertEqual(self.calculator.calcProbabilityOfClassValueWithLaplaceCorrection(self.dataTwo, "High", 3),
+                         self.calculator.calcProbabilityOfClassValueOfCounts(2, 5, 3))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from DataLoader import Loader
+from ProcessController import BuildClassifierProcess, TransformDataProcess
+
+
+class Label:
+    def __init__(self):
+        self.text = ""
+
+    def configure(self, text):
+        self.text = text
+
+    def cget(self, key):
+        return self.text
+
+
+class TestProcessController(unittest.TestCase):
+    folderPath = None
+    csvFilePath = None
+    text = "Age,Job,class\n13,student,yes\n18,,no\n15,teacher,no\n30,teacher,yes\n,student,no\n41,clerk,yes\n" \
+           "22,student,no\n35,,yes\n27,clerk,no\n19,student,yes\n50,teacher,no\n,clerk,yes\n"
+
+    def setUp(self):
+        self.folderPath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folderPath)
+        self.csvFilePath = self.writeCsvFile("data.csv", self.text)
+        os.mkdir(os.path.join(self.folderPath, "model"))
+        os.mkdir(os.path.join(self.folderPath, "new"))
+
+    def writeCsvFile(self, name, text):
+        path = os.path.join(self.folderPath, name)
+        with open(path, "w") as csvFile:
+            csvFile.write(text)
+        return path
+
+    def readCsvFile(self, path):
+        with open(path, newline='') as csvFile:
+            return list(csv.reader(csvFile))
+
+    def buildClassifier(self, keepMissingValues=False, cleaningProcesses=None, savingFolderName="model"):
+        label = Label()
+        BuildClassifierProcess().setFolderPath(self.csvFilePath).setClassifierType("ID3").setClassifierSplitType("Info Gain")\
+            .setDiscretizationType("Equal Width").setDiscretizationBins(2).setKeepMissingValues(keepMissingValues)\
+            .setCleaningProcesses(cleaningProcesses).setSavingFolderPath(os.path.join(self.folderPath, savingFolderName)).startProcess(label)
+        self.assertIn("Classifier build successfully", label.text)
+
+    def test_startProcess_cleaningProcesses(self):
+        os.mkdir(os.path.join(self.folderPath, "parallel"))
+        self.buildClassifier()
+        self.buildClassifier(cleaningProcesses=2, savingFolderName="parallel")
+
+        for name in sorted(os.listdir(os.path.join(self.folderPath, "model"))):
+            with open(os.path.join(self.folderPath, "model", name)) as file, open(os.path.join(self.folderPath, "parallel", name)) as parallelFile:
+                self.assertEqual(file.read(), parallelFile.read())
+
+    def transformData(self, pathOfFile):
+        label = Label()
+        TransformDataProcess().setFolderPath(pathOfFile).setModelFolderPath(os.path.join(self.folderPath, "model"))\
+            .setSavingFolderPath(os.path.join(self.folderPath, "new")).startProcess(label)
+        return label.text
+
+    def test_transformData_asTestSet(self):
+        self.buildClassifier()
+        loader = Loader()
+        loader.loadData(self.csvFilePath)
+        newFilePath = self.writeCsvFile("new.csv", "Age,Job,class\n" + "".join(",".join(row) + "\n" for row in loader.testSet))
+
+        self.assertIn("Data transformed successfully", self.transformData(newFilePath))
+        self.assertEqual(self.readCsvFile(os.path.join(self.folderPath, "model", "Discretization Test set.csv")),
+                         self.readCsvFile(os.path.join(self.folderPath, "new", "Transformed Data set.csv")))
+
+    def test_transformData_newRows(self):
+        self.buildClassifier()
+
+        self.transformData(self.writeCsvFile("new.csv", "Age,Job,class\n1,,yes\n,student,\n100,clerk,no\n"))
+        rows = self.readCsvFile(os.path.join(self.folderPath, "new", "Transformed Data set.csv"))
+
+        self.assertEqual(["Age", "Job", "class"], rows[0])
+        self.assertEqual(["value<=14.0", "value>14.0"], [rows[1][0], rows[3][0]])
+        self.assertNotIn("", rows[1][:2] + rows[2][:2])
+        self.assertEqual("", rows[2][2])
+
+    def test_transformData_withoutImputer(self):
+        self.buildClassifier(keepMissingValues=True)
+
+        self.assertFalse(os.path.exists(os.path.join(self.folderPath, "model", "Imputer.json")))
+        self.transformData(self.writeCsvFile("new.csv", "Age,Job,class\n,student,yes\n40,,no\n"))
+
+        self.assertEqual([["Age", "Job", "class"], ["", "student", "yes"], ["value>14.0", "", "no"]],
+                         self.readCsvFile(os.path.join(self.folderPath, "new", "Transformed Data set.csv")))
+
+    def test_transformData_invalidFile(self):
+        self.buildClassifier()
+
+        self.assertIn("An Error occurred", self.transformData(self.writeCsvFile("new.csv", "Age,Job\n13,student\n")))
+        self.assertIn("An Error occurred", self.transformData(self.writeCsvFile("new.csv", "Age,Job,class\nold,student,yes\n")))
+        self.assertIn("Problem with file", self.transformData(os.path.join(self.folderPath, "missing.csv")))
+
+
+if __name__ == '__main__':
+    unittest.main()